@@ -1,5 +1,5 @@
+import json
 import os
-import shutil
 from flask import Flask, redirect, url_for
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
@@ -42,6 +42,15 @@ def create_app():
     # ✅ 서명 폴더 추가 (Render 재시작해도 유지)
     app.config["SIGNATURES_FOLDER"] = os.path.join(STORAGE_ROOT, "signatures")
 
+    # ✅ 휴가계 일괄 생성 워커 수
+    app.config["VACATION_FORM_WORKERS"] = int(os.environ.get("VACATION_FORM_WORKERS", "4"))
+
+    # ✅ 휴가계 기준 폼 파일명(FORMS_FOLDER 안) + 셀 위치
+    # - 저장소에는 휴가계 폼이 없음 → 운영 폼을 올리고 셀 위치를 JSON 으로 맞춤
+    #   예) VACATION_FORM_CELLS='{"name": "G3", "leave_start_row": 9}'
+    app.config["VACATION_FORM_TEMPLATE"] = os.environ.get("VACATION_FORM_TEMPLATE", "vacation_form.xlsx")
+    app.config["VACATION_FORM_CELLS"] = json.loads(os.environ.get("VACATION_FORM_CELLS") or "{}")
+
     for key in ["UPLOAD_FOLDER", "FORMS_FOLDER", "EXCEL_OUTPUT", "HOLIDAY_CACHE_DIR", "SIGNATURES_FOLDER"]:
         os.makedirs(app.config[key], exist_ok=True)
 
@@ -53,17 +62,81 @@ def create_app():
         "gaja_yonsei_hospital_secure_key_2025"
     )
     
+    # ✅ 비밀번호 해시 설정 (cost 는 scripts/bench_login.py 로 측정 후 조정)
+    app.config["PASSWORD_HASH_METHOD"] = os.environ.get("PASSWORD_HASH_METHOD", "scrypt")
+    app.config["PASSWORD_SCRYPT_N"] = int(os.environ.get("PASSWORD_SCRYPT_N", str(2 ** 14)))
+    app.config["PASSWORD_PBKDF2_ITERATIONS"] = int(os.environ.get("PASSWORD_PBKDF2_ITERATIONS", "260000"))
+
+    # ✅ 로그인 시도 제한 (token bucket: 버스트 / 분당 회복량)
+    #    IP 버킷은 실패한 시도만 차감 - 직원 전체가 병원 NAT 공인 IP 하나를 공유한다고 가정
+    #    (성공 로그인은 IP 한도에 영향 없음, IP 한도 = 그 IP 전체의 비밀번호 실패 허용량)
+    app.config["LOGIN_THROTTLE_ENABLED"] = os.environ.get("LOGIN_THROTTLE_ENABLED", "1") == "1"
+    app.config["LOGIN_THROTTLE_USER_BURST"] = int(os.environ.get("LOGIN_THROTTLE_USER_BURST", "10"))
+    app.config["LOGIN_THROTTLE_USER_PER_MIN"] = float(os.environ.get("LOGIN_THROTTLE_USER_PER_MIN", "5"))
+    app.config["LOGIN_THROTTLE_IP_BURST"] = int(os.environ.get("LOGIN_THROTTLE_IP_BURST", "60"))
+    app.config["LOGIN_THROTTLE_IP_PER_MIN"] = float(os.environ.get("LOGIN_THROTTLE_IP_PER_MIN", "30"))
+    # Render 는 프록시 1단 뒤 → X-Forwarded-For 마지막 값이 실제 클라이언트
+    app.config["LOGIN_THROTTLE_PROXY_HOPS"] = int(
+        os.environ.get("LOGIN_THROTTLE_PROXY_HOPS", "1" if os.environ.get("RENDER") else "0")
+    )
+
+    # ✅ create_app 안에서 부팅 작업(create_all / master / forms 복사) 실행 여부
+    #    gunicorn.conf.py / flask init 으로 따로 돌릴 때는 0
+    app.config["BOOT_ON_STARTUP"] = os.environ.get("BOOT_ON_STARTUP", "1") == "1"
+
+    # ✅ 로그인 사용자 권한 필드 캐시 유지 시간(초), 0 이면 매 요청 DB 조회
+    app.config["USER_CACHE_TTL"] = int(os.environ.get("USER_CACHE_TTL", "30"))
+
+    # ✅ 요청 프로파일링 (opt-in) - 요청별 시간/SQL 수, 느린 요청 로그, /profiling/stats
+    app.config["PROFILING_ENABLED"] = os.environ.get("PROFILING_ENABLED", "0") == "1"
+    app.config["PROFILING_SLOW_MS"] = float(os.environ.get("PROFILING_SLOW_MS", "500"))
+    app.config["PROFILING_WINDOW"] = int(os.environ.get("PROFILING_WINDOW", "500"))       # endpoint 별 최근 N건
+    app.config["PROFILING_TOP_QUERIES"] = int(os.environ.get("PROFILING_TOP_QUERIES", "5"))
+
+    # ✅ Prometheus /metrics (opt-in) - 워커별 파일(METRICS_DIR)을 합산해서 응답
+    app.config["METRICS_ENABLED"] = os.environ.get("METRICS_ENABLED", "0") == "1"
+    app.config["METRICS_DIR"] = os.environ.get("METRICS_DIR", os.path.join(STORAGE_ROOT, "metrics"))
+    app.config["METRICS_FLUSH_SEC"] = float(os.environ.get("METRICS_FLUSH_SEC", "5"))
+    app.config["METRICS_TOKEN"] = os.environ.get("METRICS_TOKEN", "")
+
     app.config["HOLIDAY_API_KEY"] = os.environ.get("HOLIDAY_API_KEY", "")
+    app.config["HOLIDAY_API_URL"] = os.environ.get("HOLIDAY_API_URL", "")
+    # API 실패 시 고정 양력 fallback 결과 유지 시간(초)
+    app.config["HOLIDAY_FALLBACK_TTL"] = int(os.environ.get("HOLIDAY_FALLBACK_TTL", "3600"))
+    # 오프라인 계산(lunar.py) 결과를 백그라운드로 API 와 대조 (API 키가 있을 때만)
+    app.config["HOLIDAY_API_VERIFY"] = os.environ.get("HOLIDAY_API_VERIFY", "1") == "1"
+    # 시작 시 작년~내후년 공휴일 백그라운드 미리 채우기
+    app.config["HOLIDAY_PREFETCH"] = os.environ.get("HOLIDAY_PREFETCH", "1") == "1"
 
     if os.path.exists("/var/data"):
         DB_PATH = "/var/data/database.db"
     else:
         DB_PATH = os.path.join(STORAGE_ROOT, "database.db")
 
-    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{DB_PATH}"
+    # ✅ DATABASE_URL 이 있으면 그 DB (예: postgresql+psycopg2://user:pw@host/db, 드라이버 설치 필요)
+    from app.db_tuning import database_uri, engine_options, masked_uri
+    app.config["SQLALCHEMY_DATABASE_URI"] = database_uri(os.environ.get("DATABASE_URL"), DB_PATH)
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
-    print("✅ 현재 사용하는 DB 파일:", DB_PATH)
+    # ✅ 커넥션 풀 (pool_size/max_overflow/pool_timeout 은 PostgreSQL 등 서버 DB 에만 적용)
+    app.config["DB_POOL_SIZE"] = int(os.environ.get("DB_POOL_SIZE", "5"))
+    app.config["DB_MAX_OVERFLOW"] = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+    app.config["DB_POOL_TIMEOUT"] = int(os.environ.get("DB_POOL_TIMEOUT", "30"))
+    app.config["DB_POOL_RECYCLE"] = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+    app.config["DB_POOL_PRE_PING"] = os.environ.get("DB_POOL_PRE_PING", "1") == "1"
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(app.config["SQLALCHEMY_DATABASE_URI"], app.config)
+    if app.config["METRICS_ENABLED"]:
+        from app.metrics.middleware import TimedQueuePool
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"]["poolclass"] = TimedQueuePool
+
+    # ✅ SQLite 동시성 튜닝 (app/db_tuning.py) - 워커 여러 개일 때 "database is locked" 방지
+    app.config["SQLITE_WAL"] = os.environ.get("SQLITE_WAL", "1") == "1"
+    app.config["SQLITE_BUSY_TIMEOUT_MS"] = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    app.config["SQLITE_SYNCHRONOUS"] = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL")
+    app.config["SQLITE_MMAP_SIZE"] = int(os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    app.config["SQLITE_CACHE_SIZE"] = int(os.environ.get("SQLITE_CACHE_SIZE", "-20000"))
+
+    print("✅ 현재 사용하는 DB:", masked_uri(app.config["SQLALCHEMY_DATABASE_URI"]))
 
     # =============================
     # DB & Login 초기화
@@ -75,7 +148,7 @@ def create_app():
     # =============================
     # 모델 import
     # =============================
-    from app.models import User, init_master
+    from app.models import User
     from app.calendar_page.routes import calendar_api_bp
 
     # =============================
@@ -101,6 +174,26 @@ def create_app():
     for bp in bp_list:
         app.register_blueprint(bp)
 
+    # =============================
+    # 요청 프로파일링 (PROFILING_ENABLED=1 일 때만)
+    # =============================
+    if app.config["PROFILING_ENABLED"]:
+        from app.profiling.middleware import init_profiling
+        init_profiling(app)
+
+    # =============================
+    # Prometheus /metrics (METRICS_ENABLED=1 일 때만)
+    # =============================
+    if app.config["METRICS_ENABLED"]:
+        from app.metrics.middleware import init_metrics
+        init_metrics(app)
+
+    # =============================
+    # CLI 명령 등록 (flask build-roster 등)
+    # =============================
+    from app.commands import register_commands
+    register_commands(app)
+
     # =============================
     # Root → 로그인페이지 리다이렉트
     # =============================
@@ -109,29 +202,27 @@ def create_app():
         return redirect(url_for("auth.login"))
 
     # =============================
-    # DB 생성 + master 계정
+    # SQLite 튜닝 (연결마다 PRAGMA - DB 접속 없이 훅만 등록)
     # =============================
     with app.app_context():
-        db.create_all()
-        init_master()
+        from app.db_tuning import install_sqlite_tuning
+        install_sqlite_tuning(db.engine, app.config)
 
     # =============================
-    # 폴더 자동 복사 기능
+    # 1회성 부팅 작업 (create_all + master + forms 복사) - app/boot.py
+    # - 운영(gunicorn): gunicorn.conf.py 가 master 프로세스에서 flask init 1번 실행 → 워커는 import 만
+    # - 로컬(python run.py): BOOT_ON_STARTUP 기본값 1 → 여기서 바로 실행
     # =============================
-    def ensure_persistent_dirs():
-        base = app.config["STORAGE_ROOT"]
-
-        src_forms = os.path.join(BASE_DIR, "..", "forms")
-        dst_forms = os.path.join(base, "forms")
-
-        if os.path.exists(src_forms):
-            for filename in os.listdir(src_forms):
-                src_file = os.path.join(src_forms, filename)
-                dst_file = os.path.join(dst_forms, filename)
-                if not os.path.exists(dst_file):
-                    shutil.copy(src_file, dst_file)
-                    print(f"📄 복사됨: {src_file} → {dst_file}")
+    if app.config["BOOT_ON_STARTUP"]:
+        from app.boot import run_boot
+        run_boot(app)
 
-    ensure_persistent_dirs()
+    # =============================
+    # 공휴일 캐시 메모리 적재
+    # =============================
+    from app.calendar_page import holidays
+    holidays.preload(app)
+    if app.config["HOLIDAY_PREFETCH"]:
+        holidays.start_prefetch(app)
 
     return app
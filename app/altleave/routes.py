@@ -1,12 +1,282 @@
 # app/altleave/routes.py
-from flask import Blueprint, render_template, request, redirect, url_for, flash
+import math
+import re
+import time
+
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
 from datetime import datetime
+from sqlalchemy import and_, func, insert, or_, update
 from app import db
-from app.models import User, AltLeaveLog
+from app.models import User, AltLeaveLog, AltLeaveGrant
+from app.user_cache import current_epoch
 
 altleave_bp = Blueprint("altleave", __name__, url_prefix="/altleave")
 
+# 이력 한 페이지 건수
+LOG_PAGE_SIZE = 20
+
+# 부서별 직원 선택 목록 캐시 (워커 프로세스별)
+ROSTER_CACHE_TTL = 60  # 초
+_roster_cache = {}
+
+
+# ==========================
+# 부서별 직원 목록 (캐시)
+# ==========================
+def roster_by_dept():
+    """
+    {부서: [{"id", "name"}, ...]} - 직원 수정/삭제/권한 변경 시(user_cache epoch 변경) 또는 TTL 후 재조회
+    """
+    now = time.monotonic()
+    epoch = current_epoch()
+    hit = _roster_cache.get("roster")
+    if hit and hit[0] == epoch and now - hit[1] < ROSTER_CACHE_TTL:
+        return hit[2]
+
+    rows = (
+        db.session.query(User.id, User.name, User.department)
+        .filter(User.is_superadmin == False)
+        .order_by(User.department, User.name)
+        .all()
+    )
+    users_by_dept = {}
+    for uid, name, dept in rows:
+        users_by_dept.setdefault(dept or "기타", []).append({"id": uid, "name": name})
+
+    _roster_cache["roster"] = (epoch, now, users_by_dept)
+    return users_by_dept
+
+
+def clear_roster_cache():
+    _roster_cache.clear()
+
+
+# ==========================
+# 이력 keyset 페이지
+# ==========================
+def _parse_cursor(cursor: str):
+    """"YYYY-MM-DDTHH:MM:SS.ffffff|id" → (datetime, id), 형식 오류면 None"""
+    try:
+        ts, log_id = (cursor or "").split("|", 1)
+        return datetime.fromisoformat(ts), int(log_id)
+    except ValueError:
+        return None
+
+
+def log_page(cursor=None, page_size: int = LOG_PAGE_SIZE):
+    """
+    (grant_date desc, id desc) 순서로 cursor 다음 page_size 건
+    반환: (logs, next_cursor | None)
+    """
+    q = AltLeaveLog.query
+    key = _parse_cursor(cursor)
+    if key:
+        ts, log_id = key
+        q = q.filter(or_(
+            AltLeaveLog.grant_date < ts,
+            and_(AltLeaveLog.grant_date == ts, AltLeaveLog.id < log_id),
+        ))
+
+    rows = (
+        q.order_by(AltLeaveLog.grant_date.desc(), AltLeaveLog.id.desc())
+        .limit(page_size + 1)
+        .all()
+    )
+    logs = rows[:page_size]
+    next_cursor = None
+    if len(rows) > page_size and logs:
+        last = logs[-1]
+        next_cursor = f"{last.grant_date.isoformat()}|{last.id}"
+    return logs, next_cursor
+
+
+def dept_summary_totals():
+    """
+    SQL 집계
+    - 부서별 부여 합계: 이력 전체의 직원별 부여 기록(AltLeaveGrant) 합, 부여 당시 부서 기준
+      (예전 이력은 boot/migration 에서 department_summary 로 백필 → 도입 이전 부여도 포함)
+    - 부서별 인원 / 잔여: 현재 직원 기준 (User.alt_leave 합계)
+    - 전체 이력: 부여 건수 / 건당 일수 합계 / 직원별 부여 일수 합계
+    """
+    dept_rows = (
+        db.session.query(
+            User.department,
+            func.count(User.id),
+            func.coalesce(func.sum(User.alt_leave), 0),
+        )
+        .filter(User.is_superadmin == False)
+        .group_by(User.department)
+        .all()
+    )
+    granted = dict(
+        db.session.query(AltLeaveGrant.department, func.sum(AltLeaveGrant.add_days))
+        .group_by(AltLeaveGrant.department)
+        .all()
+    )
+    log_count, log_days = db.session.query(
+        func.count(AltLeaveLog.id),
+        func.coalesce(func.sum(AltLeaveLog.add_days), 0),
+    ).one()
+
+    current = {dept: (cnt, total) for dept, cnt, total in dept_rows}
+    # 지금은 직원이 없는 부서도 부여 이력이 있으면 표시
+    departments = sorted(set(current) | set(granted), key=lambda d: d or "기타")
+    return {
+        "departments": [
+            {
+                "department": dept or "기타",
+                "headcount": current.get(dept, (0, 0))[0],
+                "alt_leave": float(current.get(dept, (0, 0))[1]),
+                "granted": float(granted.get(dept) or 0),
+            }
+            for dept in departments
+        ],
+        "log_count": log_count,
+        "log_days": float(log_days),
+        "granted_days": float(sum(v or 0 for v in granted.values())),
+    }
+
+
+# ==========================
+# 일괄 부여 (set 기반)
+# ==========================
+def bulk_grant(user_ids, add_days: float, apply_date, reason: str, granted_by: str,
+               departments=None) -> dict:
+    """
+    ✅ 선택 직원(user_ids) 또는 부서 전체(departments)에 대체연차 부여 (한 트랜잭션)
+    1) 대상자 (id, 이름, 부서) 1회 조회 → 이력 요약 문자열
+    2) UPDATE user SET alt_leave = alt_leave + :days WHERE id IN (...)
+    3) 지급 이력 1건 + 직원별 부여 기록 executemany
+    반환: {"users": 부여 인원, "records": 기록 건수, "days": 총 부여 일수, "log_id": 이력 id}
+    """
+    empty = {"users": 0, "records": 0, "days": 0.0, "log_id": None}
+    ids = sorted({int(x) for x in (user_ids or [])})
+    if not ids and not departments:
+        return empty
+
+    q = db.session.query(User.id, User.name, User.department).filter(User.is_superadmin == False)
+    if ids:
+        q = q.filter(User.id.in_(ids))
+    else:
+        q = q.filter(User.department.in_(list(departments)))
+
+    try:
+        targets = q.order_by(User.department, User.name).all()
+        if not targets:
+            return empty
+
+        # 부서별 이름 요약 만들기
+        dept_map = {}
+        for _, name, dept in targets:
+            dept_map.setdefault(dept or "기타", []).append(name)
+        dept_summary = ", ".join(
+            [f"{dept}({', '.join(names)})" for dept, names in dept_map.items()]
+        )
+
+        # 1) alt_leave 증가 - 단일 UPDATE
+        target_ids = [uid for uid, _, _ in targets]
+        result = db.session.execute(
+            update(User)
+            .where(User.id.in_(target_ids))
+            .values(alt_leave=func.coalesce(User.alt_leave, 0) + add_days)
+            .execution_options(synchronize_session=False)
+        )
+
+        # 2) 로그는 지급건 1건만 생성
+        log = AltLeaveLog(
+            apply_date=apply_date,
+            reason=reason,
+            add_days=add_days,
+            granted_by=granted_by,
+            department_summary=dept_summary,
+        )
+        db.session.add(log)
+        db.session.flush()
+
+        # 3) 직원별 부여 기록 - executemany
+        records = [
+            {"log_id": log.id, "user_id": uid, "department": dept,
+             "add_days": add_days, "apply_date": apply_date}
+            for uid, _, dept in targets
+        ]
+        db.session.execute(insert(AltLeaveGrant), records)
+        log_id = log.id
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return {
+        "users": result.rowcount,
+        "records": len(records),
+        "days": add_days * result.rowcount,
+        "log_id": log_id,
+    }
+
+
+# ==========================
+# 기존 이력 → 직원별 부여 기록 백필 (1회성)
+# ==========================
+# department_summary 형식: "부서A(이름1, 이름2), 부서B(이름3)"  (부여 당시 부서 / 이름)
+_SUMMARY_RE = re.compile(r"\s*([^(),]+?)\(([^()]*)\)")
+
+
+def parse_department_summary(summary: str) -> list:
+    """✅ "부서A(이름1, 이름2), ..." → [(부서, [이름, ...]), ...]  ("기타" 는 부서 없음)"""
+    result = []
+    for m in _SUMMARY_RE.finditer(summary or ""):
+        names = [n.strip() for n in m.group(2).split(",") if n.strip()]
+        if names:
+            dept = m.group(1).strip()
+            result.append((None if dept == "기타" else dept, names))
+    return result
+
+
+def backfill_grants_from_logs(keep_unknown_users: bool = True) -> int:
+    """
+    ✅ AltLeaveGrant 가 없는 예전 AltLeaveLog → department_summary 를 파싱해서 직원별 부여 기록 생성
+    - 부서는 요약문의 부여 당시 부서, user_id 는 (부서, 이름) → 이름 순으로 현재 직원에서 찾음
+      (못 찾으면 user_id NULL - 퇴사/삭제 직원도 부서별 부여 합계에는 포함,
+       keep_unknown_users=False 면 건너뜀 - user_id 가 NOT NULL 로 만들어진 예전 테이블용)
+    - 기록이 이미 있는 이력은 건너뜀 → 여러 번 실행해도 같은 결과
+    반환: 생성한 기록 수 (commit 은 호출하는 쪽)
+    """
+    has_grant = db.session.query(AltLeaveGrant.id).filter(AltLeaveGrant.log_id == AltLeaveLog.id).exists()
+    logs = (
+        db.session.query(AltLeaveLog.id, AltLeaveLog.add_days, AltLeaveLog.apply_date,
+                         AltLeaveLog.department_summary)
+        .filter(~has_grant)
+        .order_by(AltLeaveLog.id)
+        .all()
+    )
+    if not logs:
+        return 0
+
+    by_dept_name, by_name = {}, {}
+    for uid, name, dept in db.session.query(User.id, User.name, User.department).order_by(User.id):
+        if name:
+            by_dept_name.setdefault((dept, name), uid)
+            by_name.setdefault(name, uid)
+
+    records = []
+    for log_id, add_days, apply_date, summary in logs:
+        for dept, names in parse_department_summary(summary):
+            for name in names:
+                uid = by_dept_name.get((dept, name), by_name.get(name))
+                if uid is None and not keep_unknown_users:
+                    continue
+                records.append({
+                    "log_id": log_id,
+                    "user_id": uid,
+                    "department": dept,
+                    "add_days": add_days,
+                    "apply_date": apply_date,
+                })
+    if records:
+        db.session.execute(insert(AltLeaveGrant), records)
+    return len(records)
+
 
 # ==========================
 # 대체연차 부여 페이지
@@ -20,18 +290,6 @@ def grant_alt_leave():
         flash("이 기능은 총관리자만 사용할 수 있습니다.", "error")
         return redirect(url_for("employee.employee_list"))
 
-    # 부서별 직원 정렬
-    users = (
-        User.query.filter(User.is_superadmin == False)
-        .order_by(User.department, User.name)
-        .all()
-    )
-
-    users_by_dept = {}
-    for u in users:
-        dept = u.department or "기타"
-        users_by_dept.setdefault(dept, []).append(u)
-
     # ------------------------
     # POST : 대체연차 부여
     # ------------------------
@@ -56,46 +314,101 @@ def grant_alt_leave():
             flash("직원과 일수를 올바르게 입력하세요.", "error")
             return redirect(url_for("altleave.grant_alt_leave"))
 
-        # 대상자 불러오기
-        selected_users = User.query.filter(User.id.in_(user_ids)).all()
-
-        # 부서별 이름 요약 만들기
-        dept_map = {}
-        for user in selected_users:
-            dept_map.setdefault(user.department or "기타", []).append(user.name)
-
-        dept_summary = ", ".join(
-            [f"{dept}({', '.join(names)})" for dept, names in dept_map.items()]
-        )
-
-        # 1) 각 사용자에게 alt_leave 부여
-        for u in selected_users:
-            u.alt_leave = (u.alt_leave or 0) + add_days
-
-        # 2) 로그는 지급건 1건만 생성
-        log = AltLeaveLog(
-            apply_date=apply_date,
-            reason=reason,
-            add_days=add_days,
-            granted_by=current_user.name,
-            department_summary=dept_summary
-        )
-        db.session.add(log)
-        db.session.commit()
+        result = bulk_grant(user_ids, add_days, apply_date, reason, current_user.name)
 
-        flash(f"{len(selected_users)}명에게 대체연차 {add_days}일을 부여했습니다.", "success")
+        flash(f"{result['users']}명에게 대체연차 {add_days}일을 부여했습니다.", "success")
         return redirect(url_for("altleave.grant_alt_leave"))
 
     # ------------------------
-    # GET: 페이지 렌더링
+    # GET: 페이지 렌더링 (이력은 keyset 페이지 단위)
     # ------------------------
-    logs = AltLeaveLog.query.order_by(AltLeaveLog.grant_date.desc()).all()
+    cursor = request.args.get("cursor")
+    logs, next_cursor = log_page(cursor)
 
     return render_template(
         "grant_alt_leave.html",
-        users_by_dept=users_by_dept,
+        users_by_dept=roster_by_dept(),
         logs=logs,
+        next_cursor=next_cursor,
+        is_next_page=bool(cursor),
+        summary=dept_summary_totals(),
+    )
+
+
+# ==========================
+# 일괄 부여 API 입력 검증
+# ==========================
+MAX_GRANT_DAYS = 365
+
+
+def _parse_bulk_payload(data: dict):
+    """
+    ✅ JSON 입력 → ((user_ids, departments, add_days, apply_date, reason), None)
+       잘못된 입력 → (None, 오류 메시지)  (UPDATE 전에 전부 검사)
+    - user_ids    : 정수 목록 (생략 가능)
+    - departments : 비어 있지 않은 문자열 목록 (생략 가능, 문자열 하나는 안 됨)
+    - add_days    : 0 < 일수 <= MAX_GRANT_DAYS 인 숫자
+    - apply_date  : "YYYY-MM-DD"
+    """
+    user_ids = data.get("user_ids") or []
+    if not isinstance(user_ids, list) or not all(
+        (isinstance(x, int) and not isinstance(x, bool)) or (isinstance(x, str) and x.isdigit())
+        for x in user_ids
+    ):
+        return None, "user_ids 는 직원 id(정수) 목록이어야 합니다."
+    user_ids = [int(x) for x in user_ids]
+
+    departments = data.get("departments") or []
+    if not isinstance(departments, list) or not all(
+        isinstance(d, str) and d.strip() for d in departments
+    ):
+        return None, "departments 는 부서명(문자열) 목록이어야 합니다."
+    departments = [d.strip() for d in departments]
+
+    if not (user_ids or departments):
+        return None, "직원 또는 부서를 선택하세요."
+
+    add_days = data.get("add_days")
+    if isinstance(add_days, bool) or not isinstance(add_days, (int, float, str)):
+        return None, "일수를 올바르게 입력하세요."
+    try:
+        add_days = float(add_days)
+    except ValueError:
+        return None, "일수를 올바르게 입력하세요."
+    if not math.isfinite(add_days) or not 0 < add_days <= MAX_GRANT_DAYS:
+        return None, f"일수는 0보다 크고 {MAX_GRANT_DAYS} 이하여야 합니다."
+
+    apply_date = data.get("apply_date")
+    try:
+        apply_date = datetime.strptime(apply_date, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None, "적용일자를 YYYY-MM-DD 형식으로 입력하세요."
+
+    reason = data.get("reason") or ""
+    if not isinstance(reason, str):
+        return None, "사유는 문자열이어야 합니다."
+
+    return (user_ids, departments, add_days, apply_date, reason.strip()), None
+
+# ==========================
+@altleave_bp.route("/bulk", methods=["POST"])
+@login_required
+def bulk_grant_api():
+    if not current_user.is_superadmin:
+        return jsonify({"status": "error", "message": "총관리자만 부여할 수 있습니다."}), 403
+
+    data = request.get_json(silent=True)
+    parsed, error = _parse_bulk_payload(data if isinstance(data, dict) else {})
+    if error:
+        return jsonify({"status": "error", "message": error}), 400
+    user_ids, departments, add_days, apply_date, reason = parsed
+
+    result = bulk_grant(
+        user_ids, add_days, apply_date, reason, current_user.name, departments=departments,
     )
+    return jsonify({"status": "success", **result})
+
+
 # ==========================
 # 대체연차 이력 삭제
 # ==========================
@@ -110,7 +423,8 @@ def delete_log(log_id):
 
     log = AltLeaveLog.query.get_or_404(log_id)
 
-    # 삭제
+    # 삭제 (직원별 부여 기록 포함)
+    AltLeaveGrant.query.filter_by(log_id=log.id).delete(synchronize_session=False)
     db.session.delete(log)
     db.session.commit()
 
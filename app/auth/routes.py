@@ -12,8 +12,11 @@ from flask_login import (
     login_required,
     logout_user,
 )
+from app import db
 from app.auth import auth_bp
+from app.auth import throttle
 from app.models import User
+from app.passwords import dummy_verify, needs_rehash
 
 
 # =====================
@@ -29,10 +32,32 @@ def login():
         selected_dept = request.form.get("department", "").strip()
         remember = request.form.get("remember_id")
 
+        # ✅ 시도 제한 (아이디 / IP token bucket) → 초과 시 User 조회 없이 바로 거절
+        ip = throttle.client_ip()
+        allowed, retry_after = throttle.try_acquire(username, ip)
+        if not allowed:
+            error = f"로그인 시도가 너무 많습니다. {retry_after}초 후 다시 시도해주세요."
+            saved_username = request.cookies.get("saved_username", "")
+            resp = make_response(
+                render_template("login.html", error=error, saved_username=saved_username), 429
+            )
+            resp.headers["Retry-After"] = str(retry_after)
+            return resp
+
         user = User.query.filter_by(username=username).first()
 
-        # ✅ 사용자 검증
-        if user and user.password == password:
+        # ✅ 사용자 검증 (해시 비교, 없는 아이디도 같은 비용으로 계산)
+        verified = user.check_password(password) if user else False
+        if not user:
+            dummy_verify(password)
+
+        if verified:
+            # ✅ 평문/이전 cost 로 저장된 비밀번호는 현재 설정으로 다시 해시
+            if needs_rehash(user.password):
+                user.set_password(password)
+                db.session.commit()
+
+            throttle.record_success(username, ip)
 
             # ✅ 세션 초기화 (이전 로그인 흔적 완전 제거)
             session.clear()
@@ -0,0 +1,155 @@
+# app/auth/throttle.py
+"""
+로그인 시도 제한 (token bucket)
+
+- 버킷 키: "user:<아이디>" / "ip:<접속 IP>" → 둘 다 토큰이 있어야 시도 가능
+  · 시도 1회마다 토큰 1개 소모, 시간이 지나면 분당 refill 만큼 다시 채워짐
+  · 로그인 성공 시 아이디 버킷은 초기화 + IP 버킷은 소모한 토큰 1개를 돌려줌
+    → IP 버킷은 실패한 시도만 차감 (직원 전체가 병원 NAT 공인 IP 하나로 접속 →
+      출근 시간 정상 로그인이 몰려도 IP 가 막히지 않음)
+- 저장소: STORAGE_ROOT/login_throttle.db (stdlib sqlite3, 메인 DB 와 분리)
+  → gunicorn 워커끼리 공유, 거절 경로는 이 작은 DB 만 보고 User 테이블은 조회하지 않음
+- 설정 (config)
+  · LOGIN_THROTTLE_ENABLED
+  · LOGIN_THROTTLE_USER_BURST / LOGIN_THROTTLE_USER_PER_MIN
+  · LOGIN_THROTTLE_IP_BURST   / LOGIN_THROTTLE_IP_PER_MIN
+  · LOGIN_THROTTLE_PROXY_HOPS : 프록시 뒤(Render 등)면 X-Forwarded-For 에서 클라이언트 IP 사용
+"""
+import os
+import random
+import sqlite3
+import time
+
+from flask import current_app, request
+
+# 오래 안 쓰인 버킷 정리 (초) / 정리 확률
+STALE_AFTER = 24 * 60 * 60
+PRUNE_PROBABILITY = 0.01
+
+_initialized = set()
+
+
+def _db_path() -> str:
+    return current_app.config.get("LOGIN_THROTTLE_DB") or os.path.join(
+        current_app.config["STORAGE_ROOT"], "login_throttle.db"
+    )
+
+
+def _connect():
+    path = _db_path()
+    conn = sqlite3.connect(path, timeout=5, isolation_level=None)
+    if path not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS login_buckets ("
+            " key TEXT PRIMARY KEY,"
+            " tokens REAL NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        _initialized.add(path)
+    return conn
+
+
+def client_ip() -> str:
+    """프록시 홉 수만큼 X-Forwarded-For 뒤에서부터 클라이언트 IP 선택"""
+    hops = int(current_app.config.get("LOGIN_THROTTLE_PROXY_HOPS", 0))
+    if hops > 0:
+        forwarded = [p.strip() for p in request.headers.get("X-Forwarded-For", "").split(",") if p.strip()]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return request.remote_addr or "unknown"
+
+
+def _limits():
+    cfg = current_app.config
+    return {
+        "user": (float(cfg.get("LOGIN_THROTTLE_USER_BURST", 10)),
+                 float(cfg.get("LOGIN_THROTTLE_USER_PER_MIN", 5)) / 60),
+        "ip": (float(cfg.get("LOGIN_THROTTLE_IP_BURST", 60)),
+               float(cfg.get("LOGIN_THROTTLE_IP_PER_MIN", 30)) / 60),
+    }
+
+
+def bucket_keys(username: str, ip: str):
+    return [("user", f"user:{(username or '').strip().lower()}"), ("ip", f"ip:{ip}")]
+
+
+def try_acquire(username: str, ip: str):
+    """
+    ✅ 시도 1회 허용 여부 (허용이면 토큰 소모)
+    반환: (허용 여부, 재시도까지 남은 초)
+    """
+    if not current_app.config.get("LOGIN_THROTTLE_ENABLED", True):
+        return True, 0
+
+    limits = _limits()
+    keys = bucket_keys(username, ip)
+    now = time.time()
+
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        rows = dict(
+            (k, (t, u)) for k, t, u in conn.execute(
+                "SELECT key, tokens, updated_at FROM login_buckets WHERE key IN (?, ?)",
+                [k for _, k in keys],
+            )
+        )
+
+        levels, retry_after = {}, 0.0
+        for kind, key in keys:
+            capacity, rate = limits[kind]
+            tokens, updated = rows.get(key, (capacity, now))
+            tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+            levels[key] = tokens
+            if tokens < 1:
+                retry_after = max(retry_after, (1 - tokens) / rate if rate > 0 else STALE_AFTER)
+
+        if retry_after:
+            conn.execute("ROLLBACK")
+            return False, int(retry_after) + 1
+
+        conn.executemany(
+            "INSERT INTO login_buckets (key, tokens, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+            [(key, levels[key] - 1, now) for _, key in keys],
+        )
+        if random.random() < PRUNE_PROBABILITY:
+            conn.execute("DELETE FROM login_buckets WHERE updated_at < ?", (now - STALE_AFTER,))
+        conn.execute("COMMIT")
+        return True, 0
+    except sqlite3.Error as e:
+        # 제한 저장소 문제로 로그인 자체가 막히지 않도록 허용
+        current_app.logger.warning("Login throttle store error: %s", e)
+        try:
+            conn.execute("ROLLBACK")
+        except sqlite3.Error:
+            pass
+        return True, 0
+    finally:
+        conn.close()
+
+
+def record_success(username: str, ip: str):
+    """로그인 성공 → 아이디 버킷 초기화 + IP 버킷 토큰 1개 반환 (IP 는 실패만 차감)"""
+    if not current_app.config.get("LOGIN_THROTTLE_ENABLED", True):
+        return
+    (_, user_key), (_, ip_key) = bucket_keys(username, ip)
+    ip_capacity = _limits()["ip"][0]
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM login_buckets WHERE key = ?", (user_key,))
+        conn.execute(
+            "UPDATE login_buckets SET tokens = MIN(?, tokens + 1) WHERE key = ?",
+            (ip_capacity, ip_key),
+        )
+        conn.execute("COMMIT")
+    except sqlite3.Error as e:
+        current_app.logger.warning("Login throttle store error: %s", e)
+        try:
+            conn.execute("ROLLBACK")
+        except sqlite3.Error:
+            pass
+    finally:
+        conn.close()
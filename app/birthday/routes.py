@@ -1,12 +1,32 @@
+import io
+
 from flask import (
     render_template,
     request,
+    jsonify,
+    send_file,
 )
 from flask_login import login_required
 from datetime import datetime, date
+from sqlalchemy import func
+from app import db
 from app.birthday import birthday_bp
+from app.birthday.utils import (
+    HOSPITAL_AMOUNT,
+    display_label,
+    get_doy_index,
+    join_date_of,
+    next_birthday,
+    parse_ymd,
+    payout_amounts,
+    upcoming_birthdays,
+    yearly_payouts,
+)
 from app.models import User
 
+# 다가오는 생일 조회 최대 일수
+UPCOMING_MAX_DAYS = 366
+
 
 # ====================================================
 # 🎂 생일자 조회 페이지
@@ -23,90 +43,48 @@ def birthday_report():
     today = date.today()
 
     # --------------------------------------------------
-    # 1) 생일자 목록 조회 (선택한 월만)
+    # 1) 선택한 월 생일자만 조회 (birth_month 인덱스) → 목록/축하금 한 번에 계산
     # --------------------------------------------------
+    users = (
+        User.query.filter(User.birth_month == month)
+        .order_by(User.birth_day, User.id)
+        .all()
+    )
+
     results = []
-    users = User.query.all()
+    birthday_members = []   # 병원 축하금(31일↑)
+    union_members = []      # 상조회 축하금(6개월/3년↑)
 
     for u in users:
-        if not u.birthday:
-            continue
-
-        try:
-            bday = datetime.strptime(u.birthday, "%Y-%m-%d").date()
-        except:
-            continue
-
-        # 선택한 월만 표시
-        if bday.month != month:
+        bday = parse_ymd(u.birthday)
+        if not bday:
             continue
 
         # 한국식 나이 계산
-        try:
-            age = today.year - bday.year + 1
-        except:
-            age = "-"
-
         results.append({
             "name": u.name or u.username,
             "birthday": u.birthday,
-            "day": bday.day,
-            "age": age,
+            "day": u.birth_day,
+            "age": today.year - bday.year + 1,
             "department": u.department,
         })
 
-    # 날짜 정렬
-    results.sort(key=lambda x: x["day"])
-
-    # --------------------------------------------------
-    # 2) 병원/상조회 축하금 계산 (선택한 월만)
-    # --------------------------------------------------
-    birthday_members = []   # 병원 축하금(31일↑)
-    union_members = []      # 상조회 축하금(6개월/3년↑)
-
-    for u in users:
-        if not u.birthday or not u.join_date:
-            continue
-
-        # 날짜 변환
-        try:
-            bday = datetime.strptime(u.birthday, "%Y-%m-%d").date()
-            join = datetime.strptime(u.join_date, "%Y-%m-%d").date()
-        except:
-            continue
-
-        # 선택한 월 생일자만 계산
-        if bday.month != month:
-            continue
-
-        # 올해 기준 생일 날짜
-        this_year_bday = bday.replace(year=today.year)
-        if this_year_bday < today:
-            this_year_bday = this_year_bday.replace(year=today.year + 1)
-
-        # 입사일부터 생일까지의 기간
-        days_until_birthday = (this_year_bday - join).days
-
-        # 표기용 이름
-        display_name = u.name or u.username or "이름없음"
-        dept = u.department or "미지정"
-        full_name = f"({dept}){display_name}"
+        # 올해 기준 다가오는 생일까지의 근속기간으로 축하금 판정
+        hospital, union = payout_amounts(
+            join_date_of(u), next_birthday(u.birth_month, u.birth_day, today)
+        )
+        full_name = display_label(u)
 
         # 🏥 병원 생일축하금: 31일 이상 근무자
-        if days_until_birthday >= 31:
+        if hospital:
             birthday_members.append(full_name)
 
         # ❤️ 상조회 축하금: 180일/1095일 기준
-        if days_until_birthday >= 180:
-            if days_until_birthday < 1095:
-                amount = 50000
-            else:
-                amount = 70000
-
-            union_members.append((full_name, amount))
+        if union:
+            union_members.append((full_name, union))
 
     # 총액 계산 (해당 월 생일자만)
-    hospital_total = len(birthday_members) * 30000
+    hospital_total = len(birthday_members) * HOSPITAL_AMOUNT
     union_total = sum(amount for _, amount in union_members)
 
     # --------------------------------------------------
@@ -121,3 +99,98 @@ def birthday_report():
         union_members=union_members,
         union_total=union_total,
     )
+
+
+# ====================================================
+# 💰 연간 생일축하금 집계 (월별 / 부서별)
+# ====================================================
+def _payout_rollup(year: int) -> dict:
+    # 생일이 등록된 직원만 한 번에 조회 → 12개월 집계
+    users = User.query.filter(User.birth_month.isnot(None)).all()
+    return yearly_payouts(users, year)
+
+
+@birthday_bp.route("/api/payouts", methods=["GET"])
+@login_required
+def birthday_payouts():
+    year = request.args.get("year", type=int) or date.today().year
+    return jsonify(_payout_rollup(year))
+
+
+@birthday_bp.route("/payouts.xlsx", methods=["GET"])
+@login_required
+def birthday_payouts_xlsx():
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+
+    year = request.args.get("year", type=int) or date.today().year
+    data = _payout_rollup(year)
+
+    wb = Workbook()
+    bold = Font(bold=True)
+
+    # 1) 월별 합계
+    ws = wb.active
+    ws.title = "월별"
+    ws.append(["월", "병원 인원", "병원 금액", "상조회 인원", "상조회 금액"])
+    for r in data["months"]:
+        ws.append([f"{r['month']}월", r["hospital_count"], r["hospital_total"],
+                   r["union_count"], r["union_total"]])
+    ws.append(["합계",
+               sum(r["hospital_count"] for r in data["months"]), data["hospital_total"],
+               sum(r["union_count"] for r in data["months"]), data["union_total"]])
+
+    # 2) 월 × 부서
+    ws_dept = wb.create_sheet("부서별")
+    ws_dept.append(["월", "부서", "병원 인원", "병원 금액", "상조회 인원", "상조회 금액"])
+    for r in data["departments"]:
+        ws_dept.append([f"{r['month']}월", r["department"], r["hospital_count"],
+                        r["hospital_total"], r["union_count"], r["union_total"]])
+
+    # 3) 대상자 명단
+    ws_members = wb.create_sheet("대상자")
+    ws_members.append(["생일", "부서", "이름", "병원", "상조회"])
+    for m in data["members"]:
+        ws_members.append([m["date"], m["department"], m["name"], m["hospital"], m["union"]])
+
+    for sheet in (ws, ws_dept, ws_members):
+        for cell in sheet[1]:
+            cell.font = bold
+    for cell in ws[ws.max_row]:
+        cell.font = bold
+
+    output = io.BytesIO()
+    wb.save(output)
+    output.seek(0)
+
+    resp = send_file(output, as_attachment=True, download_name=f"생일축하금_{year}.xlsx")
+    resp.headers["Cache-Control"] = "no-store, max-age=0"
+    return resp
+
+
+# ====================================================
+# 📅 다가오는 생일 (N일 이내)
+# ====================================================
+@birthday_bp.route("/api/upcoming", methods=["GET"])
+@login_required
+def birthday_upcoming():
+    days = request.args.get("days", 30, type=int)
+    days = max(0, min(days, UPCOMING_MAX_DAYS))
+
+    # 인덱스 재구성 여부 판단용 시그니처 (birth_month/day 인덱스만 읽음)
+    signature = tuple(db.session.query(
+        func.count(User.id),
+        func.max(User.id),
+        func.sum(User.birth_month * 100 + User.birth_day),
+    ).filter(User.birth_month.isnot(None)).one())
+
+    index = get_doy_index(
+        signature,
+        lambda: User.query.filter(User.birth_month.isnot(None)).all(),
+    )
+    today = date.today()
+    return jsonify({
+        "today": today.isoformat(),
+        "days": days,
+        "items": upcoming_birthdays(index, today, days),
+    })
@@ -0,0 +1,218 @@
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, date, timedelta
+
+
+# ================================================================
+#  생일 축하금 기준
+# ================================================================
+HOSPITAL_AMOUNT = 30000        # 병원장님 생일축하금 (1인)
+HOSPITAL_MIN_DAYS = 31         # 입사 31일 이상
+
+UNION_MIN_DAYS = 180           # 상조회: 6개월 이상
+UNION_SENIOR_DAYS = 1095       # 3년 이상이면 상향
+UNION_AMOUNT = 50000
+UNION_SENIOR_AMOUNT = 70000
+
+
+def parse_ymd(s):
+    """'YYYY-MM-DD' 문자열 → date (형식 오류면 None)"""
+    try:
+        return datetime.strptime((s or "").strip(), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def join_date_of(u):
+    """join_date_date 우선, 없으면 join_date 문자열 파싱"""
+    return u.join_date_date or parse_ymd(u.join_date)
+
+
+def birthday_in_year(month: int, day: int, year: int) -> date:
+    """해당 연도의 생일 날짜 (2/29 생일은 평년엔 2/28)"""
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return date(year, month, 28)
+
+
+def next_birthday(month: int, day: int, today: date) -> date:
+    """오늘 기준 다가오는 생일 (오늘 포함)"""
+    bday = birthday_in_year(month, day, today.year)
+    if bday < today:
+        bday = birthday_in_year(month, day, today.year + 1)
+    return bday
+
+
+def payout_amounts(join: date, bday: date):
+    """
+    생일 날짜 기준 축하금 (병원, 상조회)
+    - 입사일 ~ 생일 까지 근속일수로 판정, 대상 아니면 0
+    """
+    if not join:
+        return 0, 0
+
+    days = (bday - join).days
+    hospital = HOSPITAL_AMOUNT if days >= HOSPITAL_MIN_DAYS else 0
+
+    if days >= UNION_SENIOR_DAYS:
+        union = UNION_SENIOR_AMOUNT
+    elif days >= UNION_MIN_DAYS:
+        union = UNION_AMOUNT
+    else:
+        union = 0
+    return hospital, union
+
+
+def display_label(u) -> str:
+    """(부서)이름 표기"""
+    display_name = u.name or u.username or "이름없음"
+    dept = u.department or "미지정"
+    return f"({dept}){display_name}"
+
+
+# ================================================================
+#  연간 축하금 집계 (12개월 × 부서, 명단 1회 순회)
+# ================================================================
+def yearly_payouts(users, year: int) -> dict:
+    """
+    year 년 생일 기준 월별/부서별 축하금 합계
+    - 근속일수는 "그 해 생일" 기준 (조회 시점과 무관하게 연도별로 고정)
+    - 생일 전에 퇴사한 직원은 제외
+    """
+    months = {
+        m: {"month": m, "hospital_count": 0, "hospital_total": 0,
+            "union_count": 0, "union_total": 0}
+        for m in range(1, 13)
+    }
+    by_dept = {}
+    members = []
+
+    for u in users:
+        if not u.birth_month or not u.birth_day:
+            continue
+
+        bday = birthday_in_year(u.birth_month, u.birth_day, year)
+        if u.resign_date and u.resign_date < bday:
+            continue
+
+        hospital, union = payout_amounts(join_date_of(u), bday)
+        if not hospital and not union:
+            continue
+
+        dept = u.department or "미지정"
+        row = months[u.birth_month]
+        cell = by_dept.setdefault((u.birth_month, dept), {
+            "month": u.birth_month, "department": dept,
+            "hospital_count": 0, "hospital_total": 0,
+            "union_count": 0, "union_total": 0,
+        })
+        for agg in (row, cell):
+            agg["hospital_count"] += 1 if hospital else 0
+            agg["hospital_total"] += hospital
+            agg["union_count"] += 1 if union else 0
+            agg["union_total"] += union
+
+        members.append({
+            "month": u.birth_month,
+            "date": bday.isoformat(),
+            "name": u.name or u.username or "이름없음",
+            "department": dept,
+            "hospital": hospital,
+            "union": union,
+        })
+
+    members.sort(key=lambda x: (x["date"], x["department"], x["name"]))
+    month_rows = [months[m] for m in range(1, 13)]
+    return {
+        "year": year,
+        "months": month_rows,
+        "departments": [by_dept[k] for k in sorted(by_dept)],
+        "members": members,
+        "hospital_total": sum(r["hospital_total"] for r in month_rows),
+        "union_total": sum(r["union_total"] for r in month_rows),
+    }
+
+
+# ================================================================
+#  다가오는 생일 (day-of-year 인덱스)
+# ================================================================
+UPCOMING_INDEX_TTL = 300  # 초 (워커 프로세스별)
+_upcoming_index = {}
+
+
+def day_of_year(month: int, day: int) -> int:
+    """윤년(2000년) 달력 기준 1~366 → 2/29 생일도 고유한 위치"""
+    return date(2000, month, day).timetuple().tm_yday
+
+
+def build_doy_index(users):
+    """[(day_of_year, user_id, name, department, birthday, month, day)] 정렬 리스트"""
+    rows = sorted(
+        (day_of_year(u.birth_month, u.birth_day), u.id, u.name or u.username,
+         u.department, u.birthday, u.birth_month, u.birth_day)
+        for u in users
+        if u.birth_month and u.birth_day
+    )
+    return [r[0] for r in rows], rows
+
+
+def get_doy_index(signature, loader):
+    """
+    (캐시 포함) day-of-year 인덱스
+    - signature: 생일 데이터가 바뀌면 달라지는 값 (예: 인원수/합계) → 바뀌면 재구성
+    - loader: 인덱스 재구성 시 사용자 목록을 읽어오는 함수
+    """
+    now = time.monotonic()
+    hit = _upcoming_index.get("index")
+    if hit and hit[0] == signature and now - hit[1] < UPCOMING_INDEX_TTL:
+        return hit[2]
+
+    index = build_doy_index(loader())
+    _upcoming_index["index"] = (signature, now, index)
+    return index
+
+
+def clear_upcoming_index():
+    _upcoming_index.clear()
+
+
+def upcoming_birthdays(index, today: date, days: int):
+    """
+    today ~ today+days 사이 생일자 [{..., "date", "in_days"}] (날짜순)
+    - 연말을 넘기면 (오늘~12/31) + (1/1~끝) 두 구간을 bisect 로 조회
+    """
+    keys, rows = index
+    end = today + timedelta(days=days)
+
+    if days >= 365:
+        candidates = rows
+    else:
+        lo = day_of_year(today.month, today.day)
+        # 평년 2/28 에 축하하는 2/29 생일자를 놓치지 않도록 끝을 하루 넓힘
+        hi = day_of_year(end.month, end.day) + 1
+        ranges = [(lo, hi)] if end.year == today.year else [(lo, 366), (1, hi)]
+        candidates = []
+        for a, b in ranges:
+            candidates.extend(rows[bisect_left(keys, a):bisect_right(keys, b)])
+
+    result = []
+    seen = set()
+    for _, uid, name, dept, birthday, month, day in candidates:
+        if uid in seen:
+            continue
+        seen.add(uid)
+        nb = next_birthday(month, day, today)
+        if nb > end:
+            continue
+        result.append({
+            "user_id": uid,
+            "name": name,
+            "department": dept,
+            "birthday": birthday,
+            "date": nb.isoformat(),
+            "in_days": (nb - today).days,
+        })
+
+    result.sort(key=lambda x: (x["date"], x["name"] or ""))
+    return result
@@ -0,0 +1,234 @@
+# app/boot.py
+"""
+1회성 부팅 작업 (배포/시작 시 한 번만 - gunicorn 워커마다 하지 않음)
+
+- init_database : db.create_all() + 기존 테이블에 새 컬럼 추가(없을 때만) + master 계정 생성/갱신
+  · create_all 은 이미 있는 테이블에 컬럼을 추가하지 않음 → UPGRADE_COLUMNS 를 ALTER TABLE 로 추가
+  · 백필: birth_month/birth_day, 대체연차 이력 grant_date(비어 있으면 적용일자),
+          예전 대체연차 이력 → 직원별 부여 기록(alt_leave_grants)
+- sync_forms    : 저장소 forms/ → STORAGE_ROOT/forms 복사 (checksum manifest)
+  · 없으면 복사
+  · 저장소 원본이 바뀌었으면 갱신 (단, 디스크 파일을 따로 교체한 경우는 덮어쓰지 않고 경고)
+  · manifest: STORAGE_ROOT/forms_manifest.json  { 파일명: 복사한 원본 sha256 }
+- run_boot      : 위 두 작업 (flask init / gunicorn.conf.py on_starting / BOOT_ON_STARTUP=1)
+  · 이전 실행의 /metrics 워커 파일 정리는 flask init 에서만 (배포당 1번)
+    → BOOT_ON_STARTUP=1 로 워커마다 run_boot 가 돌아도 다른 워커 파일을 지우지 않음
+"""
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+
+from sqlalchemy import inspect, text as sql_text, update
+
+from app import db
+
+MANIFEST_NAME = "forms_manifest.json"
+
+# ✅ 기존 DB 에 없을 수 있는 컬럼 (테이블, 컬럼, 타입) - 부팅 때 없으면 추가
+#    (scripts/migrate_employment_and_vacation_forms.py 와 같은 컬럼, 스크립트 없이도 서버가 뜨도록)
+UPGRADE_COLUMNS = [
+    ("user", "birth_month", "INTEGER"),
+    ("user", "birth_day", "INTEGER"),
+    ("dept_month_exports", "content_hash", "VARCHAR(64)"),
+]
+
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _load_manifest(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(path: str, manifest: dict):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def _backfill_birth_month_day() -> int:
+    """birthday 문자열(YYYY-MM-DD) → birth_month / birth_day (아직 비어 있는 행만)"""
+    user = db.engine.dialect.identifier_preparer.quote("user")
+    users = db.session.execute(sql_text(
+        f"SELECT id, birthday FROM {user} WHERE birthday IS NOT NULL AND birth_month IS NULL"
+    )).mappings().all()
+
+    rows = []
+    for u in users:
+        try:
+            bday = datetime.strptime(str(u["birthday"]).strip(), "%Y-%m-%d").date()
+        except ValueError:
+            continue
+        rows.append({"m": bday.month, "d": bday.day, "id": u["id"]})
+    if rows:
+        db.session.execute(
+            sql_text(f"UPDATE {user} SET birth_month = :m, birth_day = :d WHERE id = :id"),
+            rows,
+        )
+    return len(rows)
+
+
+def backfill_alt_leave_log_grant_date() -> int:
+    """
+    grant_date 가 비어 있는 대체연차 이력 → 적용일자 00:00 으로 채움
+    (이력 페이지 keyset 정렬/커서가 grant_date 기준 → NULL 이면 다음 페이지에서 빠짐)
+    """
+    from app.models import AltLeaveLog
+
+    rows = (
+        db.session.query(AltLeaveLog.id, AltLeaveLog.apply_date)
+        .filter(AltLeaveLog.grant_date.is_(None))
+        .all()
+    )
+    if rows:
+        db.session.execute(update(AltLeaveLog), [
+            {"id": log_id, "grant_date": datetime.combine(apply_date, datetime.min.time())}
+            for log_id, apply_date in rows
+        ])
+    if db.engine.dialect.name == "postgresql":
+        # SQLite 는 컬럼 제약을 바꿀 수 없음 → 모델 기본값(now_kst)으로만 보장
+        db.session.execute(sql_text("ALTER TABLE alt_leave_log ALTER COLUMN grant_date SET NOT NULL"))
+    return len(rows)
+
+
+def backfill_alt_leave_grants() -> int:
+    """예전 대체연차 이력(AltLeaveLog) → 직원별 부여 기록(AltLeaveGrant), 아직 없는 이력만"""
+    from app.altleave.routes import backfill_grants_from_logs
+
+    insp = inspect(db.session.connection())
+    user_id = next(c for c in insp.get_columns("alt_leave_grants") if c["name"] == "user_id")
+    if not user_id["nullable"] and db.engine.dialect.name == "postgresql":
+        db.session.execute(sql_text("ALTER TABLE alt_leave_grants ALTER COLUMN user_id DROP NOT NULL"))
+        user_id["nullable"] = True
+    # SQLite 는 NOT NULL 을 풀 수 없음 → 이름으로 못 찾은 직원만 건너뜀
+    return backfill_grants_from_logs(keep_unknown_users=user_id["nullable"])
+
+
+def upgrade_schema() -> list:
+    """
+    ✅ 기존 테이블에 없는 컬럼 추가 + 인덱스 + 백필 (여러 번 실행해도 같은 결과)
+    반환: 추가한 "테이블.컬럼" 목록
+    """
+    from app.models import User
+
+    preparer = db.engine.dialect.identifier_preparer
+    insp = inspect(db.session.connection())  # 같은 트랜잭션 (PostgreSQL ALTER 잠금)
+    added = []
+    try:
+        for table, column, ddl_type in UPGRADE_COLUMNS:
+            cols = {c["name"] for c in insp.get_columns(table)}
+            if column in cols:
+                continue
+            db.session.execute(sql_text(
+                f"ALTER TABLE {preparer.quote(table)} ADD COLUMN {column} {ddl_type}"
+            ))
+            added.append(f"{table}.{column}")
+        db.session.commit()
+
+        for ix in User.__table__.indexes:
+            if ix.name == "ix_user_birth_month_day":
+                ix.create(db.engine, checkfirst=True)
+
+        filled = _backfill_birth_month_day()
+        dated = backfill_alt_leave_log_grant_date()
+        granted = backfill_alt_leave_grants()
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        raise RuntimeError(
+            f"DB 스키마 갱신 실패 ({e}) → scripts/migrate_employment_and_vacation_forms.py 를 먼저 실행하세요."
+        ) from e
+
+    for name in added:
+        print(f"✅ 컬럼 추가: {name}")
+    if filled:
+        print(f"✅ birth_month/birth_day 백필: {filled}명")
+    if dated:
+        print(f"✅ 대체연차 이력 grant_date 백필: {dated}건")
+    if granted:
+        print(f"✅ 대체연차 직원별 부여 기록 백필: {granted}건")
+    return added
+
+
+def init_database(app):
+    """✅ 테이블 생성 + 새 컬럼 추가 + master 계정"""
+    from app.models import init_master
+
+    with app.app_context():
+        db.create_all()
+        upgrade_schema()
+        init_master()
+
+
+def sync_forms(app, src_dir=None) -> dict:
+    """
+    ✅ forms 동기화 → {"copied": [...], "updated": [...], "kept": [...], "unchanged": n}
+    - kept: 원본은 바뀌었지만 디스크 파일이 직접 교체되어 있어 유지한 파일
+    """
+    src_dir = src_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "forms")
+    dst_dir = app.config["FORMS_FOLDER"]
+    manifest_path = os.path.join(app.config["STORAGE_ROOT"], MANIFEST_NAME)
+
+    result = {"copied": [], "updated": [], "kept": [], "unchanged": 0}
+    if not os.path.isdir(src_dir):
+        return result
+
+    os.makedirs(dst_dir, exist_ok=True)
+    manifest = _load_manifest(manifest_path)
+
+    for filename in sorted(os.listdir(src_dir)):
+        src_file = os.path.join(src_dir, filename)
+        if not os.path.isfile(src_file):
+            continue
+        dst_file = os.path.join(dst_dir, filename)
+        src_hash = _sha256(src_file)
+        recorded = manifest.get(filename)
+
+        if os.path.exists(dst_file):
+            if recorded == src_hash:
+                result["unchanged"] += 1
+                continue
+            dst_hash = _sha256(dst_file)
+            if dst_hash == src_hash:
+                # 예전 방식으로 복사된 파일 → manifest 만 채움
+                manifest[filename] = src_hash
+                result["unchanged"] += 1
+                continue
+            if recorded is None or dst_hash != recorded:
+                # 디스크 파일을 따로 교체한 것 → 건드리지 않음
+                result["kept"].append(filename)
+                continue
+            action = "updated"
+        else:
+            action = "copied"
+
+        tmp = dst_file + ".tmp"
+        shutil.copy2(src_file, tmp)
+        os.replace(tmp, dst_file)
+        manifest[filename] = src_hash
+        result[action].append(filename)
+        print(f"📄 {'복사됨' if action == 'copied' else '갱신됨'}: {src_file} → {dst_file}")
+
+    for filename in result["kept"]:
+        print(f"⚠️ forms/{filename}: 원본이 바뀌었지만 디스크 파일이 직접 교체되어 있어 유지")
+
+    _write_manifest(manifest_path, manifest)
+    return result
+
+
+def run_boot(app) -> dict:
+    """✅ 1회성 부팅 작업 전체 (프로세스마다 실행될 수 있음 → 다른 프로세스 상태는 건드리지 않음)"""
+    init_database(app)
+    return sync_forms(app)
@@ -0,0 +1,438 @@
+# app/calendar_page/holidays.py
+"""
+공휴일 테이블 (프로세스 메모리)
+
+- 앱 시작 시 holiday_cache/*.json 을 전부 읽어 메모리에 올려둠
+  (번들 holiday_cache → STORAGE_ROOT/holiday_cache 순서, 뒤가 우선)
+- 요청은 메모리에서 바로 응답, 없는 연도만 API 호출 후 캐시 파일 + 메모리에 저장
+- 연도별 ETag 를 미리 계산해두고 304 응답에 사용
+- 캐시 미스 시 연도별 파일 잠금(single-flight)으로 워커 전체에서 API 호출은 1번만
+- 캐시 파일은 임시파일 → rename 으로 원자적 기록 (읽는 쪽이 반쯤 쓰인 파일을 보지 않음)
+- API 실패로 만든 fallback 결과는 짧은 TTL(expires_at)을 붙여 나중에 다시 조회
+- 앱 시작 시 백그라운드 스레드로 (작년 ~ 내후년) 을 미리 채워둠
+- 캐시 파일이 없는 연도는 lunar.py 오프라인 계산으로 바로 응답 (API 는 요청 경로에서 제외)
+  → API 키가 있으면 백그라운드로 API 결과와 대조만 하고, 다르면 경고 후 API 결과로 교체
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+
+try:
+    import fcntl  # Linux/Render 전용 (Windows 개발환경은 프로세스 내 잠금만)
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+from flask import current_app
+
+from app.calendar_page import lunar
+from app.metrics.store import inc as metric_inc
+
+BUNDLED_CACHE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "holiday_cache")
+)
+
+# { year: {"data": {"holidays": [...], "holiday_names": {...}}, "etag": "...", "expires_at": None|ts} }
+_table = {}
+_table_lock = threading.Lock()
+_year_locks = {}
+_verifying = set()
+
+# 시작 시 미리 채울 연도 (올해 기준 오프셋) - 캘린더 첫 화면이 요청하는 범위와 동일
+PREFETCH_YEAR_OFFSETS = (-1, 0, 1, 2)
+
+# 범위 조회 최대 연도 수
+MAX_RANGE_YEARS = 10
+
+# fallback 결과 유지 시간(초) 기본값 → config["HOLIDAY_FALLBACK_TTL"] 로 변경 가능
+DEFAULT_FALLBACK_TTL = 60 * 60
+
+HOLIDAY_API_URL = (
+    "http://apis.data.go.kr/B090041/openapi/service/SpcdeInfoService/getHoliDeInfo"
+)
+
+# ✅ 대체공휴일은 제외하지 않음 (근무일 계산에서 쉬는 날로 빠져야 함)
+EXCLUDE_KEYWORDS = [
+    "선거",
+    "임시",
+]
+RENAME_MAP = {
+    "1월1일": "신정",
+    "기독탄신일": "성탄절",
+}
+FIXED_SOLAR_HOLIDAYS = {
+    "0101": "신정",
+    "0301": "3·1절",
+    "0505": "어린이날",
+    "0606": "현충일",
+    "0815": "광복절",
+    "1003": "개천절",
+    "1009": "한글날",
+    "1225": "성탄절",
+}
+
+
+def _etag(data: dict) -> str:
+    raw = json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _with_substitutes(year: int, data: dict) -> dict:
+    """
+    예전 기준(대체공휴일 제외)으로 만든 캐시 파일에 빠진 대체공휴일 보완
+    - 번들/디스크 캐시 파일을 다시 만들지 않아도 근무일 계산에서 대체공휴일이 빠지게
+    - 오프라인 계산 범위 밖 연도는 그대로
+    """
+    computed = lunar.korean_holidays(year)
+    if computed is None:
+        return data
+
+    names = dict(data.get("holiday_names", {}))
+    missing = [
+        ymd for ymd in computed["holidays"]
+        if ymd not in names and computed["holiday_names"][ymd] == lunar.SUBSTITUTE_NAME
+    ]
+    if not missing:
+        return data
+
+    for ymd in missing:
+        names[ymd] = lunar.SUBSTITUTE_NAME
+    return {**data, "holidays": sorted(set(data.get("holidays", [])) | set(missing)), "holiday_names": names}
+
+
+def _put(year: int, data: dict):
+    """캐시 파일 형식(dict) → 메모리 엔트리. fallback/expires_at 은 응답 본문에서 분리"""
+    data = dict(_with_substitutes(year, data))
+    data.pop("fallback", None)
+    expires_at = data.pop("expires_at", None)
+
+    entry = {"data": data, "etag": _etag(data), "expires_at": expires_at}
+    with _table_lock:
+        _table[year] = entry
+    return entry
+
+
+def _is_fresh(entry) -> bool:
+    if not entry:
+        return False
+    expires_at = entry.get("expires_at")
+    return expires_at is None or expires_at > time.time()
+
+
+def _read_cache_file(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or "holidays" not in data:
+        raise ValueError("invalid holiday cache format")
+    return data
+
+
+def _write_cache_file(path: str, data: dict):
+    """같은 폴더에 임시파일로 쓴 뒤 os.replace → 원자적 교체"""
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".holiday_", suffix=".tmp", dir=os.path.dirname(path)
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def _single_flight(year: int, cache_dir):
+    """
+    연도별 single-flight 잠금
+    - 프로세스 안: threading.Lock
+    - 프로세스 간(gunicorn 워커): <cache_dir>/<year>.lock 파일에 flock
+    """
+    with _table_lock:
+        lock = _year_locks.setdefault(year, threading.Lock())
+
+    with lock:
+        if not cache_dir or fcntl is None:
+            yield
+            return
+
+        lock_path = os.path.join(cache_dir, f"{year}.lock")
+        with open(lock_path, "a") as lf:
+            fcntl.flock(lf.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lf.fileno(), fcntl.LOCK_UN)
+
+
+def preload(app):
+    """앱 시작 시 1회: 캐시 폴더의 모든 연도를 메모리에 적재"""
+    dirs = [BUNDLED_CACHE_DIR, app.config.get("HOLIDAY_CACHE_DIR")]
+    loaded = 0
+    for d in dirs:
+        if not d or not os.path.isdir(d):
+            continue
+        for fname in sorted(os.listdir(d)):
+            stem, ext = os.path.splitext(fname)
+            if ext != ".json" or not stem.isdigit():
+                continue
+            try:
+                _put(int(stem), _read_cache_file(os.path.join(d, fname)))
+                loaded += 1
+            except Exception as e:
+                app.logger.warning("Holiday cache preload skipped (%s): %s", fname, e)
+    return loaded
+
+
+def cached_entry(year: int):
+    """메모리에 있는 연도 엔트리 (없으면 None)"""
+    return _table.get(year)
+
+
+def _fetch_from_api(year: int) -> dict:
+    """공공데이터포털 특일 API 조회 → 실패/빈값이면 고정 양력 공휴일 fallback"""
+    import requests  # API 조회 때만 필요 (평소엔 오프라인 계산 → 앱 시작 시 import 생략)
+
+    service_key = current_app.config["HOLIDAY_API_KEY"]
+    api_url = current_app.config.get("HOLIDAY_API_URL") or HOLIDAY_API_URL
+    url = f"{api_url}?serviceKey={service_key}&_type=json&solYear={year}&numOfRows=100"
+
+    holidays = []          # "YYYY-MM-DD" 리스트
+    holiday_names = {}     # { "YYYY-MM-DD": "설날" } 형식
+    result = {"holidays": holidays, "holiday_names": holiday_names}
+
+    try:
+        res = requests.get(url, timeout=5)
+        res.raise_for_status()
+        data = res.json()
+
+        body = data.get("response", {}).get("body", {})
+        items_container = body.get("items")
+
+        if not items_container or isinstance(items_container, str):
+            items = []
+        else:
+            raw_items = items_container.get("item")
+            if raw_items is None:
+                items = []
+            elif isinstance(raw_items, list):
+                items = raw_items
+            else:
+                items = [raw_items]
+
+        for item in items:
+            if str(item.get("isHoliday", "N")) != "Y":
+                continue
+
+            name = str(item.get("dateName", "")).strip()
+            name = RENAME_MAP.get(name, name)
+
+            if any(kw in name for kw in EXCLUDE_KEYWORDS):
+                continue
+
+            date = str(item.get("locdate", ""))  # YYYYMMDD
+            if len(date) != 8:
+                continue
+
+            ymd = f"{date[:4]}-{date[4:6]}-{date[6:8]}"
+            holidays.append(ymd)
+            holiday_names[ymd] = name
+
+    except Exception as e:
+        current_app.logger.exception("Holiday parse error %s: %s", year, e)
+
+    # 🔁 API에서 아무 것도 못 받았으면, 고정 양력 공휴일 fallback
+    if not holidays:
+        for md, name in FIXED_SOLAR_HOLIDAYS.items():
+            ymd = f"{year}-{md[:2]}-{md[2:]}"
+            holidays.append(ymd)
+            holiday_names[ymd] = name
+
+        # ✅ fallback 은 영구 캐시하지 않음 → TTL 지나면 다시 API 조회
+        ttl = current_app.config.get("HOLIDAY_FALLBACK_TTL", DEFAULT_FALLBACK_TTL)
+        result["fallback"] = True
+        result["expires_at"] = time.time() + ttl
+
+        current_app.logger.info(
+            "Holiday API empty for %s → using fixed solar holidays fallback (ttl=%ss).", year, ttl
+        )
+
+    return result
+
+
+def _offline_holidays(year: int):
+    """lunar.py 계산 결과를 API 캐시와 같은 기준(EXCLUDE_KEYWORDS 제외)으로 정리. 지원 범위 밖이면 None"""
+    data = lunar.korean_holidays(year)
+    if data is None:
+        return None
+
+    names = data["holiday_names"]
+    holidays = [
+        ymd for ymd in data["holidays"]
+        if not any(kw in names[ymd] for kw in EXCLUDE_KEYWORDS)
+    ]
+    return {"holidays": holidays, "holiday_names": {ymd: names[ymd] for ymd in holidays}}
+
+
+def _start_verify(year: int, offline: dict):
+    """
+    오프라인 계산 결과를 백그라운드에서 API 와 대조
+    - API 성공 시 캐시 파일 저장 (다음 기동부터는 파일 사용)
+    - 결과가 다르면 경고 로그 + 메모리 테이블을 API 결과로 교체
+    """
+    app = current_app._get_current_object()
+    if not app.config.get("HOLIDAY_API_VERIFY") or not app.config.get("HOLIDAY_API_KEY"):
+        return None
+
+    with _table_lock:
+        if year in _verifying:
+            return None
+        _verifying.add(year)
+
+    def _run():
+        try:
+            with app.app_context():
+                result = _fetch_from_api(year)
+                if result.get("fallback"):
+                    return
+
+                cache_dir = app.config.get("HOLIDAY_CACHE_DIR")
+                if cache_dir:
+                    try:
+                        _write_cache_file(os.path.join(cache_dir, f"{year}.json"), result)
+                    except Exception as e:
+                        app.logger.exception("Holiday cache write error (%s): %s", year, e)
+
+                if (sorted(set(result["holidays"])) != sorted(set(offline["holidays"]))
+                        or result["holiday_names"] != offline["holiday_names"]):
+                    app.logger.warning(
+                        "Holiday offline/API mismatch for %s → using API data "
+                        "(api_only=%s, offline_only=%s)",
+                        year,
+                        sorted(set(result["holidays"]) - set(offline["holidays"])),
+                        sorted(set(offline["holidays"]) - set(result["holidays"])),
+                    )
+                    _put(year, result)
+        except Exception as e:
+            app.logger.warning("Holiday API verify failed (%s): %s", year, e)
+        finally:
+            with _table_lock:
+                _verifying.discard(year)
+
+    t = threading.Thread(target=_run, name=f"holiday-verify-{year}", daemon=True)
+    t.start()
+    return t
+
+
+def get_year(year: int) -> dict:
+    """
+    ✅ 연도별 공휴일 엔트리 {"data": ..., "etag": ..., "expires_at": ...}
+    메모리 → 캐시 파일 → 오프라인 계산 → API 순서 (API 호출은 잠금 안에서 1번만)
+    """
+    entry = _table.get(year)
+    if _is_fresh(entry):
+        metric_inc("gaja_holiday_lookups_total", result="hit", source="memory")
+        return entry
+
+    cache_dir = current_app.config.get("HOLIDAY_CACHE_DIR")
+    cache_path = os.path.join(cache_dir, f"{year}.json") if cache_dir else None
+
+    with _single_flight(year, cache_dir):
+        # 잠금 대기 중에 다른 스레드가 채웠을 수 있음
+        entry = _table.get(year)
+        if _is_fresh(entry):
+            metric_inc("gaja_holiday_lookups_total", result="hit", source="memory")
+            return entry
+
+        # 다른 워커가 이미 파일을 만들어 둔 경우
+        if cache_path and os.path.exists(cache_path):
+            try:
+                entry = _put(year, _read_cache_file(cache_path))
+                if _is_fresh(entry):
+                    metric_inc("gaja_holiday_lookups_total", result="miss", source="disk")
+                    return entry
+            except Exception as e:
+                current_app.logger.exception("Holiday cache read error (%s): %s", year, e)
+
+        # 지원 범위 연도는 오프라인 계산으로 바로 응답 (API 검증은 백그라운드)
+        offline = _offline_holidays(year)
+        if offline is not None:
+            entry = _put(year, offline)
+            _start_verify(year, offline)
+            metric_inc("gaja_holiday_lookups_total", result="miss", source="offline")
+            return entry
+
+        result = _fetch_from_api(year)
+        metric_inc("gaja_holiday_lookups_total", result="miss", source="api")
+
+        # 디스크 캐시에 저장 (실패해도 서비스는 정상)
+        if cache_path:
+            try:
+                _write_cache_file(cache_path, result)
+            except Exception as e:
+                current_app.logger.exception("Holiday cache write error (%s): %s", year, e)
+
+        return _put(year, result)
+
+
+def get_range(from_year: int, to_year: int) -> dict:
+    """
+    ✅ 여러 해 공휴일을 합친 엔트리 (연도 엔트리를 그대로 이어붙임)
+    - etag: 각 연도 etag 조합
+    - expires_at: 포함된 연도 중 가장 빠른 만료 (fallback 포함 시)
+    """
+    holidays, holiday_names, etags, expires = [], {}, [], []
+    for y in range(from_year, to_year + 1):
+        entry = get_year(y)
+        holidays.extend(entry["data"].get("holidays", []))
+        holiday_names.update(entry["data"].get("holiday_names", {}))
+        etags.append(entry["etag"])
+        if entry.get("expires_at"):
+            expires.append(entry["expires_at"])
+
+    return {
+        "data": {
+            "from": from_year,
+            "to": to_year,
+            "holidays": holidays,
+            "holiday_names": holiday_names,
+        },
+        "etag": hashlib.sha1("|".join(etags).encode("utf-8")).hexdigest(),
+        "expires_at": min(expires) if expires else None,
+    }
+
+
+def start_prefetch(app):
+    """
+    앱 시작 시 백그라운드로 작년~내후년 공휴일을 채움
+    - 이미 메모리에 있는(만료 안 된) 연도는 건너뜀 → 보통은 API 호출 없음
+    - 요청 처리 스레드를 막지 않도록 daemon 스레드
+    """
+    this_year = date.today().year
+    years = [
+        this_year + off for off in PREFETCH_YEAR_OFFSETS
+        if not _is_fresh(_table.get(this_year + off))
+    ]
+    if not years:
+        return None
+
+    def _run():
+        with app.app_context():
+            for y in years:
+                try:
+                    get_year(y)
+                except Exception as e:
+                    app.logger.warning("Holiday prefetch failed (%s): %s", y, e)
+
+    t = threading.Thread(target=_run, name="holiday-prefetch", daemon=True)
+    t.start()
+    return t
@@ -0,0 +1,288 @@
+# app/calendar_page/lunar.py
+"""
+음력 공휴일 오프라인 계산 (설날 / 부처님오신날 / 추석 + 대체공휴일)
+
+- 천문 계산(Meeus, Astronomical Algorithms)으로 합삭(초하루)과 중기(中氣)를 구하고
+  한국 표준시(KST, UTC+9) 날짜 기준으로 음력 월을 배정
+  · 동지가 든 달 = 11월
+  · 동지~다음 동지 사이가 13개월이면, 중기가 없는 첫 달이 윤달
+- 결과 형식은 공공데이터포털 API 캐시와 동일: {"holidays": [...], "holiday_names": {...}}
+- 지원 범위(SUPPORTED_YEARS) 밖이면 None → 호출부에서 API 사용
+"""
+import math
+from datetime import date, timedelta
+
+SUPPORTED_YEARS = range(2000, 2101)
+
+KST_OFFSET_DAYS = 9 / 24
+
+# 양력 고정 공휴일 (API 표기명과 동일)
+SOLAR_HOLIDAYS = [
+    ((1, 1), "신정"),
+    ((3, 1), "삼일절"),
+    ((5, 5), "어린이날"),
+    ((6, 6), "현충일"),
+    ((8, 15), "광복절"),
+    ((10, 3), "개천절"),
+    ((10, 9), "한글날"),
+    ((12, 25), "성탄절"),
+]
+
+SUBSTITUTE_NAME = "대체공휴일"
+
+# 대체공휴일 적용 규칙 (적용 시작 연도, 토요일도 대체 여부)
+# - 설날/추석: 일요일 또는 다른 공휴일과 겹칠 때 (토요일은 대체 없음)
+# - 어린이날: 토/일 또는 다른 공휴일과 겹칠 때
+# - 국경일(삼일절/광복절/개천절/한글날): 2021년~, 토/일
+# - 부처님오신날/성탄절: 2023년~, 토/일
+SUBSTITUTE_RULES = {
+    "설날": (2014, False),
+    "추석": (2014, False),
+    "어린이날": (2014, True),
+    "삼일절": (2021, True),
+    "광복절": (2021, True),
+    "개천절": (2021, True),
+    "한글날": (2021, True),
+    "부처님오신날": (2023, True),
+    "성탄절": (2023, True),
+}
+
+
+# ================================================================
+# 천문 계산
+# ================================================================
+def _delta_t_days(year: float) -> float:
+    """ΔT(TT-UT) 근사 (Espenak & Meeus), 일 단위"""
+    t = year - 2000
+    if year < 2050:
+        dt = 62.92 + 0.32217 * t + 0.005589 * t * t
+    else:
+        dt = -20 + 32 * ((year - 1820) / 100) ** 2 - 0.5628 * (2150 - year)
+    return dt / 86400
+
+
+def _jde_to_kst_date(jde: float) -> date:
+    year_approx = 2000 + (jde - 2451545.0) / 365.25
+    jd = jde - _delta_t_days(year_approx) + KST_OFFSET_DAYS
+    # JD 2451545.0 = 2000-01-01 12:00 → 날짜 경계는 JD x.5
+    return date(2000, 1, 1) + timedelta(days=math.floor(jd + 0.5) - 2451545)
+
+
+def _new_moon_jde(k: int) -> float:
+    """k 번째 합삭 시각 (JDE, Meeus 49장)"""
+    T = k / 1236.85
+    T2, T3, T4 = T * T, T ** 3, T ** 4
+
+    jde = (2451550.09766 + 29.530588861 * k + 0.00015437 * T2
+           - 0.000000150 * T3 + 0.00000000073 * T4)
+
+    rad = math.radians
+    E = 1 - 0.002516 * T - 0.0000074 * T2
+    M = rad(2.5534 + 29.10535670 * k - 0.0000014 * T2 - 0.00000011 * T3)
+    Mp = rad(201.5643 + 385.81693528 * k + 0.0107582 * T2 + 0.00001238 * T3 - 0.000000058 * T4)
+    F = rad(160.7108 + 390.67050284 * k - 0.0016118 * T2 - 0.00000227 * T3 + 0.000000011 * T4)
+    Om = rad(124.7746 - 1.56375588 * k + 0.0020672 * T2 + 0.00000215 * T3)
+
+    sin = math.sin
+    jde += (
+        -0.40720 * sin(Mp)
+        + 0.17241 * E * sin(M)
+        + 0.01608 * sin(2 * Mp)
+        + 0.01039 * sin(2 * F)
+        + 0.00739 * E * sin(Mp - M)
+        - 0.00514 * E * sin(Mp + M)
+        + 0.00208 * E * E * sin(2 * M)
+        - 0.00111 * sin(Mp - 2 * F)
+        - 0.00057 * sin(Mp + 2 * F)
+        + 0.00056 * E * sin(2 * Mp + M)
+        - 0.00042 * sin(3 * Mp)
+        + 0.00042 * E * sin(M + 2 * F)
+        + 0.00038 * E * sin(M - 2 * F)
+        - 0.00024 * E * sin(2 * Mp - M)
+        - 0.00017 * sin(Om)
+        - 0.00007 * sin(Mp + 2 * M)
+        + 0.00004 * sin(2 * Mp - 2 * F)
+        + 0.00004 * sin(3 * M)
+        + 0.00003 * sin(Mp + M - 2 * F)
+        + 0.00003 * sin(2 * Mp + 2 * F)
+        - 0.00003 * sin(Mp + M + 2 * F)
+        + 0.00003 * sin(Mp - M + 2 * F)
+        - 0.00002 * sin(Mp - M - 2 * F)
+        - 0.00002 * sin(3 * Mp + M)
+        + 0.00002 * sin(4 * Mp)
+    )
+
+    # 행성 섭동 보정
+    planetary = [
+        (0.000325, 299.77 + 0.107408 * k - 0.009173 * T2),
+        (0.000165, 251.88 + 0.016321 * k),
+        (0.000164, 251.83 + 26.651886 * k),
+        (0.000126, 349.42 + 36.412478 * k),
+        (0.000110, 84.66 + 18.206239 * k),
+        (0.000062, 141.74 + 53.303771 * k),
+        (0.000060, 207.14 + 2.453732 * k),
+        (0.000056, 154.84 + 7.306860 * k),
+        (0.000047, 34.52 + 27.261239 * k),
+        (0.000042, 207.19 + 0.121824 * k),
+        (0.000040, 291.34 + 1.844379 * k),
+        (0.000037, 161.72 + 24.198154 * k),
+        (0.000035, 239.56 + 25.513099 * k),
+        (0.000023, 331.55 + 3.592518 * k),
+    ]
+    jde += sum(c * sin(rad(a)) for c, a in planetary)
+    return jde
+
+
+def _sun_longitude(jde: float) -> float:
+    """태양 겉보기 황경(도) (Meeus 25장 저정밀식, 오차 ~0.01°)"""
+    T = (jde - 2451545.0) / 36525
+    L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T * T
+    M = math.radians(357.52911 + 35999.05029 * T - 0.0001537 * T * T)
+    C = ((1.914602 - 0.004817 * T - 0.000014 * T * T) * math.sin(M)
+         + (0.019993 - 0.000101 * T) * math.sin(2 * M)
+         + 0.000289 * math.sin(3 * M))
+    omega = math.radians(125.04 - 1934.136 * T)
+    return (L0 + C - 0.00569 - 0.00478 * math.sin(omega)) % 360
+
+
+def _solar_term_jde(year: int, longitude: float) -> float:
+    """year 년에 태양 황경이 longitude 가 되는 시각 (JDE)"""
+    # 1월 1일 태양 황경 ≈ 280° 기준 초기값 → 뉴턴 반복
+    jan1 = 2451544.5 + (date(year, 1, 1) - date(2000, 1, 1)).days
+    jde = jan1 + ((longitude - 280) % 360) / 360 * 365.2422
+    for _ in range(20):
+        diff = (longitude - _sun_longitude(jde) + 180) % 360 - 180
+        jde += 58 * math.sin(math.radians(diff))
+        if abs(diff) < 1e-6:
+            break
+    return jde
+
+
+# ================================================================
+# 음력 → 양력
+# ================================================================
+def _lunar_month_starts(year: int):
+    """
+    (year-1)년 동지 ~ year년 동지 사이 음력 월 목록
+    반환: [(월, 윤달여부, 초하루 양력날짜), ...]  (첫 항목 = (year-1)년 11월)
+    """
+    ws_prev = _jde_to_kst_date(_solar_term_jde(year - 1, 270))
+    ws_curr = _jde_to_kst_date(_solar_term_jde(year, 270))
+
+    # (year-1)년 10월경부터 합삭을 넉넉히 계산
+    k0 = math.floor((year - 1 + 9.5 / 12 - 2000) * 12.3685)
+    new_moons = [_jde_to_kst_date(_new_moon_jde(k)) for k in range(k0, k0 + 17)]
+
+    i0 = max(i for i, d in enumerate(new_moons) if d <= ws_prev)
+    i1 = max(i for i, d in enumerate(new_moons) if d <= ws_curr)
+
+    leap_index = None
+    if i1 - i0 == 13:
+        # 중기(황경 30°의 배수): 동지 다음(대한, 300°) ~ 다음 동지까지 모두 year 년
+        zhongqi = [ws_prev] + [
+            _jde_to_kst_date(_solar_term_jde(year, (270 + 30 * n) % 360))
+            for n in range(1, 13)
+        ]
+        for i in range(i0 + 1, i1):
+            start, end = new_moons[i], new_moons[i + 1]
+            if not any(start <= z < end for z in zhongqi):
+                leap_index = i
+                break
+
+    months = []
+    num = 11
+    for i in range(i0, i1 + 1):
+        if i == i0:
+            months.append((11, False, new_moons[i]))
+            continue
+        if i == leap_index:
+            months.append((num, True, new_moons[i]))
+            continue
+        num = num % 12 + 1
+        months.append((num, False, new_moons[i]))
+    return months
+
+
+def lunar_to_solar(year: int, month: int, day: int) -> date:
+    """year 년 음력 month 월(평달, 1~10월) day 일 → 양력 날짜"""
+    if not 1 <= month <= 10:
+        raise ValueError("only lunar months 1~10 are supported")
+    for m, is_leap, start in _lunar_month_starts(year):
+        if m == month and not is_leap:
+            return start + timedelta(days=day - 1)
+    raise ValueError(f"lunar date not found: {year}-{month}-{day}")
+
+
+# ================================================================
+# 공휴일 목록
+# ================================================================
+def _substitutes(year: int, items):
+    """대체공휴일 계산: [(date, name)] → [(date, '대체공휴일')]"""
+    taken = {d for d, _ in items}
+    overlap_counted = set()  # 두 공휴일이 겹친 날은 대체공휴일 1일만
+    result = []
+
+    # 이름별로 묶음 → 설날/추석은 3일 연휴 단위로 판정
+    groups = {}
+    for d, name in items:
+        groups.setdefault(name, []).append(d)
+
+    for name, days in sorted(groups.items(), key=lambda kv: min(kv[1])):
+        rule = SUBSTITUTE_RULES.get(name)
+        if not rule or year < rule[0]:
+            continue
+        saturday_too = rule[1]
+
+        others = [d for d, n in items if n != name]
+        triggered = 0
+        for d in days:
+            if d.weekday() == 6 or (saturday_too and d.weekday() == 5):
+                triggered += 1
+            elif d in others and d not in overlap_counted:
+                overlap_counted.add(d)
+                triggered += 1
+        if not triggered:
+            continue
+
+        # 연휴 다음 첫 비공휴일 평일로 대체 (겹친 날 수만큼)
+        cursor = max(days)
+        for _ in range(triggered):
+            cursor += timedelta(days=1)
+            while cursor.weekday() >= 5 or cursor in taken:
+                cursor += timedelta(days=1)
+            taken.add(cursor)
+            result.append((cursor, SUBSTITUTE_NAME))
+    return result
+
+
+def korean_holidays(year: int, include_substitutes: bool = True):
+    """
+    ✅ 연도별 법정 공휴일 (오프라인 계산)
+    - 지원 범위 밖이면 None
+    - 반환: {"holidays": ["YYYY-MM-DD", ...], "holiday_names": {"YYYY-MM-DD": "설날"}}
+    """
+    if year not in SUPPORTED_YEARS:
+        return None
+
+    items = [(date(year, m, d), name) for (m, d), name in SOLAR_HOLIDAYS]
+
+    seollal = lunar_to_solar(year, 1, 1)
+    items += [(seollal + timedelta(days=k), "설날") for k in (-1, 0, 1)]
+    items.append((lunar_to_solar(year, 4, 8), "부처님오신날"))
+    chuseok = lunar_to_solar(year, 8, 15)
+    items += [(chuseok + timedelta(days=k), "추석") for k in (-1, 0, 1)]
+
+    # 설날 전날이 전년도일 수 있음 → 해당 연도만
+    items = [(d, n) for d, n in items if d.year == year]
+
+    if include_substitutes:
+        items += [(d, n) for d, n in _substitutes(year, items) if d.year == year]
+
+    # 같은 날짜면 양력 → 음력 → 대체 순서 유지 (API 캐시와 동일하게 이름은 뒤가 우선)
+    items.sort(key=lambda x: x[0])
+
+    holidays = [d.isoformat() for d, _ in items]
+    holiday_names = {}
+    for d, name in items:
+        holiday_names[d.isoformat()] = name
+    return {"holidays": holidays, "holiday_names": holiday_names}
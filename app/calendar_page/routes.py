@@ -1,6 +1,4 @@
 # app/calendar/routes.py
-import os
-import json
 from flask import (
     render_template,
     request,
@@ -13,6 +11,7 @@ from datetime import datetime, date, timedelta
 import calendar
 from app.calendar_page import calendar_bp
 from app.models import Vacation, User, MonthLock
+from app.events.visibility import parse_date_arg, resolve_selected_dept, visible_events_query
 from app import db
 
 
@@ -128,146 +127,20 @@ def calendar_page():
 def get_events():
 
     my_only = request.args.get("my") == "1"
-    selected_dept = (
-        request.args.get("dept")
-        or session.get("department")
-        or current_user.department
-    )
     # ✅ 일반 사용자/부서관리자는 (내부서, 의료진)만 허용
-    if not current_user.is_superadmin:
-        allowed = {current_user.department, "의료진"}
-        if selected_dept not in allowed:
-            selected_dept = current_user.department
-
-    # 1) 전체 이벤트 불러오기
-    all_events = Vacation.query.all()
-    
-        # ✅ 내 이벤트인지 판별(일반휴가 기준)
-    def _is_mine_event(ev):
-        current_names = {
-            (current_user.first_name or "").strip(),
-            (current_user.name or "").strip(),
-            (current_user.username or "").strip(),
-        }
-        return (
-            getattr(ev, "target_user_id", None) == current_user.id
-            or (getattr(ev, "target_user_id", None) in (None, 0) and getattr(ev, "user_id", None) == current_user.id)
-            or ((getattr(ev, "name", "") or "").strip() in current_names)
-        )
-
-
-    # 2) 1차 필터링 (부서 / 탄력근무 특수 규칙)
-    filtered = []
-    for e in all_events:
-
-        # -------------------------------
-        # ✅ 탄력근무 특수 규칙 (권한/부서 고정)
-        # -------------------------------
-        if e.type == "탄력근무":
-
-            # 0) 총관리자는 탄력근무 절대 노출 금지
-            if current_user.is_superadmin:
-                continue
-
-            # 1) 탄력근무의 소속 부서 판정 (DB department 우선, 없으면 대상자 부서로 보완)
-            flex_dept = (getattr(e, "department", None) or "").strip()
-            if not flex_dept and getattr(e, "target_user_id", None):
-                tu = User.query.get(e.target_user_id)
-                flex_dept = (tu.department if tu else "") or ""
-            flex_dept = (flex_dept or "").strip()
-
-            # 2) “선택한 캘린더 부서”가 내 부서가 아닐 때는 탄력근무는 안 섞이게 처리
-            #    (의료진 캘린더에서 탄력근무가 떠버리는 것 방지)
-            if (selected_dept or "").strip() != (current_user.department or "").strip():
-                continue
-
-            # 3) 중간관리자: 내 부서 탄력근무는 전체 조회
-            if current_user.is_admin:
-                if flex_dept == (current_user.department or "").strip():
-                    filtered.append(e)
-                continue
-
-            # 4) 일반 사용자: 내 탄력근무만
-            current_names = {
-                (current_user.first_name or "").strip(),
-                (current_user.name or "").strip(),
-                (current_user.username or "").strip(),
-            }
-            if (
-                getattr(e, "target_user_id", None) == current_user.id
-                or (getattr(e, "user_id", None) == current_user.id)  # 레거시 보완
-                or ((e.name or "").strip() in current_names)
-            ):
-                filtered.append(e)
-
-            continue
-
-        # -------------------------------
-        # 일반 휴가 일정 (부서 기준 필터링)
-        # -------------------------------
-        # ✅ 부서 판정은 "대상자(target_user_id)" 우선
-        owner_user = None
-        if getattr(e, "target_user_id", None):
-            owner_user = User.query.get(e.target_user_id)
-        elif e.user_id:
-            owner_user = User.query.get(e.user_id)
-
-        # ✅ department는 DB 값 우선, 없으면 대상자 부서로만 fallback
-        event_dept = (e.department or (owner_user.department if owner_user else "") or "").strip()
-
-        # ✅ 부서가 끝내 판정 안되면 아예 제외(수술실로 잘못 섞이는 것 방지)
-        if not event_dept:
-            continue
-
-        # ✅ superadmin: 선택 부서만
-        if current_user.is_superadmin:
-            if selected_dept and event_dept != selected_dept:
-                continue
-        else:
-            # ✅ 일반/부서관리자: 선택한 부서(내부서 또는 의료진)만
-            if event_dept != selected_dept:
-                continue
-
-        # ✅ [핵심] 일반사용자는 "남의 승인대기" 일정은 숨김
-        # - approved=False 이면서 내 일정이 아니면 제외
-        # - 근무자(type=근무자)는 휴가 신청개념이 아니라서 예외 처리(원하면 제거 가능)
-        if (not current_user.is_admin) and (not current_user.is_superadmin):
-            if (getattr(e, "approved", False) is False) and (e.type != "근무자") and (not _is_mine_event(e)):
-                continue
-
-        filtered.append(e)
-
-    
-    # 3) my_only 필터링 (⭐ 근무자 일정 포함해서 정확히 처리)
-    if my_only:
-        original = filtered
-        filtered = []
-
-        current_names = set([
-            current_user.first_name,
-            current_user.name,
-            current_user.username
-        ])
-
-        for e in original:
-
-            # ⭐ 근무자 일정 → name 값(근무자 이름)이 현재 사용자와 일치해야 내 근무로 판단
-            if e.type == "근무자":
-                if e.name in current_names:
-                    filtered.append(e)
-                continue
-
-            # ⭐ 일반 휴가 일정
-            is_mine = (
-                (getattr(e, "target_user_id", None) == current_user.id)
-                # ✅ 레거시(옛 데이터)만 user_id로 보완: target_user_id가 없을 때만 인정
-                or (getattr(e, "target_user_id", None) in (None, 0) and e.user_id == current_user.id)
-                or (e.name in current_names)
-            )
-
+    selected_dept = resolve_selected_dept(
+        current_user, request.args.get("dept"), session.get("department")
+    )
 
-            if is_mine:
-                filtered.append(e)
+    # 1~3) 부서 / 탄력근무 / 승인대기 / 내 일정 규칙을 SQL 조건 하나로 조회
+    # - start/end 가 오면 화면에 보이는 기간과 겹치는 일정만
+    filtered = visible_events_query(
+        current_user,
+        selected_dept,
+        my_only=my_only,
+        start=parse_date_arg(request.args.get("start")),
+        end=parse_date_arg(request.args.get("end")),
+    ).all()
 
     # -------------------------------
     # 4) 출력 변환
@@ -488,18 +361,26 @@ def pending_requests(date):
         Vacation.approved == False
     ).all()
 
+    # department가 비어있는 레거시 데이터는 대상자/작성자 부서로 보완
+    # - 필요한 직원 부서를 한 번에 조회 (일정마다 User 조회하지 않음)
+    lookup_ids = {
+        uid
+        for v in pending_list if not (v.department or "").strip()
+        for uid in (v.target_user_id, v.user_id) if uid
+    }
+    dept_by_user = dict(
+        db.session.query(User.id, User.department).filter(User.id.in_(lookup_ids)).all()
+    ) if lookup_ids else {}
+
     # 4) 응답에서 "부서"로 최종 필터링 (✅ 서버에서 섞임 차단)
     result = []
     for v in pending_list:
         v_dept = (getattr(v, "department", None) or "").strip()
 
-        # department가 비어있는 레거시 데이터는 대상자/작성자 부서로 보완
         if not v_dept and getattr(v, "target_user_id", None):
-            tu = User.query.get(v.target_user_id)
-            v_dept = (tu.department if tu else "") or ""
+            v_dept = dept_by_user.get(v.target_user_id) or ""
         if not v_dept and getattr(v, "user_id", None):
-            uu = User.query.get(v.user_id)
-            v_dept = (uu.department if uu else "") or ""
+            v_dept = dept_by_user.get(v.user_id) or ""
 
         v_dept = (v_dept or "").strip()
         if v_dept != dept:
@@ -615,131 +496,48 @@ def reject_request(event_id):
 # ============================================
 # app/calendar_page/routes.py
 
-import requests
 from flask import current_app, jsonify, Blueprint
+from app.calendar_page import holidays as holiday_table
 
 calendar_api_bp = Blueprint("calendar_api", __name__)
 
-@calendar_api_bp.route("/calendar/api/holidays/<int:year>")
-def get_holidays(year):
-    service_key = current_app.config["HOLIDAY_API_KEY"]
-
-    # 🔹 1) 캐시 파일 경로 설정
-    cache_dir = current_app.config.get("HOLIDAY_CACHE_DIR")
-    cache_path = None
-    if cache_dir:
-        cache_path = os.path.join(cache_dir, f"{year}.json")
-
-    # 🔹 2) 캐시 파일이 있으면 그대로 반환
-    if cache_path and os.path.exists(cache_path):
-        try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                cached = json.load(f)
-            # 형식: {"holidays": [...], "holiday_names": {...}}
-            return jsonify(cached)
-        except Exception as e:
-            current_app.logger.exception("Holiday cache read error (%s): %s", year, e)
-            # 캐시 읽기 실패하면 그냥 API 다시 호출하도록 아래로 진행
-
-    # 🔹 3) 캐시가 없거나 읽기 실패 → 기존 방식대로 API 호출
-    url = (
-        "http://apis.data.go.kr/B090041/openapi/service/SpcdeInfoService"
-        "/getHoliDeInfo"
-        f"?serviceKey={service_key}&_type=json&solYear={year}&numOfRows=100"
-    )
-
-    holidays = []          # "YYYY-MM-DD" 리스트
-    holiday_names = {}     # { "YYYY-MM-DD": "설날" } 형식
-
-    try:
-        res = requests.get(url, timeout=5)
-        res.raise_for_status()
-        data = res.json()
-
-        body = data.get("response", {}).get("body", {})
-        items_container = body.get("items")
-
-        if not items_container or isinstance(items_container, str):
-            items = []
-        else:
-            raw_items = items_container.get("item")
-            if raw_items is None:
-                items = []
-            elif isinstance(raw_items, list):
-                items = raw_items
-            else:
-                items = [raw_items]
-
-        EXCLUDE_KEYWORDS = [
-            "선거",
-            "대체",
-            "임시",
-            "대체공휴일",
-        ]
-        RENAME_MAP = {
-            "1월1일": "신정",
-            "기독탄신일": "성탄절",
-        }
-
-        for item in items:
-            if str(item.get("isHoliday", "N")) != "Y":
-                continue
-
-            name = str(item.get("dateName", "")).strip()
-            name = RENAME_MAP.get(name, name)
-
-            if any(kw in name for kw in EXCLUDE_KEYWORDS):
-                continue
-
-            date = str(item.get("locdate", ""))  # YYYYMMDD
-            if len(date) != 8:
-                continue
-
-            ymd = f"{date[:4]}-{date[4:6]}-{date[6:8]}"
-            holidays.append(ymd)
-            holiday_names[ymd] = name
-
-    except Exception as e:
-        current_app.logger.exception("Holiday parse error %s: %s", year, e)
-
-    # 🔁 4) API에서 아무 것도 못 받았으면, 고정 양력 공휴일 fallback
-    if not holidays:
-        FIXED_SOLAR_HOLIDAYS = {
-            "0101": "신정",
-            "0301": "3·1절",
-            "0505": "어린이날",
-            "0606": "현충일",
-            "0815": "광복절",
-            "1003": "개천절",
-            "1009": "한글날",
-            "1225": "성탄절",
-        }
-
-        for md, name in FIXED_SOLAR_HOLIDAYS.items():
-            ymd = f"{year}-{md[:2]}-{md[2:]}"
-            holidays.append(ymd)
-            holiday_names[ymd] = name
-
-        current_app.logger.info(
-            "Holiday API empty for %s → using fixed solar holidays fallback.", year
-        )
-
-    # 🔹 5) 결과 만들기
-    result = {"holidays": holidays, "holiday_names": holiday_names}
-
-    # 🔹 6) 디스크 캐시에 저장 (실패해도 서비스는 정상)
-    if cache_path:
-        try:
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, ensure_ascii=False)
-        except Exception as e:
-            current_app.logger.exception("Holiday cache write error (%s): %s", year, e)
-
-    return jsonify(result)
-
-
+# 연도별 공휴일은 거의 바뀌지 않음 → 브라우저 캐시 7일 + ETag 재검증
+HOLIDAY_MAX_AGE = 60 * 60 * 24 * 7
+# API 실패 fallback 결과는 브라우저에도 짧게만 캐시
+HOLIDAY_FALLBACK_MAX_AGE = 60 * 5
 
 
+def _holiday_response(entry):
+    resp = jsonify(entry["data"])
+    resp.set_etag(entry["etag"])
+    resp.cache_control.public = True
+    resp.cache_control.max_age = (
+        HOLIDAY_FALLBACK_MAX_AGE if entry.get("expires_at") else HOLIDAY_MAX_AGE
+    )
 
+    # If-None-Match 가 같으면 304 (본문 없이)
+    return resp.make_conditional(request)
 
 
+@calendar_api_bp.route("/calendar/api/holidays/<int:year>")
+def get_holidays(year):
+    # 형식: {"holidays": [...], "holiday_names": {...}}
+    return _holiday_response(holiday_table.get_year(year))
+
+
+# URL: /calendar/api/holidays?from=2025&to=2027
+@calendar_api_bp.route("/calendar/api/holidays")
+def get_holidays_range():
+    from_year = request.args.get("from", type=int)
+    to_year = request.args.get("to", type=int) or from_year
+
+    if not from_year or not to_year or to_year < from_year:
+        return jsonify({"status": "error", "message": "from/to 연도를 올바르게 입력하세요."}), 400
+    if to_year - from_year + 1 > holiday_table.MAX_RANGE_YEARS:
+        return jsonify({
+            "status": "error",
+            "message": f"한 번에 최대 {holiday_table.MAX_RANGE_YEARS}년까지 조회할 수 있습니다."
+        }), 400
+
+    # 형식: {"from": 2025, "to": 2027, "holidays": [...], "holiday_names": {...}}
+    return _holiday_response(holiday_table.get_range(from_year, to_year))
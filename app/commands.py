@@ -0,0 +1,122 @@
+# app/commands.py
+"""
+flask CLI 명령 모음 (create_app 에서 register_commands(app) 로 등록)
+
+사용 예)
+    flask --app run init
+    flask --app run seed --departments 10 --users 300 --years 3
+    flask --app run audit-queries
+    flask --app run audit-queries --log access.log --json plans.json
+    flask --app run build-roster --year 2025
+    flask --app run build-roster --year 2025 --month 11 --rebuild
+"""
+import click
+
+
+def register_commands(app):
+
+    # =====================================
+    # 1회성 부팅 작업 (배포/시작 시 1번 - app/boot.py)
+    # =====================================
+    @app.cli.command("init")
+    def init_command():
+        """테이블 생성 + master 계정 + forms 동기화 + 이전 실행의 metrics 워커 파일 정리"""
+        from app.boot import run_boot
+        from app.metrics.store import reset_dir
+
+        result = run_boot(app)
+        # 워커를 띄우기 전(배포당 1번)에만 정리 - 워커 프로세스의 부팅(BOOT_ON_STARTUP)에서는 하지 않음
+        reset_dir(app.config["METRICS_DIR"])
+        click.echo(
+            f"✅ init 완료 (forms 복사 {len(result['copied'])} / 갱신 {len(result['updated'])} / "
+            f"유지 {len(result['kept'])} / 변경없음 {result['unchanged']})"
+        )
+
+    # =====================================
+    # 휴가계 월별 대상자 명단 스냅샷 생성
+    # =====================================
+    @app.cli.command("build-roster")
+    @click.option("--year", type=int, required=True, help="대상 연도")
+    @click.option("--month", type=int, default=None, help="대상 월 (생략 시 1~12월 전체)")
+    @click.option("--rebuild", is_flag=True, help="이미 있는 스냅샷도 다시 생성")
+    def build_roster_command(year, month, rebuild):
+        from app.vacation_form.roster import build_rosters
+
+        months = [month] if month else None
+        written = build_rosters(year, months, rebuild=rebuild)
+
+        for (dept, y, m), count in sorted(written.items(), key=lambda kv: (kv[0][2], kv[0][0])):
+            click.echo(f"  {y}-{m:02d} {dept}: {count}명")
+        click.echo(f"✅ 명단 {len(written)}건 저장 (총 {sum(written.values())}명)")
+
+    # =====================================
+    # 합성 데이터 생성 (로컬 부하 재현용 - app/seed.py)
+    # =====================================
+    @app.cli.command("seed")
+    @click.option("--departments", type=int, default=5, show_default=True, help="부서 수")
+    @click.option("--users", type=int, default=100, show_default=True, help="직원 수")
+    @click.option("--years", type=int, default=2, show_default=True, help="올해 포함 몇 년치 일정")
+    @click.option("--seed", "seed_value", type=int, default=42, show_default=True, help="난수 seed")
+    @click.option("--force", is_flag=True, help="master 외 직원이 이미 있어도 실행")
+    def seed_command(departments, users, years, seed_value, force):
+        from app.models import User
+        from app.seed import SEED_PASSWORD, seed_synthetic
+
+        existing = User.query.filter(User.username != "master").count()
+        if existing and not force:
+            raise click.ClickException(f"직원 {existing}명이 이미 있습니다. 테스트 DB 에서만 --force 로 실행하세요.")
+
+        counts = seed_synthetic(departments=departments, users=users, years=years, seed=seed_value)
+        for table, count in counts.items():
+            click.echo(f"  {table}: {count}")
+        click.echo(f"✅ 합성 데이터 생성 완료 (직원 비밀번호: {SEED_PASSWORD})")
+
+    # =====================================
+    # SQL 실행 계획 점검 (app/profiling/explain.py)
+    # - 요청을 실제로 실행하므로 seed 한 로컬/테스트 DB 에서만
+    # =====================================
+    @app.cli.command("audit-queries")
+    @click.option("--log", "log_file", type=click.File(encoding="utf-8"), default=None,
+                  help="재생할 요청 로그 (access log 또는 '[user_id] 경로' 줄). 생략 시 주요 라우트 목록")
+    @click.option("--all", "show_all", is_flag=True, help="문제 없는 SQL 도 출력")
+    @click.option("--json", "json_path", default="", help="결과 JSON 저장 경로")
+    def audit_queries_command(log_file, show_all, json_path):
+        import json
+
+        from app.profiling.cases import resolve_requests, sample_users
+        from app.profiling.explain import ISSUE_LABELS, audit, parse_request_log
+
+        with app.app_context():
+            if log_file:
+                requests = parse_request_log(log_file, sample_users()["master"])
+            else:
+                requests = resolve_requests(app)
+            report = audit(app, requests)
+
+        click.echo(f"🔎 {report['dialect']} | 요청 {sum(1 for r in requests if r[3])}건 | endpoint {len(report['endpoints'])}개")
+        for endpoint, entries in report["endpoints"].items():
+            flagged = [e for e in entries if e["issues"]]
+            if not flagged and not show_all:
+                continue
+            click.echo(f"\n==================== {endpoint}  (SQL {len(entries)}개, 문제 {len(flagged)}개)")
+            for entry in (entries if show_all else flagged):
+                click.echo("  " + " ".join(entry["sql"].split())[:200])
+                for line in entry["plan"]:
+                    click.echo(f"      {line}")
+                for kind, table, _ in entry["issues"]:
+                    click.echo(f"    ⚠️ {ISSUE_LABELS[kind]}" + (f": {table}" if table else ""))
+
+        click.echo("\n==================== 테이블별 요약")
+        if not report["tables"]:
+            click.echo("✅ 전체 스캔 / 임시 B-tree / 커버링 아닌 인덱스 없음")
+        for table, kinds in sorted(report["tables"].items()):
+            for kind in ISSUE_LABELS:
+                endpoints = kinds.get(kind)
+                if not endpoints:
+                    continue
+                click.echo(f"  {table:<18}{ISSUE_LABELS[kind]:<10} {', '.join(endpoints)}")
+
+        if json_path:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+            click.echo(f"💾 저장: {json_path}")
@@ -0,0 +1,107 @@
+# app/db_tuning.py
+"""
+SQLite 동시성 튜닝 (gunicorn 워커 여러 개 대비)
+
+- 엔진 connect 이벤트에서 연결마다 PRAGMA 적용
+  · journal_mode=WAL     : 읽기와 쓰기가 서로 막지 않음
+  · busy_timeout         : 잠금 시 바로 "database is locked" 대신 대기
+  · synchronous=NORMAL   : WAL 에서 안전하면서 fsync 횟수 감소
+  · mmap_size / cache_size
+- 설정 (config)
+  · SQLITE_WAL, SQLITE_BUSY_TIMEOUT_MS, SQLITE_SYNCHRONOUS, SQLITE_MMAP_SIZE, SQLITE_CACHE_SIZE
+- SQLite 가 아닌 엔진(PostgreSQL 등)에는 아무것도 하지 않음
+
+DB 주소 / 커넥션 풀 (여러 앱 노드가 DB 하나를 공유할 때 PostgreSQL 사용)
+- DATABASE_URL 이 있으면 그 DB, 없으면 기존 SQLite 파일
+- engine_options(): pool_pre_ping / pool_recycle (+ 서버 DB 는 pool_size / max_overflow / pool_timeout)
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+DEFAULTS = {
+    "SQLITE_WAL": True,
+    "SQLITE_BUSY_TIMEOUT_MS": 5000,
+    "SQLITE_SYNCHRONOUS": "NORMAL",
+    "SQLITE_MMAP_SIZE": 256 * 1024 * 1024,   # 256MB
+    "SQLITE_CACHE_SIZE": -20000,             # 음수 = KiB 단위 (약 20MB)
+}
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+POOL_DEFAULTS = {
+    "DB_POOL_SIZE": 5,
+    "DB_MAX_OVERFLOW": 10,
+    "DB_POOL_TIMEOUT": 30,      # 초
+    "DB_POOL_RECYCLE": 1800,    # 초 (서버/프록시가 유휴 연결을 끊기 전에 교체)
+    "DB_POOL_PRE_PING": True,
+}
+
+
+def database_uri(database_url, sqlite_path) -> str:
+    """DATABASE_URL(없으면 SQLite 파일) → SQLAlchemy URI"""
+    url = (database_url or "").strip()
+    if not url:
+        return f"sqlite:///{sqlite_path}"
+    # Heroku/Render 형식 postgres:// → SQLAlchemy 2.x 는 postgresql:// 만 인식
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+def engine_options(uri, config) -> dict:
+    """✅ SQLALCHEMY_ENGINE_OPTIONS (풀 크기는 서버 DB 에만 - SQLite 는 파일 잠금이 한계라 의미 없음)"""
+    opts = {k: config.get(k, v) for k, v in POOL_DEFAULTS.items()}
+
+    options = {
+        "pool_pre_ping": bool(opts["DB_POOL_PRE_PING"]),
+        "pool_recycle": int(opts["DB_POOL_RECYCLE"]),
+    }
+    if make_url(uri).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=int(opts["DB_POOL_SIZE"]),
+            max_overflow=int(opts["DB_MAX_OVERFLOW"]),
+            pool_timeout=int(opts["DB_POOL_TIMEOUT"]),
+        )
+    return options
+
+
+def masked_uri(uri) -> str:
+    """로그 출력용 (비밀번호 가림)"""
+    return make_url(uri).render_as_string(hide_password=True)
+
+
+def sqlite_pragmas(config) -> list:
+    """config → 실행할 PRAGMA 문 목록"""
+    opts = {k: config.get(k, v) for k, v in DEFAULTS.items()}
+
+    pragmas = []
+    if opts["SQLITE_WAL"]:
+        pragmas.append("PRAGMA journal_mode=WAL")
+    pragmas.append(f"PRAGMA busy_timeout={int(opts['SQLITE_BUSY_TIMEOUT_MS'])}")
+
+    sync = str(opts["SQLITE_SYNCHRONOUS"]).upper()
+    if sync in SYNCHRONOUS_MODES:
+        pragmas.append(f"PRAGMA synchronous={sync}")
+
+    pragmas.append(f"PRAGMA mmap_size={int(opts['SQLITE_MMAP_SIZE'])}")
+    pragmas.append(f"PRAGMA cache_size={int(opts['SQLITE_CACHE_SIZE'])}")
+    return pragmas
+
+
+def install_sqlite_tuning(engine, config) -> bool:
+    """✅ engine 에 connect 훅 등록 (SQLite 일 때만). 등록했으면 True"""
+    if engine.dialect.name != "sqlite":
+        return False
+
+    pragmas = sqlite_pragmas(config)
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_conn, connection_record):
+        cur = dbapi_conn.cursor()
+        try:
+            for stmt in pragmas:
+                cur.execute(stmt)
+        finally:
+            cur.close()
+
+    return True
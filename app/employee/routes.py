@@ -14,6 +14,8 @@ from flask_login import login_required, current_user
 from datetime import datetime, date
 from app.employee import employee_bp
 from app.models import User, Vacation
+from app.leave_utils import counted_type, leave_days
+from app.user_cache import invalidate_user
 from app import db
 from sqlalchemy import or_, and_
 import os
@@ -95,25 +97,45 @@ def employee_list():
 
         # 5) 선택된 부서의 직원 목록
         if current_dept == "all":
-            employees_raw = User.query.filter(
+            employees_query = User.query.filter(
                 User.department.isnot(None),
                 User.department != "관리자"
-            ).all()
+            )
         else:
-            employees_raw = User.query.filter_by(department=current_dept).all() if current_dept else []
+            employees_query = User.query.filter_by(department=current_dept) if current_dept else None
 
 
     # 🔹 일반 관리자 / 일반 사용자 → 자기 부서만
     else:
         current_dept = user.department
         departments = None  # 템플릿에서 드롭다운 숨길 때 사용
-        employees_raw = User.query.filter_by(department=current_dept).all() if current_dept else []
+        employees_query = User.query.filter_by(department=current_dept) if current_dept else None
+
+    employees_raw = employees_query.all() if employees_query is not None else []
 
     # =========================
     # 연차 / 대체연차 계산용 뷰 모델
+    # - 승인된 휴가 / 대체연차 이력은 직원마다 조회하지 않고 한 번에 읽어서 나눔
+    #   (직원 수와 관계없이 SQL 문 수 고정)
     # =========================
     from app.models import AltLeaveLog
-    
+    from app.leave_utils import calculate_annual_leave
+
+    vacs_by_emp = {emp.id: [] for emp in employees_raw}
+    if employees_raw:
+        emp_ids = employees_query.with_entities(User.id).scalar_subquery()
+        approved_all = Vacation.query.filter(
+            Vacation.approved == True,
+            or_(Vacation.user_id.in_(emp_ids), Vacation.target_user_id.in_(emp_ids))
+        ).all()
+        for v in approved_all:
+            # 작성자/대상자 둘 다 해당 직원이어도 한 번만 차감
+            for uid in {v.user_id, v.target_user_id}:
+                if uid in vacs_by_emp:
+                    vacs_by_emp[uid].append(v)
+
+    logs = AltLeaveLog.query.all() if employees_raw else []
+
     output = []
     for emp in employees_raw:
     
@@ -121,7 +143,6 @@ def employee_list():
         # 1) 총 발생 연차 계산
         # -------------------------
         try:
-            from app.leave_utils import calculate_annual_leave
             total_leave = calculate_annual_leave(emp.join_date)
         except Exception:
             total_leave = float(emp.remaining_days or 0.0)
@@ -132,30 +153,19 @@ def employee_list():
         # -------------------------
         # 2) 승인된 휴가로 사용 연차 계산
         # -------------------------
-        approved_vacs = Vacation.query.filter(
-            Vacation.approved == True,
-            or_(Vacation.user_id == emp.id, Vacation.target_user_id == emp.id)
-        ).all()
+        approved_vacs = vacs_by_emp[emp.id]
     
+        # 기간 중 실제 근무일(주말/공휴일 제외) 기준 차감
         used_from_events = 0.0
         for v in approved_vacs:
-            t = (v.type or "").strip()
-            if t == "연차":
-                used_from_events += 1.0
-            elif t == "토연차":
-                used_from_events += 0.75
-            elif t in ["반차", "반차(전)", "반차(후)"]:
-                used_from_events += 0.5
-            elif t == "반반차":
-                used_from_events += 0.25
+            used_from_events += leave_days(counted_type(v.type), v.start_date, v.end_date,
+                                           v.department or emp.department)
     
         used_total = round(used_before + used_from_events, 2)
     
         # -------------------------
         # 3) 총 발생 대체연차 계산
         # -------------------------
-        logs = AltLeaveLog.query.all()
-    
         name_key = (emp.first_name or emp.name or emp.username or "").strip()
         emp_logs = []
     
@@ -307,7 +317,6 @@ def employee_register():
 
         new_user = User(
             username=username,
-            password=password,
             first_name=first_name,
             last_name=last_name,
             name=full_name,
@@ -320,9 +329,11 @@ def employee_register():
             is_admin=False,
             is_superadmin=False,
         )
+        new_user.set_password(password)
 
         db.session.add(new_user)
         db.session.commit()
+        invalidate_user(new_user.id)
 
         flash("직원 등록이 완료되었습니다.", "success")
         return redirect(url_for("employee.employee_list", dept=department))
@@ -440,7 +451,7 @@ def edit_employee(emp_id):
         # 비밀번호 수정 필드가 있으면 반영 (없으면 그냥 무시돼도 상관 없음)
         password = request.form.get("password")
         if password:
-            emp.password = password
+            emp.set_password(password)
             
         # ✅ 시스템 도입 이전 사용 연차 저장
         used_before = request.form.get("used_before_system", "").strip()
@@ -448,6 +459,7 @@ def edit_employee(emp_id):
 
 
         db.session.commit()
+        invalidate_user(emp.id)
 
         flash("직원 정보가 수정되었습니다.", "success")
         # 수정한 부서로 돌아가도록 dept 파라미터 전달
@@ -473,6 +485,7 @@ def toggle_admin(emp_id):
     emp = User.query.get_or_404(emp_id)
     emp.is_admin = not emp.is_admin
     db.session.commit()
+    invalidate_user(emp.id)
 
     return jsonify({
         "status": "success",
@@ -572,6 +585,7 @@ def delete_employee(emp_id):
 
     db.session.delete(emp)
     db.session.commit()
+    invalidate_user(emp_id)
 
     return jsonify({"status": "success", "message": "직원이 삭제되었습니다."})
 
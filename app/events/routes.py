@@ -1,10 +1,7 @@
 from flask import request, jsonify
 from flask_login import login_required, current_user
-from datetime import datetime
-from app import db
-from app.models import Vacation
-from app.models import User
 from . import events_bp
+from .visibility import parse_date_arg, resolve_selected_dept, visible_events_query
 
 
 @events_bp.route("", methods=["GET"])
@@ -13,51 +10,16 @@ def get_events():
     """FullCalendar에서 일정 가져가는 API (Blueprint 버전)"""
 
     my_only = request.args.get("my") == "1"
-    selected_dept = (
-        request.args.get("dept")
-        or current_user.department
-        or "수술실"
-    )
+    selected_dept = resolve_selected_dept(current_user, request.args.get("dept"))
 
-    query = Vacation.query.join(
-        User, Vacation.user_id == User.id
-    )
-
-    # 총관리자는 부서 선택 가능
-    if current_user.is_superadmin:
-        query = query.filter(User.department == selected_dept)
-    else:
-        query = query.filter(User.department == current_user.department)
-
-    # 내 일정만 보기
-    if my_only:
-        my_names = {
-            current_user.first_name,
-            current_user.name,
-            current_user.username
-        }
-
-        query = query.filter(
-            (
-                # 1) 일반 휴가 → 내가 신청한 일정
-                (Vacation.type != "근무자") &
-                (
-                    (Vacation.user_id == current_user.id) |
-                    (Vacation.target_user_id == current_user.id) |
-                    (Vacation.name.in_(my_names))
-                )
-            )
-            |
-            (
-                # 2) 근무자 일정 → name 이 나일 때만!
-                (Vacation.type == "근무자") &
-                (Vacation.name.in_(my_names))
-            )
-        )
-
-
-
-    events = query.all()
+    # ✅ 캘린더(/calendar/events)와 같은 노출 규칙 (SQL 조건 하나)
+    events = visible_events_query(
+        current_user,
+        selected_dept,
+        my_only=my_only,
+        start=parse_date_arg(request.args.get("start")),
+        end=parse_date_arg(request.args.get("end")),
+    ).all()
 
     # 일정 색상
     color_map = {
@@ -107,16 +69,6 @@ def get_events():
         if not approved:
             title += " [신청]"
 
-
-        # 승인되지 않은 일정은 관리자/본인만 표시
-        is_my_event = (
-            e.user_id == current_user.id or
-            e.target_user_id == current_user.id
-        )
-        if not approved:
-            if not (current_user.is_admin or current_user.is_superadmin or is_my_event):
-                continue
-
         event_list.append({
             "id": e.id,
             "title": title,
@@ -0,0 +1,165 @@
+# app/events/visibility.py
+"""
+일정 노출 규칙 → SQL 조건 1개로 컴파일 (캘린더 /calendar/events 와 /events 공용)
+
+규칙 (기존 캘린더 Python 필터와 동일)
+1) 탄력근무
+   - 총관리자: 노출 안 함
+   - 선택 부서가 내 부서가 아니면 노출 안 함 (의료진 캘린더 등에 섞이지 않게)
+   - 중간관리자: 탄력근무 부서(department, 없으면 대상자 부서) == 내 부서
+   - 일반 사용자: 내 탄력근무만 (대상자/작성자/이름)
+2) 그 외 일정
+   - 일정 부서 = department, 없으면 "대상자(없으면 작성자)" 부서 → 끝내 없으면 제외
+   - 총관리자: 선택 부서만 (선택 없으면 전체) / 그 외: 선택 부서(내 부서 또는 의료진)만
+   - 일반 사용자: 남의 승인대기(approved=False) 일정은 숨김 (근무자 일정은 예외)
+3) my=1 (내 일정만)
+   - 근무자 일정: name 이 내 이름(이름/성명/아이디)일 때만
+   - 그 외: 대상자 = 나, 또는 (대상자 없음 & 작성자 = 나), 또는 name 이 내 이름
+※ NULL 이 섞여도 결과가 흔들리지 않도록 coalesce 로 감싸서 비교
+"""
+from datetime import date
+
+from sqlalchemy import and_, case, false, func, or_, true
+from sqlalchemy.orm import aliased
+
+from app.models import Vacation, User
+
+FLEX_TYPE = "탄력근무"
+WORKER_TYPE = "근무자"
+
+# 일반/부서관리자가 볼 수 있는 추가 부서
+SHARED_DEPARTMENTS = ("의료진",)
+
+
+def resolve_selected_dept(viewer, requested=None, fallback=None):
+    """요청 부서 → 실제 조회 부서 (총관리자 외에는 내 부서/의료진만 허용)"""
+    selected = requested or fallback or viewer.department
+    if not viewer.is_superadmin:
+        allowed = {viewer.department, *SHARED_DEPARTMENTS}
+        if selected not in allowed:
+            selected = viewer.department
+    return selected
+
+
+def parse_date_arg(value):
+    """FullCalendar start/end ("2026-09-28" 또는 "2026-09-28T00:00:00+09:00") → date, 없거나 오류면 None"""
+    try:
+        return date.fromisoformat((value or "")[:10])
+    except ValueError:
+        return None
+
+
+def _strip(s):
+    return (s or "").strip()
+
+
+def _in_names(column, names):
+    """column IN names (names 에 None 이 있으면 column IS NULL 도 일치로 취급)"""
+    values = [n for n in names if n is not None]
+    conds = [column.in_(values)] if values else []
+    if any(n is None for n in names):
+        conds.append(column.is_(None))
+    return or_(*conds) if conds else false()
+
+
+def visibility_predicate(viewer, selected_dept, my_only: bool = False, owner=None):
+    """
+    ✅ viewer(current_user) 기준 노출 조건 (SQL expression)
+    - owner: 대상자(없으면 작성자) User alias → visible_events_query 에서 outer join
+    """
+    v = Vacation
+    uid = viewer.id
+    my_dept = _strip(viewer.department)
+    is_super = bool(viewer.is_superadmin)
+    is_admin = bool(viewer.is_admin)
+
+    stripped_names = {_strip(viewer.first_name), _strip(viewer.name), _strip(viewer.username)}
+    raw_names = {viewer.first_name, viewer.name, viewer.username}
+
+    target_id = func.coalesce(v.target_user_id, 0)
+    user_id = func.coalesce(v.user_id, 0)
+    name_stripped = func.trim(func.coalesce(v.name, ""))
+    vtype = func.coalesce(v.type, "")
+
+    # 일반 일정 "내 일정" 판정 (대상자 우선, 레거시는 작성자)
+    is_mine = or_(
+        target_id == uid,
+        and_(target_id == 0, user_id == uid),
+        name_stripped.in_(stripped_names),
+    )
+
+    # -------------------------------
+    # 1) 탄력근무
+    # -------------------------------
+    if is_super or _strip(selected_dept) != my_dept:
+        flex_visible = false()
+    elif is_admin:
+        own_dept = func.trim(func.coalesce(v.department, ""))
+        flex_dept = func.trim(case(
+            (own_dept != "", own_dept),
+            (target_id != 0, func.coalesce(owner.department, "")),
+            else_="",
+        ))
+        flex_visible = flex_dept == my_dept
+    else:
+        flex_visible = or_(target_id == uid, user_id == uid, name_stripped.in_(stripped_names))
+
+    # -------------------------------
+    # 2) 그 외 일정
+    # -------------------------------
+    event_dept = func.trim(func.coalesce(func.nullif(v.department, ""), owner.department, ""))
+    conds = [event_dept != ""]
+
+    if is_super:
+        if selected_dept:
+            conds.append(event_dept == selected_dept)
+    else:
+        conds.append(event_dept == selected_dept)
+
+    if not is_admin and not is_super:
+        pending_of_others = and_(v.approved.is_(False), vtype != WORKER_TYPE, ~is_mine)
+        conds.append(~pending_of_others)
+
+    normal_visible = and_(*conds)
+
+    visible = case((vtype == FLEX_TYPE, flex_visible), else_=normal_visible)
+    pred = visible == true()
+
+    # -------------------------------
+    # 3) 내 일정만
+    # -------------------------------
+    if my_only:
+        mine_strict = or_(
+            target_id == uid,
+            and_(target_id == 0, v.user_id == uid),
+            _in_names(v.name, raw_names),
+        )
+        pred = and_(pred, case(
+            (vtype == WORKER_TYPE, _in_names(v.name, raw_names)),
+            else_=mine_strict,
+        ) == true())
+
+    return pred
+
+
+def visible_events_query(viewer, selected_dept, my_only: bool = False, start=None, end=None):
+    """
+    ✅ 노출 대상 일정 쿼리 (SQL 1회)
+    - start/end(date) 가 있으면 기간이 겹치는 일정만
+    """
+    owner = aliased(User)
+    owner_id = case(
+        (func.coalesce(Vacation.target_user_id, 0) != 0, Vacation.target_user_id),
+        else_=Vacation.user_id,
+    )
+
+    q = (
+        Vacation.query
+        .outerjoin(owner, owner.id == owner_id)
+        .filter(visibility_predicate(viewer, selected_dept, my_only, owner))
+    )
+    if start is not None:
+        q = q.filter(Vacation.end_date >= start)
+    if end is not None:
+        q = q.filter(Vacation.start_date <= end)
+    return q.order_by(Vacation.start_date, Vacation.id)
@@ -1,4 +1,3 @@
-
 from datetime import date, datetime
 
 def _completed_months(start: date, end: date) -> int:
@@ -81,3 +80,138 @@ def calculate_annual_leave(join_date_str: str, basis: date = None) -> int:
                 total += 25            # 21년차 이상 → 계속 25개
 
     return total
+
+
+# =======================================================
+# 휴가 차감 맵 (1일 기준)
+# =======================================================
+DEDUCTION_MAP = {
+    "연차": 1.0,
+    "반차(전)": 0.5,
+    "반차(후)": 0.5,
+    "반반차": 0.25,
+    "병가": 0,
+    "예비군": 0,
+    "탄력근무": 0,
+    "근무자": 0,
+    "토연차": 0.75,
+    "일정": 0,
+}
+
+# 레거시 '반차'(반차(전)/반차(후) 이전 데이터)
+# - 등록 시 차감(add_event)/내 정보는 예전처럼 차감 없음 → DEDUCTION_MAP 에 넣지 않음
+# - 직원 목록 사용 연차 / 근무표 합계는 예전처럼 0.5 로 셈 → counted_type() 으로 반차(전) 취급
+LEGACY_COUNTED_TYPES = {"반차": "반차(전)"}
+
+
+def counted_type(vac_type: str) -> str:
+    """사용 연차 집계용 유형 (레거시 '반차' → '반차(전)')"""
+    t = (vac_type or "").strip()
+    return LEGACY_COUNTED_TYPES.get(t, t)
+
+
+# 토요일 근무 부서 (토요일은 '토연차'만 사용)
+TOYEONCHA_DEPTS = ["원무과", "물리치료실", "영상의학과", "심사과", "외래", "진단검사"]
+
+
+# =======================================================
+# 근무일 계산 엔진 (공휴일 + 요일 비트맵)
+# - 연도별로 하루 1바이트 비트맵과 누적합(prefix sum)을 미리 만들어 둠
+# - 기간 근무일 수 = 누적합 차이 → 기간 길이와 무관하게 O(1) (연도 경계마다 +1)
+# - 공휴일 테이블(etag)이 바뀌면 해당 연도만 다시 계산
+# =======================================================
+WEEKDAY = 1     # 월~금 & 공휴일 아님
+SATURDAY = 2    # 토요일 & 공휴일 아님
+
+_year_calendars = {}   # { year: (holiday_etag, {mask: prefix_list}) }
+
+
+def _build_year_calendar(year: int, holiday_dates):
+    days = (date(year + 1, 1, 1) - date(year, 1, 1)).days
+    holiday_ords = {
+        datetime.strptime(d, "%Y-%m-%d").date().toordinal()
+        for d in holiday_dates
+        if str(d).startswith(f"{year}-")
+    }
+
+    jan1 = date(year, 1, 1).toordinal()
+    first_weekday = date(year, 1, 1).weekday()
+
+    flags = bytearray(days)
+    for i in range(days):
+        if jan1 + i in holiday_ords:
+            continue
+        wd = (first_weekday + i) % 7
+        if wd <= 4:
+            flags[i] = WEEKDAY
+        elif wd == 5:
+            flags[i] = SATURDAY
+
+    prefix = {}
+    for mask in (WEEKDAY, SATURDAY, WEEKDAY | SATURDAY):
+        acc = [0]
+        total = 0
+        for f in flags:
+            if f & mask:
+                total += 1
+            acc.append(total)
+        prefix[mask] = acc
+    return prefix
+
+
+def _year_prefix(year: int, mask: int):
+    from app.calendar_page import holidays as holiday_table
+
+    entry = holiday_table.get_year(year)
+    cached = _year_calendars.get(year)
+    if not cached or cached[0] != entry["etag"]:
+        cached = (entry["etag"], _build_year_calendar(year, entry["data"].get("holidays", [])))
+        _year_calendars[year] = cached
+    return cached[1][mask]
+
+
+def count_days(start: date, end: date, mask: int = WEEKDAY) -> int:
+    """start~end(포함) 중 mask 에 해당하는 날 수 (공휴일 제외)"""
+    if not start or not end or end < start:
+        return 0
+
+    total = 0
+    for y in range(start.year, end.year + 1):
+        seg_start = start if y == start.year else date(y, 1, 1)
+        seg_end = end if y == end.year else date(y, 12, 31)
+        prefix = _year_prefix(y, mask)
+        i = seg_start.timetuple().tm_yday - 1
+        j = seg_end.timetuple().tm_yday
+        total += prefix[j] - prefix[i]
+    return total
+
+
+def dept_workday_mask(dept: str) -> int:
+    """부서 근무요일: 토연차 부서는 토요일도 근무일"""
+    if (dept or "").strip() in TOYEONCHA_DEPTS:
+        return WEEKDAY | SATURDAY
+    return WEEKDAY
+
+
+def count_workdays(start: date, end: date, dept: str = None) -> int:
+    """부서 근무요일 + 공휴일 기준 근무일 수"""
+    return count_days(start, end, dept_workday_mask(dept))
+
+
+def is_workday(d: date, dept: str = None) -> bool:
+    return count_workdays(d, d, dept) == 1
+
+
+def leave_days(vac_type: str, start: date, end: date = None, dept: str = None) -> float:
+    """
+    ✅ 휴가 1건의 실제 차감 일수 (공휴일/대체공휴일 제외)
+    - 토연차: 토요일 수 × 0.75
+    - 그 외 : 부서 근무일 수 × 차감값
+      (토요일 근무 부서(TOYEONCHA_DEPTS)는 기간 중 토요일도 근무일로 차감)
+    """
+    weight = DEDUCTION_MAP.get((vac_type or "").strip(), 0)
+    if not weight:
+        return 0.0
+    end = end or start
+    mask = SATURDAY if (vac_type or "").strip() == "토연차" else dept_workday_mask(dept)
+    return round(count_days(start, end, mask) * weight, 2)
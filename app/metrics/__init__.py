@@ -0,0 +1,8 @@
+from flask import Blueprint
+
+metrics_bp = Blueprint(
+    "metrics",
+    __name__,
+)
+
+from app.metrics import routes  # noqa
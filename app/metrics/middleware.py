@@ -0,0 +1,64 @@
+# app/metrics/middleware.py
+"""
+/metrics 용 계측 등록 (METRICS_ENABLED=1 일 때만 create_app 에서 호출)
+
+- 요청 처리 시간 histogram / 처리 중 요청 수 gauge (before_request / teardown_request)
+- DB 커넥션 풀 대기 시간: TimedQueuePool (SQLALCHEMY_ENGINE_OPTIONS["poolclass"])
+- SQLite busy 실패: Engine handle_error 이벤트
+"""
+import time
+
+from flask import g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.metrics import store
+
+_listening = False
+
+
+class TimedQueuePool(QueuePool):
+    """풀에서 연결을 얻는 데 걸린 시간 기록 (새 연결 생성 시간 포함)"""
+
+    def _do_get(self):
+        t0 = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            store.observe("gaja_db_pool_wait_seconds", time.perf_counter() - t0)
+
+
+def _handle_error(context):
+    msg = str(context.original_exception).lower()
+    if "database is locked" in msg or "database is busy" in msg:
+        store.inc("gaja_db_sqlite_busy_total")
+
+
+def init_metrics(app):
+    """✅ 저장소 초기화 + 요청 훅 + /metrics 블루프린트 등록"""
+    global _listening
+    from app.metrics import metrics_bp
+
+    store.init_store(app.config["METRICS_DIR"], app.config.get("METRICS_FLUSH_SEC", 5.0))
+    if not _listening:
+        event.listen(Engine, "handle_error", _handle_error)
+        _listening = True
+
+    @app.before_request
+    def _metrics_start():
+        g.metrics_start = time.perf_counter()
+        store.gauge_add("gaja_http_requests_in_flight", 1)
+
+    @app.teardown_request
+    def _metrics_finish(exc):
+        start = g.pop("metrics_start", None)
+        if start is None:
+            return
+        store.gauge_add("gaja_http_requests_in_flight", -1)
+        store.observe(
+            "gaja_http_request_duration_seconds", time.perf_counter() - start,
+            endpoint=request.endpoint or "unknown", method=request.method,
+        )
+
+    app.register_blueprint(metrics_bp)
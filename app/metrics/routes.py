@@ -0,0 +1,21 @@
+import hmac
+
+from flask import Response, current_app, jsonify, request
+
+from app.metrics import metrics_bp
+from app.metrics.store import render
+
+
+# =====================================
+# Prometheus scrape (전체 워커 합산)
+# - METRICS_TOKEN 이 있으면 Authorization: Bearer <token> 필요
+# =====================================
+@metrics_bp.route("/metrics")
+def metrics():
+    token = current_app.config.get("METRICS_TOKEN")
+    if token:
+        given = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(given.encode(), token.encode()):
+            return jsonify({"status": "error", "message": "인증이 필요합니다."}), 401
+
+    return Response(render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,258 @@
+# app/metrics/store.py
+"""
+Prometheus 텍스트 형식 지표 (외부 서비스/라이브러리 없이, gunicorn 워커 합산)
+
+- 워커마다 메모리에 누적 → 백그라운드 스레드가 METRICS_FLUSH_SEC 마다 (바뀐 게 있으면)
+  METRICS_DIR/worker_<pid>.json 으로 저장(원자적 교체) → 요청 처리 경로에서는 파일 I/O 없음
+- /metrics 조회 시: 내 값 먼저 저장 → 모든 워커 파일을 읽어 합산
+  · counter / histogram: 종료된 워커 파일도 합산 (값이 줄어들지 않게)
+  · gauge(진행 중 요청 수): 살아있는 워커만
+- METRICS_DIR 은 부팅 작업(app/boot.py)에서 비움
+- 초기화(init_store) 전에는 inc/observe/gauge_add 가 아무것도 하지 않음 → METRICS_ENABLED=0 이면 비용 0
+"""
+import json
+import os
+import threading
+import time
+from functools import wraps
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# name: (type, help, buckets)
+METRICS = {
+    "gaja_http_request_duration_seconds": (
+        "histogram", "요청 처리 시간 (endpoint/method 별)", DEFAULT_BUCKETS),
+    "gaja_http_requests_in_flight": (
+        "gauge", "처리 중인 요청 수", None),
+    "gaja_schedule_export_duration_seconds": (
+        "histogram", "근무표 엑셀 생성 시간 (export_schedule)", (0.1, 0.25, 0.5, 1, 2, 5, 10, 30)),
+    "gaja_holiday_lookups_total": (
+        "counter", "공휴일 연도 조회 (result=hit: 메모리 / miss: source 에서 로드)", None),
+    "gaja_db_pool_wait_seconds": (
+        "histogram", "DB 커넥션 풀에서 연결을 얻기까지 대기 시간",
+        (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30)),
+    "gaja_db_sqlite_busy_total": (
+        "counter", "SQLite busy_timeout 을 넘겨 실패한 문장 수 (database is locked)", None),
+}
+
+_lock = threading.Lock()
+_state = {
+    "dir": None,
+    "flush_sec": 5.0,
+    "pid": None,
+    "dirty": False,
+    "flusher": None,
+    "counters": {},     # {(name, labels): value}
+    "gauges": {},       # {(name, labels): value}
+    "histograms": {},   # {(name, labels): [bucket counts..., sum, count]}
+}
+
+
+def _labels_key(labels: dict):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _check_fork():
+    """fork 된 워커면 부모에게서 물려받은 값 버림"""
+    pid = os.getpid()
+    if _state["pid"] != pid:
+        _state.update(pid=pid, dirty=False, flusher=None, counters={}, gauges={}, histograms={})
+    _state["dirty"] = True
+    if _state["flusher"] is None and _state["dir"] is not None:
+        t = threading.Thread(target=_flush_loop, name="metrics-flush", daemon=True)
+        _state["flusher"] = t
+        t.start()
+
+
+def enabled() -> bool:
+    return _state["dir"] is not None
+
+
+def init_store(metrics_dir: str, flush_sec: float = 5.0):
+    os.makedirs(metrics_dir, exist_ok=True)
+    with _lock:
+        _state.update(dir=metrics_dir, flush_sec=flush_sec)
+        _check_fork()
+
+
+def reset_dir(metrics_dir: str):
+    """이전 실행의 워커 파일 삭제 (flask init 에서만 - 실행 중인 워커가 없을 때)"""
+    if not os.path.isdir(metrics_dir):
+        return
+    for fname in os.listdir(metrics_dir):
+        if fname.startswith("worker_"):
+            try:
+                os.remove(os.path.join(metrics_dir, fname))
+            except OSError:
+                pass
+
+
+# =====================================
+# 기록
+# =====================================
+def inc(name: str, amount: float = 1.0, **labels):
+    if not enabled():
+        return
+    key = (name, _labels_key(labels))
+    with _lock:
+        _check_fork()
+        _state["counters"][key] = _state["counters"].get(key, 0.0) + amount
+
+
+def gauge_add(name: str, amount: float, **labels):
+    if not enabled():
+        return
+    key = (name, _labels_key(labels))
+    with _lock:
+        _check_fork()
+        _state["gauges"][key] = _state["gauges"].get(key, 0.0) + amount
+
+
+def observe(name: str, value: float, **labels):
+    if not enabled():
+        return
+    buckets = METRICS[name][2]
+    key = (name, _labels_key(labels))
+    with _lock:
+        _check_fork()
+        h = _state["histograms"].get(key)
+        if h is None:
+            h = _state["histograms"][key] = [0] * len(buckets) + [0.0, 0]
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                h[i] += 1
+                break
+        h[-2] += value
+        h[-1] += 1
+
+
+def timed(name: str, **labels):
+    """함수 실행 시간을 histogram 에 기록하는 데코레이터"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - t0, **labels)
+        return wrapper
+    return decorator
+
+
+# =====================================
+# 파일 저장 / 합산
+# =====================================
+def _worker_path(pid):
+    return os.path.join(_state["dir"], f"worker_{pid}.json")
+
+
+def _flush_loop():
+    while True:
+        time.sleep(_state["flush_sec"])
+        if _state["dirty"] and _state["pid"] == os.getpid():
+            flush()
+
+
+def flush():
+    if not enabled():
+        return
+    with _lock:
+        if _state["pid"] != os.getpid():
+            return
+        _state["dirty"] = False
+        payload = {
+            "pid": _state["pid"],
+            "counters": [[n, list(map(list, l)), v] for (n, l), v in _state["counters"].items()],
+            "gauges": [[n, list(map(list, l)), v] for (n, l), v in _state["gauges"].items()],
+            "histograms": [[n, list(map(list, l)), h] for (n, l), h in _state["histograms"].items()],
+        }
+    path = _worker_path(payload["pid"])
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def collect() -> dict:
+    """모든 워커 파일 합산 → {"counters": {...}, "gauges": {...}, "histograms": {...}}"""
+    flush()
+    merged = {"counters": {}, "gauges": {}, "histograms": {}}
+
+    for fname in sorted(os.listdir(_state["dir"])):
+        if not (fname.startswith("worker_") and fname.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(_state["dir"], fname), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+
+        for name, labels, value in data.get("counters", []):
+            key = (name, tuple(map(tuple, labels)))
+            merged["counters"][key] = merged["counters"].get(key, 0.0) + value
+        if _pid_alive(int(data.get("pid", 0))):
+            for name, labels, value in data.get("gauges", []):
+                key = (name, tuple(map(tuple, labels)))
+                merged["gauges"][key] = merged["gauges"].get(key, 0.0) + value
+        for name, labels, h in data.get("histograms", []):
+            key = (name, tuple(map(tuple, labels)))
+            cur = merged["histograms"].get(key)
+            merged["histograms"][key] = list(h) if cur is None else [a + b for a, b in zip(cur, h)]
+    return merged
+
+
+# =====================================
+# Prometheus 텍스트 형식
+# =====================================
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _fmt_number(v) -> str:
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return repr(v)
+
+
+def render() -> str:
+    merged = collect()
+    lines = []
+    for name, (mtype, help_text, buckets) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {mtype}")
+
+        if mtype == "histogram":
+            for labels, h in sorted((l, h) for (n, l), h in merged["histograms"].items() if n == name):
+                cumulative = 0
+                for bound, count in zip(buckets, h[:len(buckets)]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', _fmt_number(float(bound)))])} {cumulative}")
+                lines.append(f"{name}_bucket{_fmt_labels(labels, [('le', '+Inf')])} {h[-1]}")
+                lines.append(f"{name}_sum{_fmt_labels(labels)} {_fmt_number(float(h[-2]))}")
+                lines.append(f"{name}_count{_fmt_labels(labels)} {h[-1]}")
+        else:
+            source = merged["counters"] if mtype == "counter" else merged["gauges"]
+            for labels, value in sorted((l, v) for (n, l), v in source.items() if n == name):
+                lines.append(f"{name}{_fmt_labels(labels)} {_fmt_number(float(value))}")
+    return "\n".join(lines) + "\n"
@@ -1,6 +1,8 @@
+import os
 from datetime import datetime, date, timedelta
 from flask_login import UserMixin
 from datetime import datetime
+from sqlalchemy.orm import validates
 from app import db, login_manager
 
 # =====================
@@ -43,7 +45,34 @@ class User(UserMixin, db.Model):
 
     # ✅ NEW: join_date(문자열)과 별개로 Date 타입(안전 마이그레이션)
     join_date_date = db.Column(db.Date, nullable=True)
-    
+
+    # ✅ NEW: 생일 월/일 (생일자 조회용 인덱스) - birthday 문자열 저장 시 자동 동기화
+    birth_month = db.Column(db.Integer, nullable=True)
+    birth_day = db.Column(db.Integer, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_user_birth_month_day", "birth_month", "birth_day"),
+    )
+
+    # ✅ 비밀번호: 해시로 저장 (app/passwords.py)
+    def set_password(self, raw_password: str):
+        from app.passwords import hash_password
+        self.password = hash_password(raw_password)
+
+    def check_password(self, raw_password: str) -> bool:
+        from app.passwords import verify_password
+        return verify_password(self.password, raw_password)
+
+    @validates("birthday")
+    def _sync_birth_month_day(self, key, value):
+        """birthday("YYYY-MM-DD") 가 바뀔 때마다 birth_month/birth_day 갱신 (형식 오류면 None)"""
+        try:
+            bday = datetime.strptime((value or "").strip(), "%Y-%m-%d").date()
+            self.birth_month, self.birth_day = bday.month, bday.day
+        except ValueError:
+            self.birth_month = self.birth_day = None
+        return value
+
     @property
     def total_alt_leave(self):
         from app.models import AltLeaveLog
@@ -91,12 +120,30 @@ class NewHireChecklist(db.Model):
 class AltLeaveLog(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"))
-    grant_date = db.Column(db.DateTime, default=now_kst)   # 부여일
+    grant_date = db.Column(db.DateTime, nullable=False, default=now_kst)   # 부여일 (이력 keyset 정렬 기준)
     apply_date = db.Column(db.Date, nullable=False)                # 적용일자
     reason = db.Column(db.String(255), nullable=True)              # 사유
     add_days = db.Column(db.Float, nullable=False, default=0.0)    # 부여일수
     granted_by = db.Column(db.String(50), nullable=False)          # 부여자 이름
-    department_summary = db.Column(db.String(500), nullable=True)  # 부서 + 부서원 요약 문자열
+    department_summary = db.Column(db.Text, nullable=True)  # 부서 + 부서원 요약 문자열 (인원 많으면 500자 초과)
+
+    # 이력 keyset 페이지 (grant_date desc, id desc)
+    __table_args__ = (
+        db.Index("ix_alt_leave_log_grant_date_id", "grant_date", "id"),
+    )
+
+
+class AltLeaveGrant(db.Model):
+    """대체연차 부여 1건(AltLeaveLog)의 직원별 기록 → 부서별 부여 합계 집계용"""
+    __tablename__ = "alt_leave_grants"
+
+    id = db.Column(db.Integer, primary_key=True)
+    log_id = db.Column(db.Integer, db.ForeignKey("alt_leave_log.id"), nullable=False, index=True)
+    # 예전 이력 백필에서 이름으로 직원을 못 찾으면 NULL (퇴사/삭제 직원)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True, index=True)
+    department = db.Column(db.String(50), nullable=True, index=True)  # 부여 당시 부서
+    add_days = db.Column(db.Float, nullable=False, default=0.0)
+    apply_date = db.Column(db.Date, nullable=False)
 
 class MonthLock(db.Model):
     __tablename__ = "month_locks"
@@ -182,6 +229,7 @@ class DeptMonthExport(db.Model):
     generated_by = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True)
     file_path = db.Column(db.String(255), nullable=True)
     file_version = db.Column(db.Integer, default=1, nullable=False)
+    content_hash = db.Column(db.String(64), nullable=True)   # 생성 당시 내용 해시(변경 없으면 재생성 생략)
 
     __table_args__ = (
         db.UniqueConstraint("department", "year", "month", name="uq_dept_month_export"),
@@ -192,8 +240,10 @@ class DeptMonthExport(db.Model):
 # =====================
 @login_manager.user_loader
 def load_user(user_id):
+    # ✅ 권한 필드 짧은 TTL 캐시 (app/user_cache.py)
+    from app.user_cache import load_user as load_cached_user
     try:
-        return db.session.get(User, int(user_id))
+        return load_cached_user(int(user_id))
     except Exception:
         return None
 
@@ -209,21 +259,22 @@ def init_master():
     master = User.query.filter_by(username="master").first()
 
     if master:
-        master.password = "1234"
+        # ✅ 비밀번호는 건드리지 않음 (재시작마다 초기화되던 문제 수정)
         master.name = "총관리자"
         master.department = "관리자"
         master.is_admin = True
         master.is_superadmin = True
         print("🔁 master 계정 업데이트 완료")
     else:
+        # 최초 생성 시에만 초기 비밀번호 (MASTER_INITIAL_PASSWORD, 없으면 1234)
         master = User(
             username="master",
-            password="1234",
             name="총관리자",
             department="관리자",
             is_admin=True,
             is_superadmin=True,
         )
+        master.set_password(os.environ.get("MASTER_INITIAL_PASSWORD", "1234"))
         db.session.add(master)
         print("✨ master 계정 생성 완료")
 
@@ -9,7 +9,8 @@ from flask_login import login_required, current_user
 from datetime import date, datetime, timedelta
 from app.myinfo import myinfo_bp
 from app.models import User, Vacation, AltLeaveLog
-from app.leave_utils import calculate_annual_leave
+from app.leave_utils import calculate_annual_leave, DEDUCTION_MAP, leave_days
+from app.user_cache import invalidate_user
 
 # ====================================================
 # 내 정보 페이지
@@ -31,7 +32,7 @@ def myinfo():
         if new_address:
             user.address = new_address
         if new_password:
-            user.password = new_password  # 운영 시 해시 추천
+            user.set_password(new_password)
         if new_phone:
             user.phone = new_phone
 
@@ -39,6 +40,7 @@ def myinfo():
         flash(f"{user_name}님의 정보가 수정되었습니다.", "success")
         from app import db
         db.session.commit()
+        invalidate_user(user.id)
 
         return redirect(url_for("myinfo.myinfo"))
 
@@ -50,24 +52,21 @@ def myinfo():
     # 총 발생 연차
     total_leave = calculate_annual_leave(user.join_date)
 
-    # 승인된 휴가만 적용(과거+미래)
-    weights = {
-        "연차": 1.0,
-        "반차(전)": 0.5,
-        "반차(후)": 0.5,
-        "반반차": 0.25,
-        "토연차": 0.75,
-    }
+    # 승인된 휴가만 적용(과거+미래) - 기간 중 실제 근무일 기준
+    deduct_types = [t for t, w in DEDUCTION_MAP.items() if w > 0]
 
     used_before = float(user.used_before_system or 0.0)
 
     approved_events = Vacation.query.filter(
         ((Vacation.user_id == user.id) | (Vacation.target_user_id == user.id)),
         Vacation.approved.is_(True),
-        Vacation.type.in_(weights.keys())
+        Vacation.type.in_(deduct_types)
     ).all()
 
-    used_after = sum(weights.get(v.type, 0) for v in approved_events)
+    used_after = sum(
+        leave_days(v.type, v.start_date, v.end_date, v.department or user.department)
+        for v in approved_events
+    )
     used_total = round(used_before + used_after, 2)
 
     # ------------------------------------------------
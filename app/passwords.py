@@ -0,0 +1,134 @@
+# app/passwords.py
+"""
+비밀번호 해시 (표준 라이브러리 hashlib 만 사용)
+
+- 저장 형식
+  · scrypt$<n>$<r>$<p>$<salt>$<hash>
+  · pbkdf2_sha256$<iterations>$<salt>$<hash>
+  · 접두어가 없으면 예전 평문 저장값 → 로그인 성공 시 해시로 교체(rehash-on-login)
+- 작업 강도(cost)는 config 로 조정 → scripts/bench_login.py 로 측정 후 결정
+  · PASSWORD_HASH_METHOD      : "scrypt"(기본) | "pbkdf2_sha256"
+  · PASSWORD_SCRYPT_N         : scrypt CPU/메모리 비용 (2의 거듭제곱)
+  · PASSWORD_PBKDF2_ITERATIONS: PBKDF2 반복 횟수
+- 설정 cost 가 바뀌면 다음 로그인 때 자동으로 새 cost 로 다시 해시
+"""
+import base64
+import hashlib
+import hmac
+import os
+
+from flask import current_app, has_app_context
+
+DEFAULT_METHOD = "scrypt"
+DEFAULT_SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+DEFAULT_PBKDF2_ITERATIONS = 260000
+
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+METHODS = ("scrypt", "pbkdf2_sha256")
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii")
+
+
+def _unb64(s: str) -> bytes:
+    return base64.b64decode(s.encode("ascii"))
+
+
+def _setting(key: str, default):
+    if has_app_context():
+        return current_app.config.get(key, default)
+    return default
+
+
+def current_params():
+    """현재 설정 기준 (method, cost)"""
+    method = _setting("PASSWORD_HASH_METHOD", DEFAULT_METHOD)
+    if method == "pbkdf2_sha256":
+        return method, int(_setting("PASSWORD_PBKDF2_ITERATIONS", DEFAULT_PBKDF2_ITERATIONS))
+    return "scrypt", int(_setting("PASSWORD_SCRYPT_N", DEFAULT_SCRYPT_N))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    # maxmem 기본값(32MB)을 넘는 n 도 허용 (필요 메모리 ≈ 128 * r * n)
+    return hashlib.scrypt(
+        password.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+        maxmem=128 * r * n * 2 + 1024 * 1024, dklen=HASH_BYTES,
+    )
+
+
+def _pbkdf2(password: str, salt: bytes, iterations: int) -> bytes:
+    return hashlib.pbkdf2_hmac(
+        "sha256", password.encode("utf-8"), salt, iterations, dklen=HASH_BYTES
+    )
+
+
+def hash_password(password: str, method: str = None, cost: int = None) -> str:
+    """✅ 평문 → 저장용 해시 문자열 (method/cost 생략 시 config 값)"""
+    if method is None or cost is None:
+        method, cost = current_params()
+
+    salt = os.urandom(SALT_BYTES)
+    if method == "pbkdf2_sha256":
+        return f"pbkdf2_sha256${cost}${_b64(salt)}${_b64(_pbkdf2(password, salt, cost))}"
+    if method == "scrypt":
+        digest = _scrypt(password, salt, cost, SCRYPT_R, SCRYPT_P)
+        return f"scrypt${cost}${SCRYPT_R}${SCRYPT_P}${_b64(salt)}${_b64(digest)}"
+    raise ValueError(f"unknown password hash method: {method}")
+
+
+def is_hashed(stored: str) -> bool:
+    return bool(stored) and stored.split("$", 1)[0] in METHODS
+
+
+def verify_password(stored: str, password: str) -> bool:
+    """✅ 저장값과 입력 비교 (해시/예전 평문 모두 지원, 상수 시간 비교)"""
+    if not stored or password is None:
+        return False
+
+    if not is_hashed(stored):
+        return hmac.compare_digest(stored.encode("utf-8"), password.encode("utf-8"))
+
+    try:
+        parts = stored.split("$")
+        if parts[0] == "scrypt":
+            _, n, r, p, salt, digest = parts
+            calc = _scrypt(password, _unb64(salt), int(n), int(r), int(p))
+        else:
+            _, iterations, salt, digest = parts
+            calc = _pbkdf2(password, _unb64(salt), int(iterations))
+        return hmac.compare_digest(calc, _unb64(digest))
+    except (ValueError, TypeError):
+        return False
+
+
+def needs_rehash(stored: str) -> bool:
+    """평문이거나 현재 설정과 method/cost 가 다르면 True"""
+    if not is_hashed(stored):
+        return True
+
+    method, cost = current_params()
+    parts = stored.split("$")
+    if parts[0] != method:
+        return True
+    if method == "scrypt":
+        return int(parts[1]) != cost or int(parts[2]) != SCRYPT_R or int(parts[3]) != SCRYPT_P
+    return int(parts[1]) != cost
+
+
+_dummy_hashes = {}
+
+
+def dummy_verify(password: str):
+    """
+    없는 아이디로 로그인 시에도 같은 비용의 해시 계산 → 응답 시간으로 아이디 존재 여부가 드러나지 않게
+    """
+    params = current_params()
+    stored = _dummy_hashes.get(params)
+    if stored is None:
+        stored = _dummy_hashes[params] = hash_password("dummy-password", *params)
+    verify_password(stored, password or "")
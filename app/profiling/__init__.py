@@ -0,0 +1,9 @@
+from flask import Blueprint
+
+profiling_bp = Blueprint(
+    "profiling",
+    __name__,
+    url_prefix="/profiling"
+)
+
+from app.profiling import routes  # noqa
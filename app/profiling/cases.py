@@ -0,0 +1,113 @@
+# app/profiling/cases.py
+"""
+주요 GET 라우트 호출 목록 (SQL 예산 확인 / EXPLAIN 점검 공용)
+
+- scripts/check_query_budget.py : 요청당 SQL 문 수 예산
+- flask audit-queries          : 요청이 실행한 SQL 의 실행 계획 점검
+- ROUTE_CASES 에 없는 라우트 중 URL 인자가 없는 GET 라우트는 master 로 자동 호출
+  (URL 인자가 있으면 경로를 만들 수 없으므로 path=None → "건너뜀")
+- 경로의 {..} 는 현재 DB 데이터(seed 데이터 기준)로 채움
+"""
+from datetime import date, timedelta
+
+from sqlalchemy import case, func, or_
+
+from app import db
+
+# (endpoint, 로그인 사용자, 경로)
+# - 사용자: master / admin(부서관리자) / member(같은 부서 직원)
+ROUTE_CASES = [
+    ("calendar.get_events", "member", "/calendar/events?start={month_start}&end={month_end}"),
+    ("calendar.get_events", "master", "/calendar/events?dept={dept}&start={month_start}&end={month_end}"),
+    ("events.get_events", "member", "/events?start={month_start}&end={month_end}"),
+    ("calendar.pending_requests", "admin", "/calendar/pending_requests/{pending_day}"),
+    ("calendar.pending_requests", "master", "/calendar/pending_requests/{pending_day}?dept={dept}"),
+    ("calendar.month_lock_status", "admin", "/calendar/month_lock/status?dept={dept}&year={year}&month={month}"),
+    ("calendar_api.get_holidays", "member", "/calendar/api/holidays/{year}"),
+    ("calendar_api.get_holidays_range", "member", "/calendar/api/holidays?from={year}&to={year}"),
+    ("employee.employee_list", "master", "/employee/list"),
+    ("employee.employee_list", "master", "/employee/list?dept={dept}&sort=name"),
+    ("employee.employee_list", "admin", "/employee/list"),
+    ("employee.edit_employee", "master", "/employee/edit/{member_id}"),
+    ("employee.check_username", "master", "/employee/check_username?username=seed_00000"),
+    ("myinfo.myinfo", "member", "/myinfo/"),
+    ("altleave.grant_alt_leave", "master", "/altleave/"),
+    ("altleave.grant_alt_leave", "master", "/altleave/?tab=history"),
+    ("birthday.birthday_payouts", "master", "/birthday/api/payouts?year={year}"),
+    ("birthday.birthday_upcoming", "master", "/birthday/api/upcoming?days=60"),
+    ("schedule.export_schedule", "admin", "/schedule/export/{dept}?year={year}&month={month}"),
+    ("vacation.pending_vacations", "admin", "/vacation/pending_vacations"),
+    ("vacation_form.generate", "master", "/vacation_form/generate?year={year}&month={month}&dept={dept}"),
+]
+
+# 호출하지 않는 라우트 (로그아웃/정적 파일/파일 다운로드)
+SKIP_ENDPOINTS = {"static", "auth.logout", "employee.signature_file", "newhire.download_file"}
+
+
+def sample_users() -> dict:
+    """✅ {"master": id, "admin": id, "member": id} (없으면 master 로 대체)"""
+    from app.models import User
+
+    master = User.query.filter_by(username="master").first()
+    master_id = master.id if master else 1
+    admin = (User.query.filter(User.is_admin.is_(True), User.is_superadmin.is_(False))
+             .order_by(User.id).first())
+    member = None
+    if admin:
+        member = (User.query.filter(User.department == admin.department, User.is_admin.is_(False),
+                                    User.employment_status == "재직")
+                  .order_by(User.id).first())
+    return {
+        "master": master_id,
+        "admin": admin.id if admin else master_id,
+        "member": member.id if member else master_id,
+    }
+
+
+def sample_values(users: dict) -> dict:
+    """✅ 경로 {..} 에 채울 값"""
+    from app.models import User, Vacation
+
+    admin = db.session.get(User, users["admin"])
+    dept = (admin.department if admin else None) or "의료진"
+
+    # 승인대기 날짜: 부서 없는 레거시 일정(직원 부서로 보완)이 섞인 날 우선
+    legacy = case((Vacation.department.is_(None) & Vacation.user_id.isnot(None), 1), else_=0)
+    busiest = (
+        db.session.query(Vacation.start_date)
+        .filter(Vacation.approved.is_(False),
+                or_(Vacation.department == dept, Vacation.department.is_(None)))
+        .group_by(Vacation.start_date)
+        .order_by(func.sum(legacy).desc(), func.count().desc(), Vacation.start_date)
+        .first()
+    )
+
+    today = date.today()
+    month_start = today.replace(day=1)
+    return {
+        "dept": dept,
+        "member_id": users["member"],
+        "pending_day": busiest[0] if busiest else today,
+        "year": today.year,
+        "month": today.month,
+        "month_start": month_start - timedelta(days=7),
+        "month_end": month_start + timedelta(days=42),
+    }
+
+
+def resolve_requests(app) -> list:
+    """
+    ✅ [(endpoint, 사용자 구분, 사용자 id, 경로 or None), ...]
+    - app context 안에서 호출 (DB 에서 샘플 사용자/날짜 조회)
+    """
+    users = sample_users()
+    values = sample_values(users)
+
+    requests = [(endpoint, who, users[who], path.format(**values)) for endpoint, who, path in ROUTE_CASES]
+
+    covered = {endpoint for endpoint, _, _ in ROUTE_CASES}
+    for rule in sorted(app.url_map.iter_rules(), key=lambda r: r.rule):
+        if "GET" not in rule.methods or rule.endpoint in covered or rule.endpoint in SKIP_ENDPOINTS:
+            continue
+        requests.append((rule.endpoint, "master", users["master"], None if rule.arguments else rule.rule))
+    return requests
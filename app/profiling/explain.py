@@ -0,0 +1,181 @@
+# app/profiling/explain.py
+"""
+SQL 실행 계획 점검 (flask audit-queries)
+
+- 요청을 test client 로 실행하면서 요청 안에서 실행된 SQL 을 endpoint 별로 수집
+  · 같은 SQL 문(파라미터만 다른 것)은 1번만
+  · 요청 목록: app/profiling/cases.py (SQL 예산 확인과 같은 목록) 또는 요청 로그 재생
+- 수집한 SELECT/UPDATE/DELETE 마다 실행 계획 조회
+  · SQLite     : EXPLAIN QUERY PLAN
+  · PostgreSQL : EXPLAIN (실행하지 않음)
+- 찾는 것 (테이블별로 모아서 → 어디에 인덱스가 필요한지)
+  · full_scan    : 테이블 전체 스캔 (SQLite "SCAN t" / PG "Seq Scan on t")
+  · temp_btree   : 정렬/GROUP BY/DISTINCT 용 임시 B-tree (PG "Sort")
+  · auto_index   : SQLite 가 실행 중에 임시 인덱스를 만듦 (인덱스 없음)
+  · not_covering : 인덱스로 찾은 뒤 테이블을 다시 읽음 (커버링 인덱스 아님)
+"""
+import re
+from collections import OrderedDict
+
+from flask import has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import db
+
+ISSUE_LABELS = {
+    "full_scan": "전체 스캔",
+    "temp_btree": "임시 B-tree",
+    "auto_index": "임시 인덱스",
+    "not_covering": "커버링 아님",
+}
+
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+# 요청 로그 한 줄 → [user_id] 경로
+# - "GET /calendar/events?... HTTP/1.1" 가 들어있는 access log 줄
+# - "5 /myinfo/" / "/employee/list" 처럼 직접 쓴 줄 (user_id 생략 시 master)
+_ACCESS_LOG_RE = re.compile(r'"GET (\S+) HTTP/[\d.]+"')
+
+
+# =====================================
+# 요청 로그 → 요청 목록
+# =====================================
+def parse_request_log(lines, default_user_id: int) -> list:
+    """✅ [(endpoint=None, "log", user_id, 경로), ...] (endpoint 는 실행 후 request.endpoint 로 채움)"""
+    requests = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        m = _ACCESS_LOG_RE.search(line)
+        if m:
+            requests.append((None, "log", default_user_id, m.group(1)))
+            continue
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].isdigit() and parts[1].startswith("/"):
+            requests.append((None, "log", int(parts[0]), parts[1]))
+        elif parts[0].startswith("/"):
+            requests.append((None, "log", default_user_id, parts[0]))
+    return requests
+
+
+# =====================================
+# 요청 실행 + SQL 수집
+# =====================================
+def capture_statements(app, requests) -> "OrderedDict":
+    """✅ { endpoint: { SQL 문: 파라미터 } } (요청 안에서 실행된 SQL 만)"""
+    captured = OrderedDict()
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if executemany or not has_request_context():
+            return
+        endpoint = request.endpoint or request.path
+        captured.setdefault(endpoint, OrderedDict()).setdefault(statement, parameters)
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        for _, _, user_id, path in requests:
+            if path is None:
+                continue
+            client = app.test_client()
+            with client.session_transaction() as s:
+                s["_user_id"] = str(user_id)
+            client.get(path)
+    finally:
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+    return captured
+
+
+# =====================================
+# 실행 계획
+# =====================================
+def explain(conn, statement: str, parameters) -> list:
+    """✅ 실행 계획 줄 목록"""
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters or ()).fetchall()
+        return [row[-1] for row in rows]
+    rows = conn.exec_driver_sql("EXPLAIN " + statement, parameters or {}).fetchall()
+    return [row[0] for row in rows]
+
+
+def _sqlite_issues(plan: list) -> list:
+    issues = []
+    for detail in plan:
+        if detail.startswith("USE TEMP B-TREE"):
+            issues.append(("temp_btree", None, detail))
+            continue
+        m = re.match(r"(SCAN|SEARCH) (\w+)(?: AS \w+)?(.*)", detail)
+        if not m:
+            continue
+        op, table, rest = m.groups()
+        if "AUTOMATIC" in rest:
+            issues.append(("auto_index", table, detail))
+        elif op == "SCAN" and "COVERING INDEX" not in rest:
+            issues.append(("full_scan", table, detail))
+        elif op == "SEARCH" and "USING INDEX" in rest and "COVERING" not in rest:
+            issues.append(("not_covering", table, detail))
+    return issues
+
+
+def _postgres_issues(plan: list) -> list:
+    issues = []
+    for detail in plan:
+        line = detail.strip().lstrip("->").strip()
+        m = re.match(r"Seq Scan on (\w+)", line)
+        if m:
+            issues.append(("full_scan", m.group(1), line))
+            continue
+        if line.startswith(("Sort ", "Incremental Sort ")):
+            issues.append(("temp_btree", None, line))
+            continue
+        m = re.match(r"Index Scan(?: Backward)? using \w+ on (\w+)", line)
+        if m:
+            issues.append(("not_covering", m.group(1), line))
+    return issues
+
+
+def plan_issues(dialect: str, plan: list) -> list:
+    """✅ [(종류, 테이블 or None, 계획 줄), ...]"""
+    return _sqlite_issues(plan) if dialect == "sqlite" else _postgres_issues(plan)
+
+
+# =====================================
+# 전체 점검
+# =====================================
+def audit(app, requests) -> dict:
+    """
+    ✅ 요청 실행 → SQL 수집 → 실행 계획 점검
+    {
+      "dialect": "sqlite",
+      "endpoints": { endpoint: [ {"sql", "plan", "issues"}, ... ] },
+      "tables": { 테이블: { 종류: [endpoint, ...] } },
+    }
+    """
+    captured = capture_statements(app, requests)
+    dialect = db.engine.dialect.name
+
+    endpoints = OrderedDict()
+    tables = {}
+    with db.engine.connect() as conn:
+        for endpoint, statements in captured.items():
+            entries = []
+            for statement, parameters in statements.items():
+                if statement.lstrip().split(None, 1)[0].upper() not in EXPLAINABLE:
+                    continue
+                try:
+                    plan = explain(conn, statement, parameters)
+                except Exception as e:
+                    conn.rollback()
+                    entries.append({"sql": statement, "plan": [f"EXPLAIN 실패: {e}"], "issues": []})
+                    continue
+                issues = plan_issues(dialect, plan)
+                for kind, table, _ in issues:
+                    users = tables.setdefault(table or "-", {}).setdefault(kind, [])
+                    if endpoint not in users:
+                        users.append(endpoint)
+                entries.append({"sql": statement, "plan": plan, "issues": issues})
+            endpoints[endpoint] = entries
+        conn.rollback()
+
+    return {"dialect": dialect, "endpoints": endpoints, "tables": tables}
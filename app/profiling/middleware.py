@@ -0,0 +1,155 @@
+# app/profiling/middleware.py
+"""
+요청 프로파일링 (opt-in: PROFILING_ENABLED=1)
+
+- 요청마다: 전체 시간(wall), SQL 문 수, SQL 시간
+  · SQLAlchemy before/after_cursor_execute 이벤트로 SQL 측정 (요청 컨텍스트 안의 SQL 만)
+- 느린 요청(PROFILING_SLOW_MS 이상)은 로그에 상위 쿼리와 함께 남김
+  · 같은 SQL 이 여러 번이면 "×횟수" 로 묶어서 → N+1 패턴이 바로 보임
+- endpoint(블루프린트.함수) 별 최근 PROFILING_WINDOW 건을 메모리에 보관 → 백분위 통계
+  · 워커 프로세스별 통계 (워커끼리 합치지 않음)
+"""
+import math
+import threading
+import time
+from collections import deque
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_SLOW_MS = 500
+DEFAULT_WINDOW = 500
+DEFAULT_TOP_QUERIES = 5
+
+_samples = {}   # { endpoint: deque[(wall_ms, sql_count, sql_ms)] (maxlen=PROFILING_WINDOW) }
+_lock = threading.Lock()
+_listening = False
+
+
+# =====================================
+# SQL 측정 (Engine 전역 이벤트 - 1번만 등록)
+# =====================================
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("profiling_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("profiling_start")
+    if not starts:
+        return
+    elapsed = (time.perf_counter() - starts.pop()) * 1000
+
+    if not has_request_context():
+        return
+    prof = g.get("profiling")
+    if prof is None:
+        return
+    prof["sql_count"] += 1
+    prof["sql_ms"] += elapsed
+    prof["queries"].append((statement, elapsed))
+
+
+def _listen_once():
+    global _listening
+    if _listening:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _listening = True
+
+
+# =====================================
+# 집계
+# =====================================
+def top_queries(queries, limit=DEFAULT_TOP_QUERIES):
+    """[(statement, ms)] → 같은 SQL 끼리 묶어 총 시간 순 [(statement, 횟수, 총 ms)]"""
+    grouped = {}
+    for statement, ms in queries:
+        count, total = grouped.get(statement, (0, 0.0))
+        grouped[statement] = (count + 1, total + ms)
+    ranked = sorted(grouped.items(), key=lambda kv: (kv[1][1], kv[1][0]), reverse=True)
+    return [(statement, count, total) for statement, (count, total) in ranked[:limit]]
+
+
+def percentile(sorted_values, p):
+    """nearest-rank 백분위 (sorted_values 는 오름차순)"""
+    if not sorted_values:
+        return 0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def stats():
+    """✅ endpoint 별 {n, wall_ms / sql_count / sql_ms 의 p50·p90·p99·max} (wall p90 큰 순)"""
+    with _lock:
+        snapshot = {endpoint: list(rows) for endpoint, rows in _samples.items()}
+
+    result = []
+    for endpoint, rows in snapshot.items():
+        entry = {"endpoint": endpoint, "n": len(rows)}
+        for idx, key in enumerate(("wall_ms", "sql_count", "sql_ms")):
+            values = sorted(r[idx] for r in rows)
+            entry[key] = {
+                "p50": round(percentile(values, 50), 2),
+                "p90": round(percentile(values, 90), 2),
+                "p99": round(percentile(values, 99), 2),
+                "max": round(values[-1], 2),
+            }
+        result.append(entry)
+    result.sort(key=lambda e: e["wall_ms"]["p90"], reverse=True)
+    return result
+
+
+def reset_stats():
+    with _lock:
+        _samples.clear()
+
+
+# =====================================
+# Flask 등록
+# =====================================
+def init_profiling(app):
+    """✅ before/after_request 훅 + /profiling 블루프린트 등록"""
+    from app.profiling import profiling_bp
+
+    _listen_once()
+    slow_ms = app.config.get("PROFILING_SLOW_MS", DEFAULT_SLOW_MS)
+    window = app.config.get("PROFILING_WINDOW", DEFAULT_WINDOW)
+    top_n = app.config.get("PROFILING_TOP_QUERIES", DEFAULT_TOP_QUERIES)
+
+    @app.before_request
+    def _profiling_start():
+        g.profiling = {"start": time.perf_counter(), "sql_count": 0, "sql_ms": 0.0, "queries": []}
+
+    @app.after_request
+    def _profiling_finish(response):
+        prof = g.pop("profiling", None)
+        if prof is None or request.endpoint in (None, "static"):
+            return response
+
+        wall_ms = (time.perf_counter() - prof["start"]) * 1000
+        endpoint = request.endpoint
+        with _lock:
+            rows = _samples.get(endpoint)
+            if rows is None:
+                rows = _samples[endpoint] = deque(maxlen=window)
+            rows.append((wall_ms, prof["sql_count"], prof["sql_ms"]))
+
+        response.headers["Server-Timing"] = (
+            f"app;dur={wall_ms:.1f}, sql;dur={prof['sql_ms']:.1f};desc=\"{prof['sql_count']} queries\""
+        )
+
+        if wall_ms >= slow_ms:
+            lines = [
+                f"  ×{count} {total:.1f}ms  {' '.join(statement.split())[:300]}"
+                for statement, count, total in top_queries(prof["queries"], top_n)
+            ]
+            app.logger.warning(
+                "Slow request %s %s (%s): %.1fms, SQL %d건 %.1fms\n%s",
+                request.method, request.path, endpoint, wall_ms,
+                prof["sql_count"], prof["sql_ms"], "\n".join(lines),
+            )
+        return response
+
+    app.register_blueprint(profiling_bp)
@@ -0,0 +1,22 @@
+from flask import jsonify, request
+from flask_login import login_required, current_user
+
+from app.profiling import profiling_bp
+from app.profiling.middleware import reset_stats, stats
+
+
+# =====================================
+# endpoint 별 백분위 통계 (총관리자 전용, 이 워커 기준)
+# GET /profiling/stats            → 전체
+# GET /profiling/stats?reset=1    → 조회 후 초기화
+# =====================================
+@profiling_bp.route("/stats")
+@login_required
+def profiling_stats():
+    if not current_user.is_superadmin:
+        return jsonify({"status": "error", "message": "총관리자만 조회할 수 있습니다."}), 403
+
+    data = stats()
+    if request.args.get("reset") == "1":
+        reset_stats()
+    return jsonify({"status": "success", "endpoints": data})
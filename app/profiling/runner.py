@@ -0,0 +1,64 @@
+# app/profiling/runner.py
+"""
+측정용 자식 프로세스 실행 (scripts/bench_endpoints.py / check_query_budget.py / bench_startup.py 공용)
+
+- 측정마다 새 python 프로세스 (모듈 캐시/메모리 캐시 영향 없음)
+- 자식 코드 앞에 CHILD_PRELUDE 를 붙여서 실행
+  · statements : 실행된 SQL 문 목록 (Engine before_cursor_execute)
+  · emit(obj)  : 결과를 stdout 에 "\\n@@" + JSON 으로 출력 → 부모는 마지막 @@ 뒤를 읽음
+- 임시 폴더 경로는 자식 환경변수 PROFILING_TMP (실행이 끝나면 폴더째 삭제)
+  · temp_db=True : 그 안에 빈 SQLite DB (DATABASE_URL)
+  · STORAGE_ROOT 는 환경변수로 바뀌지 않음 → forms/캐시 파일은 로컬 실행과 같은 instance/ 사용
+- 자식 환경: BOOT_ON_STARTUP=1 (빈 DB 생성) / 공휴일 prefetch·프로파일링·metrics 끔 (env 로 덮어쓰기)
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+CHILD_PRELUDE = r'''
+import json, sys
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+statements = []
+event.listen(Engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+
+
+def emit(result):
+    sys.stdout.write("\n@@" + json.dumps(result, default=str))
+'''
+
+
+def run_child(code: str, *args, temp_db: bool = True, env=None):
+    """
+    ✅ 새 프로세스에서 CHILD_PRELUDE + code 실행 → 자식이 emit() 한 값 반환
+    - args: 자식의 sys.argv[1:] (문자열로 변환)
+    - 실패(exit != 0 또는 결과 없음) 시 RuntimeError (자식 stderr 끝부분 포함)
+    """
+    with tempfile.TemporaryDirectory(prefix="profiling_") as tmp:
+        child_env = dict(
+            os.environ,
+            PYTHONPATH=ROOT,
+            PROFILING_TMP=tmp,
+            BOOT_ON_STARTUP="1",
+            HOLIDAY_PREFETCH="0",
+            PROFILING_ENABLED="0",
+            METRICS_ENABLED="0",
+        )
+        if temp_db:
+            child_env["DATABASE_URL"] = "sqlite:///" + os.path.join(tmp, "profiling.db")
+        child_env.update(env or {})
+
+        proc = subprocess.run(
+            [sys.executable, "-c", CHILD_PRELUDE + code, *(str(a) for a in args)],
+            cwd=ROOT, env=child_env, capture_output=True, text=True,
+        )
+
+    if proc.returncode != 0 or "\n@@" not in proc.stdout:
+        raise RuntimeError(proc.stderr[-3000:] or proc.stdout[-3000:])
+    return json.loads(proc.stdout.rsplit("\n@@", 1)[1])
@@ -1,8 +1,9 @@
 from flask import request, jsonify, send_file, current_app
 from flask_login import login_required
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from app.schedule import schedule_bp
 from app.models import User, Vacation, MonthLock
+from app.leave_utils import DEDUCTION_MAP, counted_type, leave_days, count_workdays, is_workday
 from app.schedule.utils import (
     thin_border,
     thin_side,
@@ -13,16 +14,18 @@ import calendar
 import io
 import os
 from app import db
-from openpyxl import load_workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from app.metrics.store import timed
 from copy import copy
-from openpyxl.drawing.image import Image as XLImage
 
-# --- 세로 굵은선 설정용 ---
-THIN = Side(style="thin", color="000000")
-MEDIUM = Side(style="medium", color="000000")
+# ✅ openpyxl / Pillow(openpyxl.drawing.image) 는 근무표 생성 때만 필요
+#    → export_schedule 안에서 import (캘린더 JSON 만 처리하는 워커의 시작 시간 단축)
 
+# --- 세로 굵은선 설정용 ---
 def apply_vertical_border(cell, left=False, right=False):
+    from openpyxl.styles import Border
+    from app.schedule.utils import medium_side
+
+    MEDIUM = medium_side()
     cell.border = Border(
         left=MEDIUM if left else cell.border.left,
         right=MEDIUM if right else cell.border.right,
@@ -30,6 +33,13 @@ def apply_vertical_border(cell, left=False, right=False):
         bottom=cell.border.bottom
     )
 
+def _marks_day(vac_type, d, dept):
+    """기간 일정에서 d 날짜 칸을 채울지 (차감 휴가는 차감되는 날, 병가 등은 부서 근무일)"""
+    vac_type = counted_type(vac_type)
+    if DEDUCTION_MAP.get(vac_type, 0) > 0:
+        return leave_days(vac_type, d, dept=dept) > 0
+    return is_workday(d, dept)
+
 LEFT_MEDIUM_COLS = [1]  # A열 왼쪽 굵은선
 RIGHT_MEDIUM_COLS = [2, 33, 34, 35, 36]  # B, AG, AH, AI, AJ 열 오른쪽 굵은선
 
@@ -39,7 +49,11 @@ RIGHT_MEDIUM_COLS = [2, 33, 34, 35, 36]  # B, AG, AH, AI, AJ 열 오른쪽 굵
 # =========================================================
 @schedule_bp.route("/export/<dept>")
 @login_required
+@timed("gaja_schedule_export_duration_seconds")
 def export_schedule(dept):
+    from openpyxl import load_workbook
+    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+    from openpyxl.drawing.image import Image as XLImage
 
     # ====== 기본 날짜 ======
     year = request.args.get("year", type=int, default=datetime.now().year)
@@ -162,16 +176,14 @@ def export_schedule(dept):
         Vacation.query.filter_by(department=dept)
         .filter(Vacation.approved == True)
         .filter(Vacation.type != "탄력근무")
-        .filter(Vacation.start_date >= first_date, Vacation.start_date <= last_date)
+        # ✅ 월에 걸친 일정 전체 (전월 시작 / 다음달 종료 포함)
+        .filter(Vacation.start_date <= last_date, Vacation.end_date >= first_date)
         .all()
     )
 
     # ====== 이벤트 덮어쓰기 ======
     for e in events:
-        # ✅ 월이 겹치는지(범위 포함) 체크
-        if e.start_date.year != year or e.start_date.month != month:
-            continue
-            
+
         # ✅ 근무자: 레거시 데이터(user_id가 등록자일 수 있음) 때문에 name을 먼저 신뢰
         if e.type == "근무자":
             idx = find_name_index((e.name or "").strip(), names)
@@ -198,62 +210,75 @@ def export_schedule(dept):
             continue
 
         row = 8 + idx
-        col = 3 + e.start_date.day - 1
-
-        value = e.type
-        if value in ["반차(전)", "반차(후)"]:
-            value = "반차"
-
-        weekday = e.start_date.weekday()
 
-        if weekday == 5:  # 토요일
-            if value == "근무자":
-                value = "·"
-            elif value == "토연차":
-                value = "토연차"   # ← 토연차 그대로 표시
-            else:
-                value = "/"        # ← 나머지 토요일 일정만 "/"
+        # ✅ 기간 일정은 이번 달에 걸친 날짜마다 표시
+        # - 하루짜리는 기존처럼 그날 그대로
+        # - 여러 날은 근무일(평일, 토연차는 토요일 / 공휴일 제외)만 표시
+        span_start = max(e.start_date, first_date)
+        span_end = min(e.end_date, last_date)
+        if e.start_date == e.end_date:
+            days = [e.start_date] if first_date <= e.start_date <= last_date else []
+        else:
+            days = [
+                span_start + timedelta(days=k)
+                for k in range((span_end - span_start).days + 1)
+                if _marks_day(e.type, span_start + timedelta(days=k), dept)
+            ]
+
+        for d in days:
+            col = 3 + d.day - 1
+
+            value = e.type
+            if value in ["반차(전)", "반차(후)"]:
+                value = "반차"
+
+            weekday = d.weekday()
+
+            if weekday == 5:  # 토요일
+                if value == "근무자":
+                    value = "·"
+                elif value == "토연차":
+                    value = "토연차"   # ← 토연차 그대로 표시
+                else:
+                    value = "/"        # ← 나머지 토요일 일정만 "/"
 
 
-        cell = ws.cell(row=row, column=col)
-        cell.value = value
+            cell = ws.cell(row=row, column=col)
+            cell.value = value
 
-        # 긴 텍스트 자동 축소
-        if len(str(value)) >= 3:
-            cell.alignment = Alignment(
-                shrinkToFit=True, horizontal="center", vertical="center"
-            )
-        else:
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+            # 긴 텍스트 자동 축소
+            if len(str(value)) >= 3:
+                cell.alignment = Alignment(
+                    shrinkToFit=True, horizontal="center", vertical="center"
+                )
+            else:
+                cell.alignment = Alignment(horizontal="center", vertical="center")
 
-        # 테두리 보정
-        medium = Side(style="medium", color="000000")
-        cell.border = Border(left=thin, right=thin, top=medium, bottom=medium)
+            # 테두리 보정
+            medium = Side(style="medium", color="000000")
+            cell.border = Border(left=thin, right=thin, top=medium, bottom=medium)
 
     # ====== 합계 (AI, AJ) ======
-    weights = {"연차": 1.0, "반차": 0.5, "반반차": 0.25, "토연차": 0.75}
+    # - 이번 달에 걸친 근무일 수 기준 (주말/공휴일 제외, 토연차는 토요일 × 0.75)
     sick_types = ["병가", "예비군"]
 
     for i, user in enumerate(employees):
         row = 8 + i
 
         # 이 직원의 이벤트만 선택 (ID 기반 → 100% 정확)
-        user_events = [
-            v for v in events
-            if v.user_id == user.id and v.start_date.month == month
-        ]
+        user_events = [v for v in events if v.user_id == user.id]
 
-        # 연차 합계 (반차 합치기 / 토연차 0.75 반영)
+        # 연차 합계 (반차 0.5 / 반반차 0.25 / 토연차 0.75 반영)
         total_leave = sum(
-            weights.get(
-                "반차" if v.type in ["반차(전)", "반차(후)"] else v.type,
-                0
-            )
+            leave_days(counted_type(v.type), max(v.start_date, first_date), min(v.end_date, last_date), dept)
             for v in user_events
         )
 
-        # 병가 / 예비군
-        total_sick = sum(1 for v in user_events if v.type in sick_types)
+        # 병가 / 예비군 (근무일 수)
+        total_sick = sum(
+            count_workdays(max(v.start_date, first_date), min(v.end_date, last_date), dept)
+            for v in user_events if v.type in sick_types
+        )
 
         # AI (연차)
         ai = ws[f"AI{row}"]
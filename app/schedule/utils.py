@@ -1,19 +1,36 @@
-from openpyxl.styles import Border, Side, Alignment, PatternFill, Font
 from copy import copy
+from functools import lru_cache
+
+# ✅ openpyxl 은 근무표 생성 때만 필요 → 각 함수에서 처음 쓸 때 import (앱 시작 시간 단축)
 
 
 # ================================================================
-#  공통 스타일 요소
+#  공통 스타일 요소 (처음 호출 시 1번만 생성)
 # ================================================================
-THIN = Side(style="thin", color="000000")
-MEDIUM = Side(style="medium", color="000000")
-SUNDAY_FILL = PatternFill("solid", "FFB0B0")
+@lru_cache(maxsize=None)
+def thin_line():
+    from openpyxl.styles import Side
+    return Side(style="thin", color="000000")
+
+
+@lru_cache(maxsize=None)
+def medium_side():
+    from openpyxl.styles import Side
+    return Side(style="medium", color="000000")
+
+
+@lru_cache(maxsize=None)
+def sunday_fill():
+    from openpyxl.styles import PatternFill
+    return PatternFill("solid", "FFB0B0")
 
 
 # ================================================================
 # 1) 기본 thin 테두리
 # ================================================================
 def thin_border():
+    from openpyxl.styles import Border
+    THIN = thin_line()
     return Border(left=THIN, right=THIN, top=THIN, bottom=THIN)
 
 
@@ -21,6 +38,7 @@ def thin_border():
 # 2) 한쪽만 thin
 # ================================================================
 def thin_side():
+    from openpyxl.styles import Side
     return Side(style="thin", color="000000")
 
 
@@ -28,6 +46,8 @@ def thin_side():
 # 3) 직원 행 테두리: 상하 medium / 좌우 thin
 # ================================================================
 def uniform_mixed_border(cell):
+    from openpyxl.styles import Border
+    THIN, MEDIUM = thin_line(), medium_side()
     cell.border = Border(left=THIN, right=THIN, top=MEDIUM, bottom=MEDIUM)
 
 
@@ -36,6 +56,7 @@ def uniform_mixed_border(cell):
 # ================================================================
 def copy_cell_style(src, tgt):
     """src 셀의 모든 스타일(font, fill, border, alignment)을 tgt에 복사"""
+    from openpyxl.styles import Alignment
 
     if src.has_style:
         tgt.font = copy(src.font)
@@ -52,6 +73,8 @@ def copy_cell_style(src, tgt):
 # ================================================================
 def set_strong_border(cell):
     """A/B열, AI/AJ열 등에 굵은 테두리 적용"""
+    from openpyxl.styles import Border
+    MEDIUM = medium_side()
     cell.border = Border(left=MEDIUM, right=MEDIUM, top=MEDIUM, bottom=MEDIUM)
 
 
@@ -59,7 +82,8 @@ def set_strong_border(cell):
 # 6) 특별한 날짜용 셀 스타일 (일요일)
 # ================================================================
 def set_sunday_style(cell):
-    cell.fill = SUNDAY_FILL
+    from openpyxl.styles import Alignment
+    cell.fill = sunday_fill()
     cell.alignment = Alignment(horizontal="center", vertical="center")
 
 
@@ -108,6 +132,9 @@ def apply_special_day_border(cell, day):
       - 일요일: medium 라인
       - 5일 간격: medium 라인
     """
+    from openpyxl.styles import Border
+    THIN, MEDIUM = thin_line(), medium_side()
+
     is_sunday = (day % 7 == 0)
     is_five_gap = (day % 5 == 0)
 
@@ -0,0 +1,210 @@
+# app/seed.py
+"""
+운영 규모 재현용 합성 데이터 생성 (flask seed / scripts/bench_endpoints.py)
+
+- 부서 N개, 직원 M명 (부서마다 중간관리자 1명), 최근 Y년치 Vacation
+  · 연차/반차/반반차/병가/토연차/일정 + 탄력근무(hours) + 근무자 일정
+  · 레거시 행: user_id/target_user_id 없이 name 만 있는 일정 (부서 있음/없음 섞어서),
+    부서 없이 직원 id 만 있는 일정
+  · 승인/승인대기 섞음
+- AltLeaveLog(+ AltLeaveGrant), MonthLock (지난 달은 잠금)
+- 같은 seed 면 같은 데이터 (random.Random(seed))
+- bulk insert 로 빠르게 (비밀번호 해시는 1번만 계산해서 공유, 모든 직원 비밀번호 = SEED_PASSWORD)
+"""
+import random
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, insert, select, update
+
+from app import db
+
+SEED_PASSWORD = "seed1234"
+USERNAME_PREFIX = "seed_"
+
+LAST_NAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+FIRST_NAMES = ["민준", "서연", "도윤", "지우", "하준", "서윤", "은우", "지민", "시우", "수아",
+               "예준", "하은", "주원", "지유", "유준", "채원", "정우", "다은", "건우", "소율"]
+
+# (type, 가중치)
+VACATION_TYPES = [
+    ("연차", 30), ("반차(전)", 10), ("반차(후)", 10), ("반반차", 5), ("병가", 4),
+    ("토연차", 3), ("일정", 8), ("탄력근무", 15), ("근무자", 15),
+]
+EVENTS_PER_USER_YEAR = 30
+
+
+def _weighted(rng, choices):
+    types, weights = zip(*choices)
+    return rng.choices(types, weights=weights, k=1)[0]
+
+
+def _month_starts(start: date, end: date):
+    d = date(start.year, start.month, 1)
+    while d <= end:
+        yield d
+        d = date(d.year + (d.month == 12), d.month % 12 + 1, 1)
+
+
+def seed_synthetic(departments: int = 5, users: int = 100, years: int = 2, seed: int = 42,
+                   today: date = None, events_per_user_year: int = EVENTS_PER_USER_YEAR) -> dict:
+    """✅ 합성 데이터 생성 → 테이블별 생성 건수"""
+    from app.models import AltLeaveGrant, AltLeaveLog, MonthLock, User, Vacation
+    from app.passwords import hash_password
+    from app.user_cache import invalidate_user
+
+    rng = random.Random(seed)
+    today = today or date.today()
+    first_day = date(today.year - years + 1, 1, 1)
+    last_day = date(today.year, 12, 31)
+    dept_names = [f"부서{i + 1:02d}" for i in range(departments)]
+    password = hash_password(SEED_PASSWORD)
+
+    # -------------------------------
+    # 직원 (부서마다 첫 직원은 중간관리자)
+    # -------------------------------
+    user_rows = []
+    for i in range(users):
+        dept = dept_names[i % departments]
+        last, first = rng.choice(LAST_NAMES), rng.choice(FIRST_NAMES)
+        join = first_day - timedelta(days=rng.randrange(0, 3650))
+        bday = date(rng.randint(1965, 2002), rng.randint(1, 12), rng.randint(1, 28))
+        status = "퇴사" if rng.random() < 0.03 else ("휴직" if rng.random() < 0.03 else "재직")
+        user_rows.append({
+            "username": f"{USERNAME_PREFIX}{i:05d}",
+            "password": password,
+            "last_name": last,
+            "first_name": first,
+            "name": f"{last}{first}",
+            "department": dept,
+            "join_date": join.isoformat(),
+            "join_date_date": join,
+            "birthday": bday.isoformat(),
+            "birth_month": bday.month,
+            "birth_day": bday.day,
+            "remaining_days": 15,
+            "used_before_system": 0,
+            "alt_leave": 0,
+            "is_admin": i < departments,
+            "is_superadmin": False,
+            "employment_status": status,
+            "is_vacation_form_target": True,
+        })
+    db.session.execute(insert(User), user_rows)
+    people = (
+        db.session.query(User.id, User.name, User.department, User.is_admin)
+        .filter(User.username.like(f"{USERNAME_PREFIX}%"))
+        .order_by(User.id)
+        .all()
+    )
+    admins = {dept: uid for uid, _, dept, is_admin in people if is_admin}
+    total_days = (last_day - first_day).days + 1
+
+    # -------------------------------
+    # 일정
+    # -------------------------------
+    vacation_rows = []
+    for uid, name, dept, _ in people:
+        for _ in range(events_per_user_year * years):
+            vtype = _weighted(rng, VACATION_TYPES)
+            start = first_day + timedelta(days=rng.randrange(total_days))
+            length = 0 if vtype in ("반차(전)", "반차(후)", "반반차", "탄력근무", "근무자") else rng.choice((0, 0, 0, 1, 2, 4))
+            row = {
+                "user_id": uid,
+                "target_user_id": uid,
+                "name": name,
+                "department": dept,
+                "start_date": start,
+                "end_date": start + timedelta(days=length),
+                "type": vtype,
+                "approved": rng.random() < (0.5 if start > today else 0.9),
+                "is_flex": vtype == "탄력근무",
+                "hours": rng.choice((1.0, 2.0, 3.0)) if vtype == "탄력근무" else None,
+                "start_time": "08:00" if vtype == "탄력근무" else None,
+                "end_time": "17:00" if vtype == "탄력근무" else None,
+                "memo": None,
+            }
+            roll = rng.random()
+            if roll < 0.08:
+                # 레거시: 이름만 있는 일정 (부서도 비어 있는 경우 섞음)
+                row.update(user_id=None, target_user_id=None, department=dept if roll < 0.05 else None)
+            elif roll < 0.10:
+                # 레거시: 부서 없이 등록된 일정 (대상자/작성자 부서로 보완되는 경우)
+                row["department"] = None
+            elif roll < 0.20:
+                # 중간관리자가 대신 등록한 일정
+                row["user_id"] = admins.get(dept, uid)
+            vacation_rows.append(row)
+    for i in range(0, len(vacation_rows), 5000):
+        db.session.execute(insert(Vacation), vacation_rows[i:i + 5000])
+
+    # -------------------------------
+    # 대체연차 부여 (월 1~2건, 부서 단위)
+    # -------------------------------
+    logs = grants = 0
+    by_dept = {}
+    for uid, name, dept, _ in people:
+        by_dept.setdefault(dept, []).append((uid, name))
+    for month_start in _month_starts(first_day, min(today, last_day)):
+        for _ in range(rng.randint(1, 2)):
+            depts = rng.sample(dept_names, k=min(len(dept_names), rng.randint(1, 2)))
+            add_days = rng.choice((0.5, 1.0, 1.0, 2.0))
+            targets = [(uid, name, d) for d in depts for uid, name in by_dept.get(d, [])]
+            if not targets:
+                continue
+            summary = ", ".join(f"{d}({', '.join(n for _, n in by_dept[d])})" for d in depts)
+            log_id = db.session.execute(
+                insert(AltLeaveLog).values(
+                    grant_date=datetime.combine(month_start + timedelta(days=rng.randrange(28)), datetime.min.time()),
+                    apply_date=month_start,
+                    reason="[seed] 대체근무",
+                    add_days=add_days,
+                    granted_by="총관리자",
+                    department_summary=summary,
+                )
+            ).inserted_primary_key[0]
+            db.session.execute(insert(AltLeaveGrant), [
+                {"log_id": log_id, "user_id": uid, "department": d, "add_days": add_days, "apply_date": month_start}
+                for uid, _, d in targets
+            ])
+            logs += 1
+            grants += len(targets)
+
+    # 직원 대체연차 = 부여 합계
+    db.session.execute(
+        update(User)
+        .where(User.username.like(f"{USERNAME_PREFIX}%"))
+        .values(alt_leave=select(func.coalesce(func.sum(AltLeaveGrant.add_days), 0))
+                .where(AltLeaveGrant.user_id == User.id)
+                .scalar_subquery())
+        .execution_options(synchronize_session=False)
+    )
+
+    # -------------------------------
+    # 월 잠금 (지난 달까지 잠금)
+    # -------------------------------
+    lock_rows = []
+    this_month = date(today.year, today.month, 1)
+    for month_start in _month_starts(first_day, last_day):
+        for dept in dept_names:
+            locked = month_start < this_month
+            lock_rows.append({
+                "department": dept,
+                "year": month_start.year,
+                "month": month_start.month,
+                "locked": locked,
+                "locked_at": datetime.combine(month_start, datetime.min.time()) + timedelta(days=32) if locked else None,
+                "locked_by": admins.get(dept) if locked else None,
+            })
+    db.session.execute(insert(MonthLock), lock_rows)
+
+    db.session.commit()
+    invalidate_user()
+
+    return {
+        "departments": departments,
+        "users": len(people),
+        "vacations": len(vacation_rows),
+        "alt_leave_logs": logs,
+        "alt_leave_grants": grants,
+        "month_locks": len(lock_rows),
+    }
@@ -0,0 +1,103 @@
+# app/user_cache.py
+"""
+로그인 사용자 identity 캐시 (flask-login user_loader 용)
+
+- 매 요청마다 db.session.get(User) 하던 것을 권한 관련 필드만 짧은 TTL 로 캐시
+  (캘린더 화면 1번에 XHR 2~3개 → 사용자 조회 1번)
+- 캐시 적중 시 session.merge(load=False) 로 SELECT 없이 세션에 붙임
+  → current_user 수정 후 commit 도 그대로 동작
+  → 캐시에 없는 필드(주소, 연차 등)는 처음 접근할 때 DB 에서 최신값 로드
+- 무효화: invalidate_user() (직원 수정 / 관리자 권한 변경 / 내정보 수정)
+  → 워커 간 공유를 위해 STORAGE_ROOT/user_cache.stamp 파일 mtime 을 epoch 로 사용
+"""
+import os
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy.orm import make_transient_to_detached
+
+from app import db
+
+# 캐시하는 필드 (권한/표시용)
+CACHED_FIELDS = (
+    "id",
+    "username",
+    "name",
+    "first_name",
+    "last_name",
+    "department",
+    "is_admin",
+    "is_superadmin",
+    "employment_status",
+)
+
+DEFAULT_TTL = 30  # 초
+
+_cache = {}   # { user_id: (expires_at, epoch, {field: value}) }
+_lock = threading.Lock()
+
+
+def _stamp_path():
+    return os.path.join(current_app.config["STORAGE_ROOT"], "user_cache.stamp")
+
+
+def current_epoch() -> int:
+    """직원 정보 변경 epoch (invalidate_user 때마다 바뀜) - 다른 캐시의 무효화 기준으로도 사용"""
+    try:
+        return os.stat(_stamp_path()).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def invalidate_user(user_id=None):
+    """✅ 캐시 무효화 (이 워커는 즉시, 다른 워커는 stamp 파일 변경으로)"""
+    with _lock:
+        if user_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(int(user_id), None)
+
+    try:
+        with open(_stamp_path(), "a"):
+            pass
+        # mtime 해상도가 낮은 파일시스템에서도 값이 바뀌도록 직접 지정
+        os.utime(_stamp_path(), ns=(time.time_ns(), max(time.time_ns(), current_epoch() + 1)))
+    except OSError as e:
+        current_app.logger.warning("User cache stamp update failed: %s", e)
+
+
+def load_user(user_id: int):
+    """캐시 → 없으면 DB 조회 후 권한 필드만 저장"""
+    from app.models import User
+
+    ttl = current_app.config.get("USER_CACHE_TTL", DEFAULT_TTL)
+    if not ttl:
+        return db.session.get(User, user_id)
+
+    now = time.monotonic()
+    epoch = current_epoch()
+    hit = _cache.get(user_id)
+
+    if hit and hit[0] > now and hit[1] == epoch:
+        # 같은 요청 세션에 이미 있으면 그대로 사용
+        existing = db.session.identity_map.get(db.session.identity_key(User, user_id))
+        if existing is not None:
+            return existing
+
+        user = User()
+        for field, value in hit[2].items():
+            setattr(user, field, value)
+        make_transient_to_detached(user)
+        return db.session.merge(user, load=False)
+
+    user = db.session.get(User, user_id)
+    if user is None:
+        with _lock:
+            _cache.pop(user_id, None)
+        return None
+
+    fields = {f: getattr(user, f) for f in CACHED_FIELDS}
+    with _lock:
+        _cache[user_id] = (now + ttl, epoch, fields)
+    return user
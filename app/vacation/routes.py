@@ -5,25 +5,13 @@ from app.vacation import vacation_bp
 from app.models import User, Vacation, MonthLock
 from app import db
 from app.models import now_kst
+from app.leave_utils import DEDUCTION_MAP, TOYEONCHA_DEPTS, leave_days
 from sqlalchemy import or_, func
 
 
 # =======================================================
-# 공용: 휴가 차감 맵
+# 공용: 휴가 차감 맵 / 토연차 부서 → app.leave_utils 로 이동
 # =======================================================
-DEDUCTION_MAP = {
-    "연차": 1.0,
-    "반차(전)": 0.5,
-    "반차(후)": 0.5,
-    "반반차": 0.25,
-    "병가": 0,
-    "예비군": 0,
-    "탄력근무": 0,
-    "근무자": 0,
-    "토연차": 0.75,
-    "일정": 0,
-}
-
 # =======================================================
 # ✅ 공용: 월 확정(잠금) 체크
 # - 잠금된 달이면 "총관리자만" 수정/삭제 가능
@@ -129,8 +117,6 @@ def add_event():
         # =======================================================
         #  🟦 여러 부서 전용 토요일 토연차 규칙 (선택부서 기준)
         # =======================================================
-        TOYEONCHA_DEPTS = ["원무과", "물리치료실", "영상의학과", "심사과", "외래", "진단검사"]
-
         if selected_dept in TOYEONCHA_DEPTS:
             # (1) 토연차는 토요일만 가능
             if vac_type == "토연차" and weekday != 5:
@@ -319,8 +305,9 @@ def add_event():
 
         # =======================================================
         # 🟦 연차 차감 (대체연차 우선)  *일정은 0이라 영향 없음*
+        # - 기간 중 실제 부서 근무일(주말/공휴일 제외) 수 × 차감값
         # =======================================================
-        deduction = DEDUCTION_MAP.get(vac_type, 0)
+        deduction = leave_days(vac_type, start_date, end_date, selected_dept)
 
         try:
             if deduction > 0:
@@ -0,0 +1,307 @@
+# app/vacation_form/generator.py
+"""
+휴가계(직원별) 일괄 생성
+
+흐름
+1) 월 명단(DeptMonthRoster) + 해당 월 승인 휴가를 "쿼리 2번"으로 모두 읽음
+2) 부서별 내용 해시(명단/휴가/셀 위치/기준 폼 파일)를 계산 → DeptMonthExport.content_hash 와 같으면 기존 파일 재사용
+3) 바뀐 부서만 워커 풀에서 직원별 엑셀 생성 (DB 접근 없음, 순수 데이터만 전달)
+4) 결과 파일들을 ZIP 으로 스트리밍
+
+⚠️ 휴가계 기준 폼(vacation_form.xlsx)은 저장소 forms/ 에 없음
+- 운영에서 쓰는 폼을 FORMS_FOLDER 에 두고 VACATION_FORM_TEMPLATE 로 파일명 지정
+- DEFAULT_CELLS 는 임시 배치(제목/부서/이름/기간/내역/합계/서명) → 실제 폼의 셀 위치는
+  VACATION_FORM_CELLS (JSON) 로 덮어씀. 예) {"name": "G3", "leave_start_row": 9}
+"""
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import or_
+
+from app import db
+from app.leave_utils import leave_days
+from app.models import Vacation, DeptMonthExport, now_kst
+from app.vacation_form.roster import load_roster, month_bounds
+
+# ✅ 휴가계 폼 셀 위치 (기본값 - 실제 폼에 맞게 VACATION_FORM_CELLS 로 덮어쓰기)
+DEFAULT_CELLS = {
+    "title": "A1",
+    "department": "C3",
+    "name": "F3",
+    "period": "C4",
+    "leave_start_row": 7,      # 휴가 내역 시작 행
+    "leave_max_rows": 12,      # 폼에 준비된 내역 행 수
+    "col_date": "A",
+    "col_type": "C",
+    "col_days": "E",
+    "total": "E19",
+    "signature": "F21",
+}
+
+# 휴가계에 올라가는 일정 (근무자/탄력근무/일정 제외)
+FORM_EXCLUDED_TYPES = ("근무자", "탄력근무", "일정")
+
+
+def cell_map(overrides=None) -> dict:
+    """기본 셀 위치 + 설정값 (모르는 키는 오류)"""
+    overrides = dict(overrides or {})
+    unknown = set(overrides) - set(DEFAULT_CELLS)
+    if unknown:
+        raise ValueError(f"VACATION_FORM_CELLS 에 모르는 키: {', '.join(sorted(unknown))}")
+    return {**DEFAULT_CELLS, **overrides}
+
+
+def _safe_name(s: str) -> str:
+    return "".join(ch for ch in (s or "") if ch not in '\\/:*?"<>|').strip() or "이름없음"
+
+
+def _display_name(u) -> str:
+    return (u.name or u.first_name or u.username or "").strip()
+
+
+def collect_jobs(year: int, month: int, departments, signatures_dir: str) -> dict:
+    """
+    {부서: [직원별 렌더링 입력(dict), ...]}
+    - 명단은 load_roster (스냅샷 우선)
+    - 휴가는 명단 전체 user_id 로 한 번에 조회
+    """
+    first, last = month_bounds(year, month)
+    roster = load_roster(year, month, departments)
+
+    user_ids = [u.id for members in roster.values() for u in members]
+    dept_of = {u.id: dept for dept, members in roster.items() for u in members}
+    leaves_by_user = {}
+    if user_ids:
+        events = (
+            Vacation.query.filter(
+                Vacation.approved.is_(True),
+                Vacation.type.notin_(FORM_EXCLUDED_TYPES),
+                Vacation.start_date <= last,
+                Vacation.end_date >= first,
+                or_(Vacation.target_user_id.in_(user_ids), Vacation.user_id.in_(user_ids)),
+            )
+            .order_by(Vacation.start_date, Vacation.id)
+            .all()
+        )
+        for v in events:
+            owner = v.target_user_id or v.user_id
+            leaves_by_user.setdefault(owner, []).append({
+                "start": v.start_date.isoformat(),
+                "end": v.end_date.isoformat(),
+                "type": v.type,
+                # 해당 월에 걸친 부서 근무일만 (주말/공휴일 제외)
+                "days": leave_days(v.type, max(v.start_date, first), min(v.end_date, last),
+                                   v.department or dept_of.get(owner)),
+            })
+
+    jobs = {}
+    for dept, members in roster.items():
+        for u in sorted(members, key=lambda x: (x.join_date or "", _display_name(x))):
+            sig = (u.signature_image or "").strip()
+            jobs.setdefault(dept, []).append({
+                "user_id": u.id,
+                "name": _display_name(u),
+                "department": dept,
+                "year": year,
+                "month": month,
+                "leaves": leaves_by_user.get(u.id, []),
+                "signature": sig,
+                "signature_path": os.path.join(signatures_dir, sig) if sig else None,
+            })
+    return jobs
+
+
+def template_digest(template_path: str) -> str:
+    """기준 폼 파일 내용 해시 (폼 파일을 교체하면 모든 부서 재생성)"""
+    h = hashlib.sha256()
+    with open(template_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def dept_content_hash(jobs, cells=None, template_hash: str = "") -> str:
+    """부서 휴가계 내용이 바뀌었는지 판단하는 해시 (명단/휴가/서명 파일명/셀 위치/기준 폼 기준)"""
+    h = hashlib.sha256()
+    h.update(f"{template_hash}\n".encode("utf-8"))
+    h.update(repr(sorted((cells or DEFAULT_CELLS).items())).encode("utf-8"))
+    for j in sorted(jobs, key=lambda x: x["user_id"]):
+        h.update(f"{j['user_id']}|{j['name']}|{j['signature']}\n".encode("utf-8"))
+        for lv in j["leaves"]:
+            h.update(f"  {lv['start']}|{lv['end']}|{lv['type']}|{lv['days']}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def render_form(template_path: str, job: dict, out_dir: str, cells=None) -> str:
+    """직원 1명 휴가계 생성 → 저장 경로 반환 (워커 풀에서 호출)"""
+    from openpyxl import load_workbook
+
+    cells = cells or DEFAULT_CELLS
+    wb = load_workbook(template_path)
+    ws = wb[wb.sheetnames[0]]
+
+    year, month = job["year"], job["month"]
+    ws[cells["title"]] = f"{year}년 {month}월 휴가계"
+    ws[cells["department"]] = job["department"]
+    ws[cells["name"]] = job["name"]
+    ws[cells["period"]] = f"{year}.{month:02d}"
+
+    total = 0.0
+    for i, lv in enumerate(job["leaves"][:cells["leave_max_rows"]]):
+        row = cells["leave_start_row"] + i
+        period = lv["start"] if lv["start"] == lv["end"] else f"{lv['start']} ~ {lv['end']}"
+        ws[f"{cells['col_date']}{row}"] = period
+        ws[f"{cells['col_type']}{row}"] = lv["type"]
+        ws[f"{cells['col_days']}{row}"] = lv["days"]
+    for lv in job["leaves"]:
+        total += float(lv["days"] or 0)
+    ws[cells["total"]] = total
+
+    sig_path = job.get("signature_path")
+    if sig_path and os.path.exists(sig_path):
+        try:
+            from openpyxl.drawing.image import Image as XLImage
+
+            img = XLImage(sig_path)
+            img.width = 115
+            img.height = 64
+            ws.add_image(img, cells["signature"])
+        except Exception:
+            # ✅ Pillow 미설치/이미지 손상이어도 휴가계 자체는 생성
+            pass
+
+    # 동명이인이 같은 부서에 있어도 파일이 겹치지 않게 user_id 포함
+    filename = f"{_safe_name(job['name'])}_{job['user_id']}_휴가계_{year}_{month:02d}.xlsx"
+    path = os.path.join(out_dir, filename)
+    wb.save(path)
+    return path
+
+
+def generate_forms(year: int, month: int, departments, *, template_path: str,
+                   output_root: str, signatures_dir: str, generated_by=None,
+                   force: bool = False, max_workers: int = 4, cells=None) -> dict:
+    """
+    ✅ 부서별 휴가계 생성 + DeptMonthExport 기록
+    - 바뀐 부서는 임시 폴더에 전부 생성한 뒤 기존 폴더와 교체 (rename)
+      → 생성 중 오류가 나도 지난번 파일은 그대로 남음
+    반환: {"files": [(zip 내 경로, 실제 경로), ...], "generated": [부서], "skipped": [부서]}
+    """
+    cells = cell_map(cells)
+    template_hash = template_digest(template_path)
+    jobs_by_dept = collect_jobs(year, month, departments, signatures_dir)
+
+    exports = {
+        e.department: e
+        for e in DeptMonthExport.query.filter_by(year=year, month=month).all()
+    }
+
+    month_dir = os.path.join(output_root, "vacation_forms", f"{year}-{month:02d}")
+    generated, skipped, tasks = [], [], []
+    staging = {}   # { 부서 폴더: 임시 폴더 }
+
+    for dept, jobs in jobs_by_dept.items():
+        digest = dept_content_hash(jobs, cells, template_hash)
+        dept_dir = os.path.join(month_dir, _safe_name(dept))
+        exp = exports.get(dept)
+
+        if (not force and exp and exp.content_hash == digest
+                and exp.file_path and os.path.isdir(exp.file_path)):
+            skipped.append(dept)
+            continue
+
+        # 바뀐 부서는 임시 폴더에 새로 생성 (같은 month_dir 안 → rename 가능)
+        os.makedirs(month_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=f".{_safe_name(dept)}.", dir=month_dir)
+        staging[dept_dir] = tmp_dir
+        tasks.extend((job, tmp_dir) for job in jobs)
+
+        if not exp:
+            exp = DeptMonthExport(department=dept, year=year, month=month, file_version=0)
+            db.session.add(exp)
+        exp.file_version = (exp.file_version or 0) + 1
+        exp.generated_at = now_kst()
+        exp.generated_by = generated_by
+        exp.file_path = dept_dir
+        exp.content_hash = digest
+        exports[dept] = exp
+        generated.append(dept)
+
+    try:
+        if tasks:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                list(pool.map(lambda t: render_form(template_path, t[0], t[1], cells), tasks))
+    except Exception:
+        db.session.rollback()
+        for tmp_dir in staging.values():
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    # 전부 생성된 뒤에만 기존 폴더와 교체
+    for dept_dir, tmp_dir in staging.items():
+        old_dir = None
+        if os.path.isdir(dept_dir):
+            old_dir = tmp_dir + ".old"
+            os.rename(dept_dir, old_dir)
+        os.rename(tmp_dir, dept_dir)
+        if old_dir:
+            shutil.rmtree(old_dir, ignore_errors=True)
+
+    try:
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    files = []
+    for dept in sorted(jobs_by_dept):
+        dept_dir = exports[dept].file_path
+        for fname in sorted(os.listdir(dept_dir)):
+            files.append((f"{_safe_name(dept)}/{fname}", os.path.join(dept_dir, fname)))
+
+    return {"files": files, "generated": generated, "skipped": skipped}
+
+
+class _ZipStream(io.RawIOBase):
+    """seek 불가능한 쓰기 버퍼 → zipfile 이 data descriptor 방식으로 기록"""
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._buf += b
+        return len(b)
+
+    def pop(self) -> bytes:
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+
+def iter_zip(files, chunk_size: int = 64 * 1024):
+    """[(zip 내 경로, 실제 경로)] → ZIP 바이트 청크를 순서대로 yield"""
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for arcname, path in files:
+            with open(path, "rb") as src, zf.open(arcname, mode="w") as dst:
+                while True:
+                    chunk = src.read(chunk_size)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    data = stream.pop()
+                    if data:
+                        yield data
+            data = stream.pop()
+            if data:
+                yield data
+    data = stream.pop()
+    if data:
+        yield data
@@ -0,0 +1,174 @@
+# app/vacation_form/roster.py
+"""
+휴가계 월별 대상자 명단(DeptMonthRoster) 스냅샷 생성/조회
+
+✅ 대상자 기준 (월 단위)
+- is_vacation_form_target = True
+- 총관리자 / '관리자' 부서 제외
+- 휴직자 제외
+- 입사일이 해당 월 말일 이전
+- 퇴사자는 퇴사일이 해당 월 1일 이후인 경우만 포함 (퇴사 월까지는 대상)
+"""
+import calendar
+from datetime import date, datetime
+
+from sqlalchemy import insert
+
+from app import db
+from app.models import User, DeptMonthRoster, now_kst
+
+
+def month_bounds(year: int, month: int):
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, 1), date(year, month, last_day)
+
+
+def _join_date_of(u: User):
+    """join_date_date 우선, 없으면 join_date 문자열 파싱 (실패 시 None)"""
+    if u.join_date_date:
+        return u.join_date_date
+    s = (u.join_date or "").strip()
+    for fmt in ("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d"):
+        try:
+            return datetime.strptime(s, fmt).date()
+        except Exception:
+            pass
+    return None
+
+
+def _candidate_users():
+    """대상자 후보 전체를 한 번의 쿼리로 가져옴 (월별 판정은 메모리에서)"""
+    return (
+        User.query.filter(
+            User.is_vacation_form_target.is_(True),
+            User.is_superadmin.is_(False),
+            User.department.isnot(None),
+            User.department != "관리자",
+            User.employment_status != "휴직",
+        )
+        .all()
+    )
+
+
+def _is_target(u: User, first: date, last: date) -> bool:
+    jd = _join_date_of(u)
+    if jd and jd > last:
+        return False
+
+    if (u.employment_status or "").strip() == "퇴사":
+        # 퇴사일을 모르면 대상에서 제외
+        if not u.resign_date:
+            return False
+        return u.resign_date >= first
+
+    if u.resign_date and u.resign_date < first:
+        return False
+    return True
+
+
+def compute_targets(year: int, month: int, users=None) -> dict:
+    """{부서: [user_id, ...]} 형태로 해당 월 대상자 계산 (DB 기록 없음)"""
+    first, last = month_bounds(year, month)
+    if users is None:
+        users = _candidate_users()
+
+    result = {}
+    for u in users:
+        if not _is_target(u, first, last):
+            continue
+        dept = (u.department or "").strip()
+        result.setdefault(dept, []).append(u.id)
+    return result
+
+
+def build_rosters(year: int, months=None, rebuild: bool = False) -> dict:
+    """
+    ✅ 부서 × 월 대상자 명단을 DeptMonthRoster 에 고정(스냅샷)
+    - months: None 이면 1~12월 전체
+    - rebuild=False: 이미 스냅샷이 있는 (부서, 월)은 건드리지 않음
+    - rebuild=True : 해당 월의 모든 부서 스냅샷을 지우고 다시 생성
+                     (대상자가 없어진 부서의 예전 스냅샷도 남지 않게)
+    - 모든 쓰기는 executemany 기반 bulk insert + 한 번의 commit
+    반환: {(dept, year, month): 기록된 인원수}
+    """
+    months = list(months or range(1, 13))
+    users = _candidate_users()
+
+    existing = set(
+        db.session.query(
+            DeptMonthRoster.department, DeptMonthRoster.year, DeptMonthRoster.month
+        )
+        .filter(DeptMonthRoster.year == year, DeptMonthRoster.month.in_(months))
+        .distinct()
+        .all()
+    )
+
+    rows = []
+    written = {}
+    now = now_kst()
+
+    for m in months:
+        for dept, user_ids in compute_targets(year, m, users).items():
+            key = (dept, year, m)
+            if key in existing and not rebuild:
+                continue
+
+            written[key] = len(user_ids)
+            rows.extend(
+                {
+                    "department": dept,
+                    "year": year,
+                    "month": m,
+                    "user_id": uid,
+                    "created_at": now,
+                }
+                for uid in user_ids
+            )
+
+    try:
+        if rebuild:
+            db.session.query(DeptMonthRoster).filter(
+                DeptMonthRoster.year == year,
+                DeptMonthRoster.month.in_(months),
+            ).delete(synchronize_session=False)
+
+        if rows:
+            db.session.execute(insert(DeptMonthRoster), rows)
+
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return written
+
+
+def load_roster(year: int, month: int, departments=None) -> dict:
+    """
+    ✅ 휴가계 화면용: {부서: [User, ...]}
+    - 스냅샷이 있으면 스냅샷 기준(한 번의 join 쿼리)
+    - 스냅샷이 없는 부서만 실시간 계산으로 보완
+    """
+    q = (
+        db.session.query(DeptMonthRoster.department, User)
+        .join(User, User.id == DeptMonthRoster.user_id)
+        .filter(DeptMonthRoster.year == year, DeptMonthRoster.month == month)
+    )
+    if departments:
+        q = q.filter(DeptMonthRoster.department.in_(departments))
+
+    roster = {}
+    for dept, u in q.all():
+        roster.setdefault(dept, []).append(u)
+
+    wanted = set(departments) if departments else None
+    missing = [d for d in (departments or []) if d not in roster]
+    if missing or not departments:
+        users = _candidate_users()
+        by_id = {u.id: u for u in users}
+        for dept, user_ids in compute_targets(year, month, users).items():
+            if dept in roster or (wanted is not None and dept not in wanted):
+                continue
+            roster[dept] = [by_id[uid] for uid in user_ids]
+
+    return roster
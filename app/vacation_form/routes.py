@@ -1,10 +1,16 @@
 # app/vacation_form/routes.py
 
-from flask import render_template, abort
+import os
+from urllib.parse import quote
+
+from flask import render_template, abort, request, jsonify, current_app, Response, stream_with_context
 from flask_login import login_required, current_user
 
 from app.models import User  # ✅ models.py에 User 모델 존재
 from . import vacation_form_bp
+from .roster import build_rosters, load_roster
+from .status import get_status_matrix, clear_status_cache
+from .generator import generate_forms, iter_zip
 from datetime import date, datetime
 
 
@@ -50,13 +56,118 @@ def index():
     if not getattr(current_user, "is_superadmin", False):
         abort(403)
 
+    today = date.today()
+    year = request.args.get("year", type=int) or today.year
+    month = request.args.get("month", type=int) or today.month
+
+    # ✅ 고정된 월 명단(DeptMonthRoster) 기준, 스냅샷이 없으면 실시간 계산
+    roster = load_roster(year, month, DEPARTMENTS)
+
     dept_map = []
     for dept in DEPARTMENTS:
-        users = User.query.filter_by(department=dept).all()
+        users = list(roster.get(dept, []))
 
         # ✅ 입사일(빠른 순) → 이름(가나다)
         users.sort(key=lambda u: (_join_date_key(getattr(u, "join_date", None)), _display_name(u)))
 
         dept_map.append({"dept": dept, "members": users})
 
-    return render_template("vacation_form/index.html", dept_map=dept_map)
+    return render_template("vacation_form/index.html", dept_map=dept_map, year=year, month=month)
+
+
+# =====================================
+# 월별 대상자 명단 스냅샷 생성 (총관리자 전용)
+# =====================================
+@vacation_form_bp.route("/roster/build", methods=["POST"])
+@login_required
+def build_roster():
+    if not getattr(current_user, "is_superadmin", False):
+        return jsonify({"status": "error", "message": "총관리자만 가능합니다."}), 403
+
+    data = request.get_json(silent=True) or request.form
+    try:
+        year = int(data.get("year") or date.today().year)
+        month = data.get("month")
+        months = [int(month)] if month else None
+    except (TypeError, ValueError):
+        return jsonify({"status": "error", "message": "연/월 값이 올바르지 않습니다."}), 400
+
+    if months and not (1 <= months[0] <= 12):
+        return jsonify({"status": "error", "message": "월은 1~12 사이여야 합니다."}), 400
+
+    rebuild = str(data.get("rebuild", "")).lower() in ("1", "true", "yes")
+    written = build_rosters(year, months, rebuild=rebuild)
+    clear_status_cache()
+
+    return jsonify({
+        "status": "success",
+        "message": f"{year}년 명단 {len(written)}건(부서·월) 저장 완료",
+        "rosters": len(written),
+        "members": sum(written.values()),
+    })
+
+
+# =====================================
+# 월별 확인/최종확인/생성 현황 (총관리자 전용)
+# URL: /vacation_form/status?year=2025
+# =====================================
+@vacation_form_bp.route("/status", methods=["GET"])
+@login_required
+def status():
+    if not getattr(current_user, "is_superadmin", False):
+        return jsonify({"status": "error", "message": "총관리자만 가능합니다."}), 403
+
+    year = request.args.get("year", type=int)
+    return jsonify({"status": "success", "year": year, "rows": get_status_matrix(year)})
+
+
+# =====================================
+# 직원별 휴가계 일괄 생성 → ZIP 다운로드 (총관리자 전용)
+# URL: /vacation_form/generate?year=2025&month=11[&dept=수술실][&force=1]
+# - 내용이 바뀌지 않은 부서는 지난번 생성 파일을 그대로 재사용
+# =====================================
+@vacation_form_bp.route("/generate", methods=["GET", "POST"])
+@login_required
+def generate():
+    if not getattr(current_user, "is_superadmin", False):
+        return jsonify({"status": "error", "message": "총관리자만 가능합니다."}), 403
+
+    today = date.today()
+    year = request.values.get("year", type=int) or today.year
+    month = request.values.get("month", type=int) or today.month
+    if not (1 <= month <= 12):
+        return jsonify({"status": "error", "message": "월은 1~12 사이여야 합니다."}), 400
+
+    dept = (request.values.get("dept") or "").strip()
+    departments = [dept] if dept else DEPARTMENTS
+    force = request.values.get("force") in ("1", "true", "yes")
+
+    template_path = os.path.join(current_app.config["FORMS_FOLDER"], current_app.config["VACATION_FORM_TEMPLATE"])
+    if not os.path.exists(template_path):
+        return jsonify({"error": f"기준 폼이 없습니다: {template_path}"}), 404
+
+    result = generate_forms(
+        year, month, departments,
+        template_path=template_path,
+        output_root=current_app.config["EXCEL_OUTPUT"],
+        signatures_dir=current_app.config["SIGNATURES_FOLDER"],
+        generated_by=current_user.id,
+        force=force,
+        max_workers=current_app.config.get("VACATION_FORM_WORKERS", 4),
+        cells=current_app.config.get("VACATION_FORM_CELLS"),
+    )
+    clear_status_cache()
+
+    current_app.logger.info(
+        "VACATION FORMS %04d-%02d generated=%s skipped=%s files=%s",
+        year, month, result["generated"], result["skipped"], len(result["files"]),
+    )
+
+    filename = f"휴가계_{year}_{month:02d}.zip"
+    resp = Response(stream_with_context(iter_zip(result["files"])), mimetype="application/zip")
+    resp.headers["Content-Disposition"] = (
+        f"attachment; filename=vacation_forms_{year}_{month:02d}.zip; "
+        f"filename*=UTF-8''{quote(filename)}"
+    )
+    resp.headers["Cache-Control"] = "no-store, max-age=0"
+    return resp
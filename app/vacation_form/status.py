@@ -0,0 +1,77 @@
+# app/vacation_form/status.py
+"""
+휴가계 월별 진행 현황(총관리자 대시보드)
+
+✅ 부서 × 월 매트릭스를 "한 번의 GROUP BY 쿼리"로 계산
+- 대상 인원  : DeptMonthRoster 행 수
+- 확인 인원  : 대상자 중 UserMonthConfirm 이 있는 인원
+- 최종확인   : DeptMonthFinal.finalized_at
+- 생성 버전  : DeptMonthExport.file_version
+※ 기준은 명단 스냅샷(DeptMonthRoster) → 먼저 build-roster 로 명단을 고정해야 함
+"""
+import time
+
+from sqlalchemy import and_, func
+
+from app import db
+from app.models import DeptMonthRoster, UserMonthConfirm, DeptMonthFinal, DeptMonthExport
+
+# 짧은 TTL 캐시 (워커 프로세스별)
+STATUS_CACHE_TTL = 30  # 초
+_status_cache = {}
+
+
+def clear_status_cache():
+    _status_cache.clear()
+
+
+def _query_status(year=None):
+    r, c, f, e = DeptMonthRoster, UserMonthConfirm, DeptMonthFinal, DeptMonthExport
+
+    q = (
+        db.session.query(
+            r.department,
+            r.year,
+            r.month,
+            func.count(r.id),
+            func.count(c.id),
+            func.max(f.finalized_at),
+            func.max(e.file_version),
+            func.max(e.generated_at),
+        )
+        .outerjoin(c, and_(c.user_id == r.user_id, c.year == r.year, c.month == r.month))
+        # finals/exports 는 (부서, 연, 월) 유니크 → 1:1 조인이라 count 가 부풀지 않음
+        .outerjoin(f, and_(f.department == r.department, f.year == r.year, f.month == r.month))
+        .outerjoin(e, and_(e.department == r.department, e.year == r.year, e.month == r.month))
+        .group_by(r.department, r.year, r.month)
+        .order_by(r.year, r.month, r.department)
+    )
+    if year:
+        q = q.filter(r.year == year)
+
+    rows = []
+    for dept, y, m, target, confirmed, finalized_at, version, generated_at in q.all():
+        rows.append({
+            "department": dept,
+            "year": y,
+            "month": m,
+            "target": target,
+            "confirmed": confirmed,
+            "finalized": finalized_at is not None,
+            "finalized_at": finalized_at.strftime("%Y-%m-%d %H:%M") if finalized_at else None,
+            "export_version": version,
+            "generated_at": generated_at.strftime("%Y-%m-%d %H:%M") if generated_at else None,
+        })
+    return rows
+
+
+def get_status_matrix(year=None):
+    """(캐시 포함) 부서×월 진행 현황 목록"""
+    now = time.monotonic()
+    hit = _status_cache.get(year)
+    if hit and now - hit[0] < STATUS_CACHE_TTL:
+        return hit[1]
+
+    rows = _query_status(year)
+    _status_cache[year] = (now, rows)
+    return rows
@@ -0,0 +1,21 @@
+# gunicorn.conf.py  (gunicorn 이 실행 디렉토리에서 자동으로 읽음)
+"""
+✅ 부팅 작업(create_all / master / forms 복사)을 master 프로세스에서 1번만 실행
+- on_starting: 워커를 띄우기 전에 `flask --app run init` 을 별도 프로세스로 실행
+- 워커는 BOOT_ON_STARTUP=0 으로 create_app → import/등록만 (DB 쓰기 경쟁 없음)
+"""
+import os
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def on_starting(server):
+    os.environ["BOOT_ON_STARTUP"] = "0"
+
+    env = dict(os.environ, HOLIDAY_PREFETCH="0")
+    subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "run", "init"],
+        cwd=BASE_DIR, env=env, check=True,
+    )
@@ -0,0 +1,174 @@
+"""
+bench_endpoints.py
+
+✅ 하는 일
+- 규모별로 임시 SQLite DB 를 만들고 app/seed.py 로 합성 데이터를 채운 뒤,
+  주요 화면/API 를 Flask test client 로 여러 번 호출해서 응답 시간과 SQL 문 수를 측정
+  · calendar.get_events        (일반 직원, 이번 달 화면 기간)
+  · employee.employee_list     (master)
+  · myinfo.myinfo              (일반 직원)
+  · calendar.pending_requests  (부서관리자, 승인대기가 가장 많은 날)
+  · schedule.export_schedule   (부서관리자, 이번 달 근무표 엑셀)
+- 규모마다 새 프로세스 + 임시 DB (app/profiling/runner.py, 모듈/메모리 캐시 영향 없음, 끝나면 삭제)
+- 결과를 JSON 으로 저장 (git commit 포함) → --compare 로 이전 결과와 비교
+
+사용 예
+    python scripts/bench_endpoints.py
+    python scripts/bench_endpoints.py --scale 5x100 --scale 20x1000 --repeat 20 --out bench.json
+    python scripts/bench_endpoints.py --out after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from app.profiling.runner import run_child  # noqa: E402
+
+DEFAULT_SCALES = ("5x100", "10x300", "20x1000")
+
+CHILD = r"""
+import statistics, time
+from datetime import date, timedelta
+
+from sqlalchemy import func
+
+departments, users, years, repeat = (int(x) for x in sys.argv[1:5])
+
+import run  # noqa: E402  (run.py → create_app(), BOOT_ON_STARTUP=1 → 빈 DB 생성)
+from app import db
+from app.models import User, Vacation
+from app.seed import seed_synthetic
+
+app = run.app
+
+with app.app_context():
+    t0 = time.perf_counter()
+    counts = seed_synthetic(departments=departments, users=users, years=years)
+    seed_sec = time.perf_counter() - t0
+
+    admin = User.query.filter(User.is_admin.is_(True), User.is_superadmin.is_(False)).order_by(User.id).first()
+    member = (User.query.filter(User.department == admin.department, User.is_admin.is_(False),
+                                User.employment_status == "재직")
+              .order_by(User.id).first())
+    today = date.today()
+    busiest = (
+        db.session.query(Vacation.start_date)
+        .filter(Vacation.approved.is_(False), Vacation.department == admin.department)
+        .group_by(Vacation.start_date)
+        .order_by(func.count().desc(), Vacation.start_date)
+        .first()
+    )
+    pending_day = busiest[0] if busiest else today
+    month_start = today.replace(day=1)
+    ids = {"master": 1, "admin": admin.id, "member": member.id}
+
+cases = [
+    ("calendar.get_events", "member",
+     f"/calendar/events?start={month_start - timedelta(days=7)}&end={month_start + timedelta(days=42)}"),
+    ("employee.employee_list", "master", "/employee/list"),
+    ("myinfo.myinfo", "member", "/myinfo/"),
+    ("calendar.pending_requests", "admin", f"/calendar/pending_requests/{pending_day}"),
+    ("schedule.export_schedule", "admin", f"/schedule/export/{admin.department}?year={today.year}&month={today.month}"),
+]
+
+results = {}
+for name, who, path in cases:
+    client = app.test_client()
+    with client.session_transaction() as s:
+        s["_user_id"] = str(ids[who])
+    client.get(path)  # 첫 호출(캐시 채우기/지연 import) 제외
+    times, sql = [], []
+    for _ in range(repeat):
+        statements.clear()
+        t0 = time.perf_counter()
+        resp = client.get(path)
+        times.append((time.perf_counter() - t0) * 1000)
+        sql.append(len(statements))
+        if resp.status_code >= 400:
+            raise SystemExit(f"{name}: HTTP {resp.status_code}")
+    times.sort()
+    results[name] = {
+        "median_ms": statistics.median(times),
+        "p90_ms": times[max(0, -(-len(times) * 9 // 10) - 1)],
+        "sql": max(sql),
+    }
+
+emit({"counts": counts, "seed_sec": seed_sec, "endpoints": results})
+"""
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_scale(scale: str, years: int, repeat: int) -> dict:
+    departments, users = (int(x) for x in scale.lower().split("x"))
+    try:
+        return run_child(CHILD, departments, users, years, repeat)
+    except RuntimeError as e:
+        sys.stderr.write(str(e))
+        raise SystemExit(f"❌ {scale} 측정 실패")
+
+
+def print_scale(scale: str, result: dict, previous: dict | None = None):
+    c = result["counts"]
+    print(f"\n==================== {scale}  (직원 {c['users']}, 일정 {c['vacations']}, seed {result['seed_sec']:.1f}s)")
+    print(f"  {'endpoint':<28}{'median':>10}{'p90':>10}{'SQL':>6}")
+    for name, r in result["endpoints"].items():
+        line = f"  {name:<28}{r['median_ms']:>8.1f}ms{r['p90_ms']:>8.1f}ms{r['sql']:>6d}"
+        before = ((previous or {}).get("endpoints") or {}).get(name)
+        if before:
+            ratio = r["median_ms"] / before["median_ms"] if before["median_ms"] else 0
+            line += f"   (이전 {before['median_ms']:.1f}ms / SQL {before['sql']}, x{ratio:.2f})"
+        print(line)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="합성 데이터로 주요 화면 응답 시간 측정")
+    ap.add_argument("--scale", action="append", default=[],
+                    help=f"부서수x직원수 (여러 번 지정 가능, 기본 {' '.join(DEFAULT_SCALES)})")
+    ap.add_argument("--years", type=int, default=2, help="올해 포함 몇 년치 일정")
+    ap.add_argument("--repeat", type=int, default=10, help="endpoint 별 측정 횟수")
+    ap.add_argument("--out", default="", help="결과 JSON 저장 경로")
+    ap.add_argument("--compare", default="", help="비교할 이전 결과 JSON")
+    args = ap.parse_args()
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f).get("scales", {})
+
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "years": args.years,
+        "repeat": args.repeat,
+        "scales": {},
+    }
+    for scale in args.scale or DEFAULT_SCALES:
+        result = run_scale(scale, args.years, args.repeat)
+        report["scales"][scale] = result
+        print_scale(scale, result, previous.get(scale))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
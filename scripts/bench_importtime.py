@@ -0,0 +1,70 @@
+"""
+bench_importtime.py
+
+✅ 하는 일
+- `python -X importtime -c "import run"` 으로 워커 1개의 앱 import 시간을 측정
+  (BOOT_ON_STARTUP=0 → DB 부팅 작업 제외, 순수 import + create_app)
+- 오래 걸린 모듈 상위 N개 (누적 시간) 출력
+- 시작 시 import 되면 안 되는 무거운 모듈(openpyxl, Pillow, requests)이 있으면 exit 1
+  → 엑셀/서명 이미지/공휴일 API 는 처음 쓸 때 import
+
+사용 예
+    python scripts/bench_importtime.py
+    python scripts/bench_importtime.py --runs 5 --top 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+LAZY_MODULES = ("openpyxl", "PIL", "requests")
+
+
+def importtime_once() -> dict:
+    """{모듈: 누적 us} (마지막 import run 포함)"""
+    env = dict(os.environ, BOOT_ON_STARTUP="0", HOLIDAY_PREFETCH="0", PYTHONPATH=ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import run"],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative, name = (part.strip() for part in line.replace("import time:", "|", 1).split("|"))
+        modules[name] = max(modules.get(name, 0), int(cumulative))
+    return modules
+
+
+def main():
+    ap = argparse.ArgumentParser(description="앱 import 시간 측정 (-X importtime)")
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--top", type=int, default=15, help="출력할 상위 모듈 수")
+    args = ap.parse_args()
+
+    runs = [importtime_once() for _ in range(args.runs)]
+    total_ms = statistics.median(r.get("run", 0) for r in runs) / 1000
+    last = runs[-1]
+
+    print(f"🔎 import run (create_app 포함): median {total_ms:.1f} ms ({args.runs}회)")
+    print(f"\n상위 {args.top}개 (누적 ms)")
+    top = sorted(((us, name) for name, us in last.items() if name != "run"), reverse=True)[: args.top]
+    for us, name in top:
+        print(f"  {us / 1000:8.1f}  {name}")
+
+    loaded = sorted(name for name in last if name.split(".")[0] in LAZY_MODULES)
+    roots = sorted({name.split(".")[0] for name in loaded})
+    if roots:
+        print(f"\n❌ 시작 시 import 된 무거운 모듈: {', '.join(roots)} ({len(loaded)}개 하위 모듈)")
+        sys.exit(1)
+    print(f"\n✅ {', '.join(LAZY_MODULES)} 는 시작 시 import 되지 않음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+bench_login.py
+
+✅ 하는 일
+- 비밀번호 해시 cost 별로 "로그인 1회 검증 시간" 을 측정 (p50 / p95 / max)
+- 출근 교대 시간처럼 동시에 몰리는 로그인을 --concurrency 스레드로 재현
+  (hashlib.scrypt / pbkdf2_hmac 는 계산 중 GIL 을 놓으므로 워커 스레드 상황과 유사)
+- --budget-ms 안에 p95 가 들어오는 가장 높은 cost 를 추천
+
+사용 예
+    python scripts/bench_login.py                              # scrypt N=2^12 ~ 2^16
+    python scripts/bench_login.py --concurrency 8 --budget-ms 250
+    python scripts/bench_login.py --method pbkdf2_sha256 --costs 100000,260000,600000
+
+→ 결정한 값은 환경변수 PASSWORD_HASH_METHOD / PASSWORD_SCRYPT_N / PASSWORD_PBKDF2_ITERATIONS 로 설정
+  (기존 계정은 다음 로그인 때 새 cost 로 자동 재해시)
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.passwords import hash_password, verify_password  # noqa: E402
+
+DEFAULT_COSTS = {
+    "scrypt": [2 ** 12, 2 ** 13, 2 ** 14, 2 ** 15, 2 ** 16],
+    "pbkdf2_sha256": [100000, 260000, 600000, 1000000],
+}
+
+
+def _percentile(values, pct: float) -> float:
+    values = sorted(values)
+    k = max(0, min(len(values) - 1, int(round(pct / 100 * (len(values) - 1)))))
+    return values[k]
+
+
+def bench(method: str, cost: int, samples: int, concurrency: int):
+    stored = hash_password("bench-password-1234", method, cost)
+
+    def one(_):
+        t0 = time.perf_counter()
+        ok = verify_password(stored, "bench-password-1234")
+        assert ok
+        return (time.perf_counter() - t0) * 1000
+
+    t_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        times = list(pool.map(one, range(samples)))
+    wall = time.perf_counter() - t_start
+
+    return {
+        "cost": cost,
+        "p50": statistics.median(times),
+        "p95": _percentile(times, 95),
+        "max": max(times),
+        "throughput": samples / wall,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="비밀번호 해시 cost 별 로그인 검증 시간 측정")
+    ap.add_argument("--method", choices=sorted(DEFAULT_COSTS), default="scrypt")
+    ap.add_argument("--costs", help="쉼표 구분 cost 목록 (scrypt: N, pbkdf2: 반복 횟수)")
+    ap.add_argument("--samples", type=int, default=40, help="cost 별 검증 횟수")
+    ap.add_argument("--concurrency", type=int, default=4, help="동시 로그인 수 (워커 스레드 수)")
+    ap.add_argument("--budget-ms", type=float, default=250.0, help="로그인 검증 p95 허용 시간(ms)")
+    args = ap.parse_args()
+
+    costs = (
+        [int(c) for c in args.costs.split(",") if c.strip()]
+        if args.costs else DEFAULT_COSTS[args.method]
+    )
+
+    print(f"🔎 method={args.method} samples={args.samples} "
+          f"concurrency={args.concurrency} budget={args.budget_ms:.0f}ms")
+    print(f"{'cost':>10} {'p50(ms)':>9} {'p95(ms)':>9} {'max(ms)':>9} {'login/s':>9}")
+
+    best = None
+    for cost in costs:
+        r = bench(args.method, cost, args.samples, args.concurrency)
+        mark = "✅" if r["p95"] <= args.budget_ms else "❌"
+        print(f"{r['cost']:>10} {r['p50']:>9.1f} {r['p95']:>9.1f} {r['max']:>9.1f} "
+              f"{r['throughput']:>9.1f} {mark}")
+        if r["p95"] <= args.budget_ms:
+            best = r
+
+    if best:
+        env = "PASSWORD_SCRYPT_N" if args.method == "scrypt" else "PASSWORD_PBKDF2_ITERATIONS"
+        print(f"🎯 추천: PASSWORD_HASH_METHOD={args.method} {env}={best['cost']} "
+              f"(p95 {best['p95']:.1f}ms)")
+    else:
+        print("⚠️ 예산 안에 들어오는 cost 가 없습니다. --budget-ms 또는 --concurrency 를 조정하세요.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+bench_startup.py
+
+✅ 하는 일
+- 워커 1개가 앱을 띄우는 시간(import run → create_app)과 그동안 실행한 SQL 문 수를 측정
+  · boot    : BOOT_ON_STARTUP=1 (예전처럼 워커마다 create_all + master commit + forms 복사)
+  · import  : BOOT_ON_STARTUP=0 (gunicorn.conf.py / flask init 으로 부팅을 따로 한 뒤 워커)
+- 매 실행을 새 프로세스로 돌림 (app/profiling/runner.py, 모듈 캐시 영향 없음), 중앙값 비교
+- 임시 STORAGE 가 아니라 현재 설정 DB 를 사용하므로 로컬에서만 실행
+
+사용 예
+    python scripts/bench_startup.py
+    python scripts/bench_startup.py --runs 10 --max-import-sql 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from app.profiling.runner import run_child  # noqa: E402
+
+CHILD = r"""
+import time
+
+t0 = time.perf_counter()
+import run  # noqa: F401  (run.py → create_app())
+elapsed = time.perf_counter() - t0
+
+writes = [s for s in statements if s.lstrip().split(None, 1)[0].upper() in ("INSERT", "UPDATE", "DELETE", "CREATE")]
+emit({"ms": elapsed * 1000, "sql": len(statements), "writes": len(writes)})
+"""
+
+
+def measure(boot: bool) -> dict:
+    # 임시 DB 가 아니라 현재 설정 DB (워커가 실제로 여는 DB)
+    return run_child(CHILD, temp_db=False, env={"BOOT_ON_STARTUP": "1" if boot else "0"})
+
+
+def main():
+    ap = argparse.ArgumentParser(description="워커 시작 시간 측정 (boot vs import-only)")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--max-import-sql", type=int, default=0,
+                    help="import-only 모드에서 허용할 SQL 문 수 (넘으면 exit 1)")
+    args = ap.parse_args()
+
+    # 첫 실행은 DB/forms 를 만들기 위한 준비 (측정 제외)
+    measure(boot=True)
+
+    results = {}
+    for mode, boot in (("boot", True), ("import", False)):
+        runs = [measure(boot) for _ in range(args.runs)]
+        results[mode] = {
+            "median_ms": statistics.median(r["ms"] for r in runs),
+            "sql": max(r["sql"] for r in runs),
+            "writes": max(r["writes"] for r in runs),
+        }
+        r = results[mode]
+        print(f"{mode:>7}: median {r['median_ms']:7.1f} ms | SQL {r['sql']:3d} (쓰기 {r['writes']})")
+
+    ok = results["import"]["sql"] <= args.max_import_sql
+    print("✅ import-only 워커 시작 OK" if ok else "❌ import-only 워커가 DB 에 접근함")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
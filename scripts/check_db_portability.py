@@ -0,0 +1,193 @@
+"""
+check_db_portability.py
+
+✅ 하는 일
+- 같은 앱을 SQLite 와 PostgreSQL 에 각각 띄워서 동작이 같은지 확인
+  1) create_app() (db.create_all + master 생성)
+  2) scripts/migrate_employment_and_vacation_forms.py 2번 실행 (두 번째는 변경 없이 통과해야 함)
+  3) 샘플 직원/일정 생성 후 master 로 주요 화면/API 호출 → 5xx 없어야 함
+     (캘린더/일정 조회, 승인, 대체연차 일괄 부여/이력, 생일자, 휴가계 현황 등)
+  4) 마지막에 db.drop_all() 로 정리
+
+⚠️ 빈 테스트용 DB 에만 실행 (테이블이 이미 있으면 --force 없이는 건너뜀)
+
+사용 예
+    python scripts/check_db_portability.py                       # 임시 SQLite 만
+    python scripts/check_db_portability.py --url postgresql://postgres@localhost/gaja_check
+    TEST_POSTGRES_URL=postgresql://... python scripts/check_db_portability.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import create_engine, inspect  # noqa: E402
+
+os.environ.setdefault("HOLIDAY_PREFETCH", "0")
+
+DEPTS = ["수술실", "외래", "병동"]
+TYPES = ["연차", "반차(전)", "병가", "탄력근무", "근무자", "일정"]
+
+
+def _load_migration():
+    path = os.path.join(ROOT, "scripts", "migrate_employment_and_vacation_forms.py")
+    spec = importlib.util.spec_from_file_location("migrate_employment_and_vacation_forms", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _seed(db):
+    from app.models import User, Vacation
+
+    users = []
+    for i in range(12):
+        u = User(
+            username=f"port_user_{i}",
+            name=f"직원{i}",
+            first_name=f"원{i}",
+            department=DEPTS[i % len(DEPTS)],
+            is_admin=(i % 5 == 0),
+            join_date=f"20{10 + i:02d}-03-0{1 + i % 9}",
+            birthday=f"1990-{1 + i % 12:02d}-{1 + i:02d}",
+        )
+        u.set_password("pw")
+        db.session.add(u)
+        users.append(u)
+    db.session.flush()
+
+    today = date.today()
+    for i in range(60):
+        owner = users[i % len(users)]
+        start = today + timedelta(days=i - 30)
+        db.session.add(Vacation(
+            user_id=owner.id,
+            target_user_id=owner.id if i % 3 else None,
+            name=owner.first_name,
+            department=owner.department if i % 4 else None,
+            start_date=start,
+            end_date=start + timedelta(days=i % 3),
+            type=TYPES[i % len(TYPES)],
+            approved=bool(i % 2),
+        ))
+    db.session.commit()
+    return users
+
+
+def _clear_caches():
+    """프로세스 메모리 캐시 비우기 (DB 를 바꿔가며 확인하므로 이전 DB 결과가 남지 않게)"""
+    from app.altleave.routes import clear_roster_cache
+    from app.birthday.utils import clear_upcoming_index
+    from app.user_cache import invalidate_user
+    from app.vacation_form.status import clear_status_cache
+
+    invalidate_user()
+    clear_roster_cache()
+    clear_upcoming_index()
+    clear_status_cache()
+
+
+def check(url: str, force: bool = False) -> bool:
+    from sqlalchemy.engine import make_url
+
+    label = make_url(url).render_as_string(hide_password=True)
+    print(f"\n==================== {label}")
+
+    probe = create_engine(url)
+    try:
+        existing = inspect(probe).get_table_names()
+    finally:
+        probe.dispose()
+    if existing and not force:
+        print(f"⚠️ 테이블이 이미 있음 ({len(existing)}개) → 건너뜀 (--force 로 강제)")
+        return False
+
+    os.environ["DATABASE_URL"] = url
+
+    from app import create_app, db
+    from app.models import Vacation
+
+    app = create_app()
+    failures = []
+
+    with app.app_context():
+        print("🔎 dialect:", db.engine.dialect.name, "| pool:", type(db.engine.pool).__name__)
+        _clear_caches()
+        try:
+            migration = _load_migration()
+            migration.main()
+            migration.main()
+
+            users = _seed(db)
+            pending = Vacation.query.filter(Vacation.approved.is_(False), Vacation.type != "탄력근무").first()
+
+            client = app.test_client()
+            with client.session_transaction() as s:
+                s["_user_id"] = "1"   # master
+
+            today = date.today()
+            calls = [
+                ("GET", f"/calendar/events?dept={DEPTS[0]}&start={today.replace(day=1)}&end={today + timedelta(days=40)}", None),
+                ("GET", "/calendar/events", None),
+                ("GET", "/events", None),
+                ("GET", f"/calendar/month_lock/status?dept={DEPTS[0]}&year={today.year}&month={today.month}", None),
+                ("GET", "/employee/list", None),
+                ("POST", f"/vacation/approve/{pending.id}", None),
+                ("POST", "/altleave/bulk", {"user_ids": [u.id for u in users[:5]], "add_days": 1,
+                                            "apply_date": today.isoformat(), "reason": "check"}),
+                ("POST", "/altleave/bulk", {"departments": DEPTS[:2], "add_days": 0.5,
+                                            "apply_date": today.isoformat(), "reason": "check"}),
+                ("GET", "/altleave/", None),
+                ("GET", "/altleave/?tab=history", None),
+                ("GET", "/birthday/report", None),
+                ("GET", f"/birthday/api/payouts?year={today.year}", None),
+                ("GET", "/birthday/api/upcoming?days=60", None),
+                ("GET", "/vacation_form/status", None),
+                ("GET", "/myinfo/", None),
+            ]
+            for method, path, body in calls:
+                resp = client.open(path, method=method, json=body)
+                ok = resp.status_code < 500
+                print(("✅" if ok else "❌"), method, path.split("?")[0], resp.status_code)
+                if not ok:
+                    failures.append(path)
+        except Exception as e:
+            db.session.rollback()
+            print("❌ 오류:", repr(e))
+            failures.append(repr(e))
+        finally:
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    print("✅ OK" if not failures else f"❌ FAILED ({len(failures)})")
+    return not failures
+
+
+def main():
+    ap = argparse.ArgumentParser(description="SQLite / PostgreSQL 호환성 확인")
+    ap.add_argument("--url", action="append", default=[], help="확인할 DB URL (여러 번 지정 가능)")
+    ap.add_argument("--no-sqlite", action="store_true", help="임시 SQLite 확인 생략")
+    ap.add_argument("--force", action="store_true", help="테이블이 있어도 실행 (끝나면 drop_all!)")
+    args = ap.parse_args()
+
+    urls = list(args.url)
+    if os.environ.get("TEST_POSTGRES_URL"):
+        urls.append(os.environ["TEST_POSTGRES_URL"])
+    if not args.no_sqlite:
+        urls.insert(0, "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="portability_"), "check.db"))
+
+    results = [check(url, args.force) for url in urls]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
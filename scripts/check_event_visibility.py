@@ -0,0 +1,240 @@
+"""
+check_event_visibility.py
+
+✅ 하는 일
+- 일정 노출 규칙 SQL 빌더(app/events/visibility.py)가 예전 캘린더 Python 필터와
+  "완전히 같은 일정"을 돌려주는지 생성 데이터로 비교 (parity check)
+- 조회 1번에 실행되는 SQL 문 수가 MAX_STATEMENTS 이하인지 확인
+
+- 설정된 DB 가 아니라 임시 SQLite DB 에서 실행 (BOOT_ON_STARTUP=1 로 빈 DB 생성, 공휴일 prefetch 끔)
+  → 실제 DB 에 create_all/스키마 갱신/쓰기 트랜잭션 없음, 끝나면 임시 폴더 삭제
+
+사용 예
+    python scripts/check_event_visibility.py
+    python scripts/check_event_visibility.py --users 40 --events 2000 --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event  # noqa: E402
+
+from app import create_app, db  # noqa: E402
+from app.models import User, Vacation  # noqa: E402
+from app.events.visibility import resolve_selected_dept, visible_events_query  # noqa: E402
+
+MAX_STATEMENTS = 1
+
+DEPTS = ["수술실", "외래", "병동", "의료진", None, ""]
+TYPES = ["연차", "반차(전)", "반차(후)", "반반차", "병가", "탄력근무", "근무자", "토연차", "일정", None]
+
+
+# ---------------------------------------------------------------
+# 기준(예전) 구현: calendar_page.routes.get_events 의 Python 필터 그대로
+# ---------------------------------------------------------------
+def legacy_visible(cu, selected_dept, my_only, all_events, users_by_id):
+    def get_user(uid):
+        return users_by_id.get(uid)
+
+    def _is_mine_event(ev):
+        current_names = {
+            (cu.first_name or "").strip(),
+            (cu.name or "").strip(),
+            (cu.username or "").strip(),
+        }
+        return (
+            ev.target_user_id == cu.id
+            or (ev.target_user_id in (None, 0) and ev.user_id == cu.id)
+            or ((ev.name or "").strip() in current_names)
+        )
+
+    filtered = []
+    for e in all_events:
+        if e.type == "탄력근무":
+            if cu.is_superadmin:
+                continue
+            flex_dept = (e.department or "").strip()
+            if not flex_dept and e.target_user_id:
+                tu = get_user(e.target_user_id)
+                flex_dept = (tu.department if tu else "") or ""
+            flex_dept = (flex_dept or "").strip()
+            if (selected_dept or "").strip() != (cu.department or "").strip():
+                continue
+            if cu.is_admin:
+                if flex_dept == (cu.department or "").strip():
+                    filtered.append(e)
+                continue
+            current_names = {
+                (cu.first_name or "").strip(),
+                (cu.name or "").strip(),
+                (cu.username or "").strip(),
+            }
+            if (
+                e.target_user_id == cu.id
+                or e.user_id == cu.id
+                or ((e.name or "").strip() in current_names)
+            ):
+                filtered.append(e)
+            continue
+
+        owner_user = None
+        if e.target_user_id:
+            owner_user = get_user(e.target_user_id)
+        elif e.user_id:
+            owner_user = get_user(e.user_id)
+        event_dept = (e.department or (owner_user.department if owner_user else "") or "").strip()
+        if not event_dept:
+            continue
+        if cu.is_superadmin:
+            if selected_dept and event_dept != selected_dept:
+                continue
+        else:
+            if event_dept != selected_dept:
+                continue
+        if (not cu.is_admin) and (not cu.is_superadmin):
+            if (e.approved is False) and (e.type != "근무자") and (not _is_mine_event(e)):
+                continue
+        filtered.append(e)
+
+    if my_only:
+        original, filtered = filtered, []
+        current_names = {cu.first_name, cu.name, cu.username}
+        for e in original:
+            if e.type == "근무자":
+                if e.name in current_names:
+                    filtered.append(e)
+                continue
+            if (
+                e.target_user_id == cu.id
+                or (e.target_user_id in (None, 0) and e.user_id == cu.id)
+                or (e.name in current_names)
+            ):
+                filtered.append(e)
+
+    return {e.id for e in filtered}
+
+
+# ---------------------------------------------------------------
+# 데이터 생성
+# ---------------------------------------------------------------
+def seed(rng, n_users, n_events):
+    users = []
+    for i in range(n_users):
+        first = rng.choice([f"길동{i}", None, " 민수 ", ""])
+        u = User(
+            username=f"vis_user_{i}",
+            password="x",
+            first_name=first,
+            name=rng.choice([f"홍길동{i}", f"김민수{i}", None]),
+            department=rng.choice(DEPTS[:4] + [None]),
+            is_admin=rng.random() < 0.3,
+            is_superadmin=rng.random() < 0.1,
+        )
+        db.session.add(u)
+        users.append(u)
+    db.session.flush()
+
+    ids = [u.id for u in users] + [0, None, 999999]
+    names = [u.first_name for u in users] + [u.name for u in users] + [u.username for u in users]
+    names += [None, "", "  ", "외부인"]
+
+    base = date(2026, 1, 1)
+    for _ in range(n_events):
+        start = base + timedelta(days=rng.randrange(365))
+        db.session.add(Vacation(
+            user_id=rng.choice(ids),
+            target_user_id=rng.choice(ids),
+            name=rng.choice(names),
+            department=rng.choice(DEPTS + [" 외래 "]),
+            start_date=start,
+            end_date=start + timedelta(days=rng.randrange(4)),
+            type=rng.choice(TYPES),
+            approved=rng.choice([True, False, None]),
+        ))
+    db.session.flush()
+    return users
+
+
+def run_checks(app, rng, args) -> bool:
+    with app.app_context():
+        statements = []
+
+        def _count(conn, cursor, statement, *a):
+            statements.append(statement)
+
+        try:
+            users = seed(rng, args.users, args.events)
+
+            all_events = Vacation.query.all()
+            users_by_id = {u.id: u for u in User.query.all()}
+
+            cases = mismatches = 0
+            worst = 0
+            event.listen(db.engine, "before_cursor_execute", _count)
+            try:
+                for u in users:
+                    viewer = SimpleNamespace(
+                        id=u.id, username=u.username, first_name=u.first_name, name=u.name,
+                        department=u.department, is_admin=u.is_admin, is_superadmin=u.is_superadmin,
+                    )
+                    for requested in DEPTS[:4] + [None]:
+                        selected = resolve_selected_dept(viewer, requested)
+                        for my_only in (False, True):
+                            expected = legacy_visible(viewer, selected, my_only, all_events, users_by_id)
+
+                            statements.clear()
+                            got = {e.id for e in visible_events_query(viewer, selected, my_only).all()}
+                            worst = max(worst, len(statements))
+
+                            cases += 1
+                            if got != expected:
+                                mismatches += 1
+                                if mismatches <= 5:
+                                    print(f"❌ viewer={u.username} dept={selected!r} my={my_only} "
+                                          f"missing={sorted(expected - got)[:10]} extra={sorted(got - expected)[:10]}")
+            finally:
+                event.remove(db.engine, "before_cursor_execute", _count)
+
+            print(f"🔎 cases={cases} events={len(all_events)} mismatches={mismatches} "
+                  f"max_sql_per_query={worst} (budget {MAX_STATEMENTS})")
+            ok = mismatches == 0 and worst <= MAX_STATEMENTS
+            print("✅ parity OK" if ok else "❌ parity FAILED")
+        finally:
+            db.session.rollback()
+
+    return ok
+
+
+def main():
+    ap = argparse.ArgumentParser(description="일정 노출 규칙 SQL 빌더 parity check")
+    ap.add_argument("--users", type=int, default=25)
+    ap.add_argument("--events", type=int, default=1500)
+    ap.add_argument("--seed", type=int, default=20260101)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="event_visibility_") as tmp:
+        os.environ.update(
+            DATABASE_URL="sqlite:///" + os.path.join(tmp, "visibility.db"),
+            BOOT_ON_STARTUP="1",
+            HOLIDAY_PREFETCH="0",
+        )
+        app = create_app()
+        ok = run_checks(app, rng, args)
+        with app.app_context():
+            db.engine.dispose()
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+check_holiday_fetch.py
+
+✅ 하는 일
+- 로컬 스텁 HTTP 서버(http.server)를 띄우고 HOLIDAY_API_URL 을 그쪽으로 돌려서
+  app/calendar_page/holidays.py 의 API 조회 경로를 확인 (실제 공공데이터포털 호출 없음)
+  1) single-flight : 여러 프로세스 × 여러 스레드가 같은 연도를 동시에 요청해도 API 호출은 1번
+                     (모든 요청이 같은 결과를 받음)
+  2) 원자적 기록   : 조회 중에 캐시 파일을 계속 읽어도 항상 완전한 JSON,
+                     쓰기 도중 실패하면 기존 파일 그대로 + 임시파일 남지 않음
+  3) fallback 만료 : API 가 빈 결과면 고정 양력 공휴일 + expires_at,
+                     TTL 안에서는 다시 호출하지 않고 TTL 이 지나면 다시 호출
+- 오프라인 계산(lunar.py) 지원 범위 밖 연도(1990/1991)로 API 경로를 탐
+- 실패 시 exit 1
+
+사용 예
+    python scripts/check_holiday_fetch.py
+    python scripts/check_holiday_fetch.py --procs 6 --threads 12
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+API_YEAR = 1990        # 정상 응답
+EMPTY_YEAR = 1991      # 빈 응답 → fallback
+STUB_DELAY = 0.3       # 응답 지연 (동시 요청이 겹치도록)
+FALLBACK_TTL = 1
+
+
+# =====================================
+# 스텁 API 서버
+# =====================================
+class StubHandler(BaseHTTPRequestHandler):
+    calls = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        year = int(parse_qs(urlparse(self.path).query)["solYear"][0])
+        with self.lock:
+            self.calls[year] += 1
+        time.sleep(STUB_DELAY)
+
+        items = [] if year == EMPTY_YEAR else [
+            {"locdate": int(f"{year}0101"), "dateName": "1월1일", "isHoliday": "Y"},
+            {"locdate": int(f"{year}0301"), "dateName": "삼일절", "isHoliday": "Y"},
+            {"locdate": int(f"{year}1003"), "dateName": "개천절", "isHoliday": "Y"},
+        ]
+        body = {"response": {"body": {"items": {"item": items} if items else ""}}}
+        raw = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+# =====================================
+# 워커 프로세스 (gunicorn 워커 흉내 - 프로세스마다 create_app)
+# =====================================
+def _make_app(cache_dir: str):
+    """create_app + 공휴일 캐시 폴더를 임시 폴더로 (STORAGE_ROOT 는 환경변수로 바뀌지 않음)"""
+    from app import create_app
+
+    app = create_app()
+    app.config["HOLIDAY_CACHE_DIR"] = cache_dir
+    return app
+
+
+def _worker(year: int, threads: int, start_at: float, cache_dir: str, out):
+    from app.calendar_page import holidays
+
+    app = _make_app(cache_dir)
+    results = []
+
+    def _call():
+        with app.app_context():
+            results.append(holidays.get_year(year)["etag"])
+
+    pool = [threading.Thread(target=_call) for _ in range(threads)]
+    time.sleep(max(0.0, start_at - time.time()))
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    out.put(results)
+
+
+def check_single_flight(procs: int, threads: int, cache_dir: str) -> list:
+    problems = []
+    cache_path = os.path.join(cache_dir, f"{API_YEAR}.json")
+    torn_reads = []
+    stop = threading.Event()
+
+    # 조회 중 캐시 파일을 계속 읽음 → 반쯤 쓰인 파일이 보이면 안 됨
+    def _reader():
+        while not stop.is_set():
+            if os.path.exists(cache_path):
+                try:
+                    with open(cache_path, encoding="utf-8") as f:
+                        json.load(f)
+                except ValueError as e:
+                    torn_reads.append(str(e))
+            time.sleep(0.001)
+
+    reader = threading.Thread(target=_reader, daemon=True)
+    reader.start()
+
+    ctx = multiprocessing.get_context("spawn")
+    out = ctx.Queue()
+    start_at = time.time() + 3.0   # 모든 프로세스가 앱을 띄운 뒤 동시에 시작
+    workers = [ctx.Process(target=_worker, args=(API_YEAR, threads, start_at, cache_dir, out)) for _ in range(procs)]
+    for p in workers:
+        p.start()
+    etags = []
+    for _ in workers:
+        etags.extend(out.get(timeout=60))
+    for p in workers:
+        p.join()
+    stop.set()
+    reader.join()
+
+    calls = StubHandler.calls[API_YEAR]
+    print(f"  {procs} 프로세스 × {threads} 스레드 → API 호출 {calls}번, 응답 {len(etags)}건, etag {len(set(etags))}종")
+    if calls != 1:
+        problems.append(f"single-flight: API 호출 {calls}번 (1번이어야 함)")
+    if len(etags) != procs * threads or len(set(etags)) != 1:
+        problems.append("single-flight: 요청마다 결과가 다름")
+    if torn_reads:
+        problems.append(f"원자적 기록: 불완전한 캐시 파일을 읽음 ({torn_reads[0]})")
+    return problems
+
+
+def check_atomic_write(cache_dir: str) -> list:
+    from app.calendar_page import holidays
+
+    problems = []
+    path = os.path.join(cache_dir, f"{API_YEAR}.json")
+    with open(path, "rb") as f:
+        before = f.read()
+
+    class Boom(Exception):
+        pass
+
+    real_dump = json.dump
+
+    def _broken_dump(obj, fp, **kwargs):
+        fp.write('{"holidays": [')   # 쓰다가 실패
+        raise Boom()
+
+    json.dump = _broken_dump
+    try:
+        holidays._write_cache_file(path, {"holidays": [], "holiday_names": {}})
+        problems.append("원자적 기록: 쓰기 실패가 전달되지 않음")
+    except Boom:
+        pass
+    finally:
+        json.dump = real_dump
+
+    with open(path, "rb") as f:
+        after = f.read()
+    leftovers = [n for n in os.listdir(cache_dir) if n.endswith(".tmp")]
+    print(f"  쓰기 도중 실패 → 기존 파일 {'유지' if after == before else '손상'}, 임시파일 {len(leftovers)}개")
+    if after != before:
+        problems.append("원자적 기록: 쓰기 실패로 기존 캐시 파일이 바뀜")
+    if leftovers:
+        problems.append(f"원자적 기록: 임시파일이 남음 {leftovers}")
+    return problems
+
+
+def check_fallback_expiry(cache_dir: str) -> list:
+    from app.calendar_page import holidays
+
+    problems = []
+    app = _make_app(cache_dir)
+    with app.app_context():
+        entry = holidays.get_year(EMPTY_YEAR)
+        first_calls = StubHandler.calls[EMPTY_YEAR]
+        holidays.get_year(EMPTY_YEAR)
+        cached_calls = StubHandler.calls[EMPTY_YEAR]
+        time.sleep(FALLBACK_TTL + 0.2)
+        holidays.get_year(EMPTY_YEAR)
+        expired_calls = StubHandler.calls[EMPTY_YEAR]
+
+    print(f"  fallback: expires_at={'있음' if entry.get('expires_at') else '없음'}, "
+          f"API 호출 {first_calls} → TTL 안 {cached_calls} → TTL 후 {expired_calls}")
+    if not entry.get("expires_at"):
+        problems.append("fallback: expires_at 없음 (영구 캐시됨)")
+    if f"{EMPTY_YEAR}-01-01" not in entry["data"]["holidays"]:
+        problems.append("fallback: 고정 양력 공휴일이 아님")
+    if not (first_calls == cached_calls == 1 and expired_calls == 2):
+        problems.append("fallback: TTL 안에서는 재호출 없이, TTL 후에는 1번 재호출되어야 함")
+    return problems
+
+
+def main():
+    ap = argparse.ArgumentParser(description="공휴일 API single-flight / 원자적 캐시 / fallback 만료 확인")
+    ap.add_argument("--procs", type=int, default=4, help="동시에 띄울 워커 프로세스 수")
+    ap.add_argument("--threads", type=int, default=8, help="프로세스별 동시 요청 스레드 수")
+    args = ap.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    cache_dir = tempfile.mkdtemp(prefix="holiday_check_")
+    os.environ.update(
+        HOLIDAY_API_URL=f"http://127.0.0.1:{server.server_port}/holidays",
+        HOLIDAY_API_KEY="stub",
+        HOLIDAY_API_VERIFY="0",
+        HOLIDAY_PREFETCH="0",
+        HOLIDAY_FALLBACK_TTL=str(FALLBACK_TTL),
+        BOOT_ON_STARTUP="0",
+        METRICS_ENABLED="0",
+        PROFILING_ENABLED="0",
+    )
+    try:
+        problems = []
+        print("🔎 single-flight / 원자적 기록")
+        problems += check_single_flight(args.procs, args.threads, cache_dir)
+        problems += check_atomic_write(cache_dir)
+        print("🔎 fallback 만료")
+        problems += check_fallback_expiry(cache_dir)
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    for p in problems:
+        print("❌", p)
+    print("✅ 공휴일 조회 OK" if not problems else f"❌ 실패 {len(problems)}건")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
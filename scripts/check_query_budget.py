@@ -0,0 +1,143 @@
+"""
+check_query_budget.py
+
+✅ 하는 일
+- 작은 규모 / 큰 규모 합성 데이터(app/seed.py)로 임시 SQLite DB 를 각각 만들고
+  모든 GET 라우트를 Flask test client 로 호출해서 요청 1건당 SQL 문 수를 셈
+- 아래 경우 exit 1 (SQL 문 수 회귀 방지)
+  · endpoint 별 예산(BUDGETS, 없으면 DEFAULT_BUDGET)을 넘음
+  · 데이터가 늘었을 때 SQL 문 수도 같이 늘어남 (N+1 → 직원/일정마다 조회)
+  · 2xx/3xx 가 아닌 응답 (4xx 포함 - 호출 경로가 잘못되면 SQL 0개로 통과해 버림)
+- 호출 목록은 app/profiling/cases.py (flask audit-queries 와 공용)
+  · URL 인자가 있는 라우트는 ROUTE_CASES 에 호출 경로가 있어야 측정 (없으면 "건너뜀" 으로 출력)
+- POST 라우트(데이터 변경)는 대상 아님
+- 규모마다 새 프로세스 + 임시 DB (app/profiling/runner.py, 끝나면 삭제)
+
+사용 예
+    python scripts/check_query_budget.py
+    python scripts/check_query_budget.py --small 3x20 --large 10x300 -v
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from app.profiling.runner import run_child  # noqa: E402
+
+# 예산 없는 라우트 기본값
+DEFAULT_BUDGET = 5
+
+# endpoint → 요청 1건당 최대 SQL 문 수
+BUDGETS = {
+    "calendar.get_events": 5,
+    "events.get_events": 5,
+    "calendar.pending_requests": 3,
+    "employee.employee_list": 6,
+    "employee.edit_employee": 4,
+    "myinfo.myinfo": 5,
+    "schedule.export_schedule": 6,
+    "altleave.grant_alt_leave": 6,
+}
+
+CHILD = r"""
+departments, users, years = (int(x) for x in sys.argv[1:4])
+
+import os
+import shutil
+
+from openpyxl import Workbook
+
+import run  # noqa: E402
+from app.profiling.cases import resolve_requests
+from app.seed import seed_synthetic
+
+app = run.app
+
+# 폼/출력 폴더는 임시 폴더로: 저장소 forms/ 복사 + 휴가계 기준 폼(저장소에 없음)은 빈 엑셀
+tmp = os.environ["PROFILING_TMP"]
+app.config.update(
+    FORMS_FOLDER=os.path.join(tmp, "forms"),
+    EXCEL_OUTPUT=os.path.join(tmp, "excel_output"),
+    SIGNATURES_FOLDER=os.path.join(tmp, "signatures"),
+)
+shutil.copytree(os.path.join(os.getcwd(), "forms"), app.config["FORMS_FOLDER"])
+Workbook().save(os.path.join(app.config["FORMS_FOLDER"], app.config["VACATION_FORM_TEMPLATE"]))
+
+with app.app_context():
+    seed_synthetic(departments=departments, users=users, years=years)
+    requests = resolve_requests(app)
+
+results = []
+for endpoint, who, user_id, path in requests:
+    if path is None:
+        results.append({"endpoint": endpoint, "who": who, "path": None})
+        continue
+    client = app.test_client()
+    with client.session_transaction() as s:
+        s["_user_id"] = str(user_id)
+    client.get(path)  # 첫 호출(메모리 캐시 채우기) 제외
+    statements.clear()
+    resp = client.get(path)
+    results.append({"endpoint": endpoint, "who": who, "path": path, "status": resp.status_code,
+                    "sql": len(statements), "statements": list(statements)})
+
+emit(results)
+"""
+
+
+def run_scale(scale: str, years: int) -> list:
+    departments, users = (int(x) for x in scale.lower().split("x"))
+    try:
+        return run_child(CHILD, departments, users, years, env={"HOLIDAY_API_KEY": ""})
+    except RuntimeError as e:
+        sys.stderr.write(str(e))
+        raise SystemExit(f"❌ {scale} 측정 실패")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="endpoint 별 SQL 문 수 예산 확인")
+    ap.add_argument("--small", default="3x20", help="작은 규모 (부서수x직원수)")
+    ap.add_argument("--large", default="8x160", help="큰 규모 (부서수x직원수)")
+    ap.add_argument("--years", type=int, default=1, help="올해 포함 몇 년치 일정")
+    ap.add_argument("-v", "--verbose", action="store_true", help="실패한 요청의 SQL 문 출력")
+    args = ap.parse_args()
+
+    small = run_scale(args.small, args.years)
+    large = run_scale(args.large, args.years)
+
+    failures = 0
+    print(f"  {'endpoint':<34}{'who':<8}{args.small:>8}{args.large:>8}{'budget':>8}  path")
+    for s, l in zip(small, large):
+        if l["path"] is None:
+            print(f"  {l['endpoint']:<34}{'-':<8}{'건너뜀 (URL 인자 - ROUTE_CASES 에 경로 추가 필요)':>24}")
+            continue
+        budget = BUDGETS.get(l["endpoint"], DEFAULT_BUDGET)
+        problems = []
+        bad = [r["status"] for r in (s, l) if not 200 <= r["status"] < 400]
+        if bad:
+            # 4xx 도 실패 (잘못된 호출 경로는 SQL 0개로 통과해 버림)
+            problems.append(f"HTTP {bad[0]}")
+        if max(s["sql"], l["sql"]) > budget:
+            problems.append("예산 초과")
+        if l["sql"] > s["sql"]:
+            problems.append("데이터에 비례해 증가")
+        mark = "❌" if problems else "✅"
+        print(f"{mark} {l['endpoint']:<33}{l['who']:<8}{s['sql']:>8}{l['sql']:>8}{budget:>8}  "
+              f"{l['path'][:60]}" + (f"  ← {', '.join(problems)}" if problems else ""))
+        if problems:
+            failures += 1
+            if args.verbose:
+                for stmt in l["statements"]:
+                    print("      ", " ".join(stmt.split())[:160])
+
+    print("\n✅ SQL 예산 OK" if not failures else f"\n❌ SQL 예산 실패 {failures}건")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
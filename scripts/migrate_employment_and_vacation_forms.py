@@ -17,6 +17,23 @@ migrate_employment_and_vacation_forms.py
 
 3) (선택) join_date -> join_date_date 백필(가능한 값만)
 
+4) dept_month_exports.content_hash 컬럼 추가 (휴가계 일괄 생성 변경 감지용)
+
+5) user.birth_month / birth_day 컬럼 + 인덱스 추가, birthday 문자열에서 백필 (생일자 조회용)
+
+6) alt_leave_log (grant_date, id) 인덱스 추가 (대체연차 이력 페이지용)
+   + alt_leave_grants (직원별 대체연차 부여 기록) 테이블은 2) db.create_all() 에서 생성
+   + alt_leave_log.grant_date 가 비어 있으면 적용일자로 채움 (PostgreSQL 은 NOT NULL 로 변경)
+   + 예전 alt_leave_log 이력 → alt_leave_grants 백필 (department_summary 의 부여 당시 부서/이름)
+
+7) alt_leave_log.department_summary → TEXT (PostgreSQL 은 길이 제한을 실제로 검사)
+
+✅ SQLite / PostgreSQL 공용
+- 테이블 이름은 dialect 규칙으로 quote ("user" 는 PostgreSQL 예약어)
+- BOOLEAN 기본값/값은 dialect 에 맞게 (SQLite 1 / PostgreSQL true)
+- 인덱스는 Model 정의(Index.create checkfirst)로 생성
+- DATABASE_URL 이 있으면 그 DB 에 적용
+
 ⚠️ 실행 전
 - app/models.py 에 위 컬럼/테이블(Model) 정의가 먼저 반영되어 있어야 합니다.
 """
@@ -26,11 +43,11 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import inspect, text as sql_text
+from sqlalchemy import Date, bindparam, inspect, true, text as sql_text
 
 try:
     from app import create_app, db
-    from app.models import User  # noqa: F401
+    from app.models import AltLeaveLog, User
 except Exception as e:
     raise SystemExit(f"❌ import 실패: {e}\n- scripts 폴더 위치가 프로젝트 루트인지 확인하세요.")
 
@@ -49,7 +66,7 @@ def _parse_join_date(s: Optional[str]):
 
 
 def add_column_if_missing(table: str, col: str, ddl: str):
-    insp = inspect(db.engine)
+    insp = inspect(db.session.connection())  # 같은 트랜잭션 (PostgreSQL 은 ALTER 잠금 때문에 별도 연결이면 대기)
     cols = [c["name"] for c in insp.get_columns(table)]
     if col in cols:
         print(f"✅ column exists: {table}.{col}")
@@ -60,49 +77,68 @@ def add_column_if_missing(table: str, col: str, ddl: str):
 
 
 def table_exists(table: str) -> bool:
-    insp = inspect(db.engine)
+    insp = inspect(db.session.connection())
     return table in insp.get_table_names()
 
 
+def quote(name: str) -> str:
+    """테이블/컬럼 이름 quote (user → "user")"""
+    return db.engine.dialect.identifier_preparer.quote(name)
+
+
+def sql_true() -> str:
+    """BOOLEAN true 리터럴 (SQLite: 1, PostgreSQL: true)"""
+    return str(true().compile(dialect=db.engine.dialect))
+
+
+def create_index_if_missing(model, name: str):
+    """Model 에 정의된 인덱스 생성 (이미 있으면 건너뜀)"""
+    index = next(ix for ix in model.__table__.indexes if ix.name == name)
+    index.create(db.engine, checkfirst=True)
+    print(f"✅ index: {name}")
+
+
 def main():
     app = create_app()
     with app.app_context():
         print("🔎 DB engine:", db.engine)
+        USER = quote("user")
 
         # 1) user 컬럼 추가
         add_column_if_missing(
             "user",
             "employment_status",
-            "ALTER TABLE user ADD COLUMN employment_status VARCHAR(10) NOT NULL DEFAULT '재직'",
+            f"ALTER TABLE {USER} ADD COLUMN employment_status VARCHAR(10) NOT NULL DEFAULT '재직'",
         )
         add_column_if_missing(
             "user",
             "status_changed_at",
-            "ALTER TABLE user ADD COLUMN status_changed_at DATE",
+            f"ALTER TABLE {USER} ADD COLUMN status_changed_at DATE",
         )
         add_column_if_missing(
             "user",
             "resign_date",
-            "ALTER TABLE user ADD COLUMN resign_date DATE",
+            f"ALTER TABLE {USER} ADD COLUMN resign_date DATE",
         )
         add_column_if_missing(
             "user",
             "is_vacation_form_target",
-            "ALTER TABLE user ADD COLUMN is_vacation_form_target BOOLEAN NOT NULL DEFAULT 1",
+            f"ALTER TABLE {USER} ADD COLUMN is_vacation_form_target BOOLEAN NOT NULL DEFAULT {sql_true()}",
         )
         add_column_if_missing(
             "user",
             "join_date_date",
-            "ALTER TABLE user ADD COLUMN join_date_date DATE",
+            f"ALTER TABLE {USER} ADD COLUMN join_date_date DATE",
         )
 
         # 기본값 보정(혹시 NULL로 남아있으면 채움)
         db.session.execute(sql_text(
-            "UPDATE user SET employment_status='재직' WHERE employment_status IS NULL OR employment_status=''"
-        ))
-        db.session.execute(sql_text(
-            "UPDATE user SET is_vacation_form_target=1 WHERE is_vacation_form_target IS NULL"
+            f"UPDATE {USER} SET employment_status='재직' WHERE employment_status IS NULL OR employment_status=''"
         ))
+        db.session.execute(
+            sql_text(f"UPDATE {USER} SET is_vacation_form_target = :t WHERE is_vacation_form_target IS NULL"),
+            {"t": True},
+        )
         db.session.commit()
         print("✅ defaults backfilled (employment_status / is_vacation_form_target)")
 
@@ -110,13 +146,22 @@ def main():
         db.create_all()
         print("✅ db.create_all() done")
 
-        for t in ["user_month_confirms", "dept_month_rosters", "dept_month_finals", "dept_month_exports"]:
+        for t in ["user_month_confirms", "dept_month_rosters", "dept_month_finals", "dept_month_exports",
+                  "alt_leave_grants"]:
             print(("✅" if table_exists(t) else "❌"), "table:", t)
 
+        # 2-1) 기존 dept_month_exports 에 content_hash 컬럼 추가
+        add_column_if_missing(
+            "dept_month_exports",
+            "content_hash",
+            "ALTER TABLE dept_month_exports ADD COLUMN content_hash VARCHAR(64)",
+        )
+        db.session.commit()
+
         # 3) join_date -> join_date_date 백필 (가능한 데이터만)
         try:
             users = db.session.execute(sql_text(
-                "SELECT id, join_date, join_date_date FROM user"
+                f"SELECT id, join_date, join_date_date FROM {USER}"
             )).mappings().all()
 
             filled = 0
@@ -127,8 +172,9 @@ def main():
                 if not jd:
                     continue
                 db.session.execute(
-                    sql_text("UPDATE user SET join_date_date = :d WHERE id = :id"),
-                    {"d": jd.isoformat(), "id": u["id"]},
+                    sql_text(f"UPDATE {USER} SET join_date_date = :d WHERE id = :id")
+                    .bindparams(bindparam("d", type_=Date)),
+                    {"d": jd, "id": u["id"]},
                 )
                 filled += 1
 
@@ -138,6 +184,67 @@ def main():
             db.session.rollback()
             print("⚠️ join_date_date backfill skipped due to error:", e)
 
+        # 5) birth_month / birth_day 컬럼 + 인덱스 + 백필
+        add_column_if_missing("user", "birth_month", f"ALTER TABLE {USER} ADD COLUMN birth_month INTEGER")
+        add_column_if_missing("user", "birth_day", f"ALTER TABLE {USER} ADD COLUMN birth_day INTEGER")
+        db.session.commit()
+        create_index_if_missing(User, "ix_user_birth_month_day")
+
+        try:
+            users = db.session.execute(sql_text(
+                f"SELECT id, birthday FROM {USER} WHERE birthday IS NOT NULL AND birth_month IS NULL"
+            )).mappings().all()
+
+            rows = []
+            for u in users:
+                try:
+                    bday = datetime.strptime(str(u["birthday"]).strip(), "%Y-%m-%d").date()
+                except ValueError:
+                    continue
+                rows.append({"m": bday.month, "d": bday.day, "id": u["id"]})
+
+            if rows:
+                db.session.execute(
+                    sql_text(f"UPDATE {USER} SET birth_month = :m, birth_day = :d WHERE id = :id"),
+                    rows,
+                )
+            db.session.commit()
+            print(f"✅ birth_month/birth_day backfilled: {len(rows)} rows")
+        except Exception as e:
+            db.session.rollback()
+            print("⚠️ birth_month/birth_day backfill skipped due to error:", e)
+
+        # 6) 대체연차 이력 keyset 인덱스
+        create_index_if_missing(AltLeaveLog, "ix_alt_leave_log_grant_date_id")
+
+        try:
+            from app.boot import backfill_alt_leave_log_grant_date
+
+            dated = backfill_alt_leave_log_grant_date()
+            db.session.commit()
+            print(f"✅ alt_leave_log.grant_date backfilled: {dated} rows")
+        except Exception as e:
+            db.session.rollback()
+            print("⚠️ alt_leave_log.grant_date backfill skipped due to error:", e)
+
+        try:
+            from app.boot import backfill_alt_leave_grants
+
+            granted = backfill_alt_leave_grants()
+            db.session.commit()
+            print(f"✅ alt_leave_grants backfilled: {granted} rows")
+        except Exception as e:
+            db.session.rollback()
+            print("⚠️ alt_leave_grants backfill skipped due to error:", e)
+
+        # 7) department_summary 길이 제한 해제 (SQLite 는 길이를 검사하지 않아 불필요)
+        if db.engine.dialect.name == "postgresql":
+            db.session.execute(sql_text(
+                "ALTER TABLE alt_leave_log ALTER COLUMN department_summary TYPE TEXT"
+            ))
+            db.session.commit()
+            print("✅ column type: alt_leave_log.department_summary TEXT")
+
         print("🎉 migration finished.")
 
 
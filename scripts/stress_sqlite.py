@@ -0,0 +1,162 @@
+"""
+stress_sqlite.py
+
+✅ 하는 일
+- 임시 SQLite DB 에 gunicorn 워커처럼 여러 프로세스로 동시에 읽기/쓰기를 걸어
+  "쓰기 처리량" 과 "database is locked" 오류 수를 측정
+- baseline(기본 설정: rollback journal) vs tuned(app/db_tuning.py 의 PRAGMA) 비교
+
+워크로드 (프로세스마다 반복)
+- 읽기 : 캘린더 조회처럼 기간 조회
+- 쓰기 : 승인처럼 "조회 후 UPDATE" + 월 잠금 upsert (한 트랜잭션)
+
+사용 예
+    python scripts/stress_sqlite.py
+    python scripts/stress_sqlite.py --workers 8 --seconds 10 --write-ratio 0.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from app.db_tuning import DEFAULTS, install_sqlite_tuning  # noqa: E402
+
+SCHEMA = [
+    "CREATE TABLE vacation (id INTEGER PRIMARY KEY, department TEXT, start_date TEXT, "
+    "end_date TEXT, approved INTEGER DEFAULT 0, memo TEXT)",
+    "CREATE INDEX ix_vacation_dept_start ON vacation (department, start_date)",
+    "CREATE TABLE month_locks (department TEXT, year INTEGER, month INTEGER, locked INTEGER, "
+    "locked_at REAL, PRIMARY KEY (department, year, month))",
+]
+DEPTS = ["수술실", "외래", "병동", "의료진"]
+ROWS = 5000
+
+
+def _engine(path: str, tuned: bool):
+    engine = create_engine(f"sqlite:///{path}")
+    if tuned:
+        install_sqlite_tuning(engine, DEFAULTS)
+    return engine
+
+
+def setup_db(path: str):
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        for stmt in SCHEMA:
+            conn.execute(text(stmt))
+        rng = random.Random(1)
+        conn.execute(
+            text("INSERT INTO vacation (department, start_date, end_date, approved) "
+                 "VALUES (:d, :s, :s, 0)"),
+            [{"d": rng.choice(DEPTS), "s": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"}
+             for _ in range(ROWS)],
+        )
+    engine.dispose()
+
+
+def worker(path, tuned, seconds, write_ratio, seed, out):
+    rng = random.Random(seed)
+    engine = _engine(path, tuned)
+    writes = reads = locked = 0
+    latencies = []
+    deadline = time.time() + seconds
+
+    while time.time() < deadline:
+        dept = rng.choice(DEPTS)
+        month = rng.randint(1, 12)
+        try:
+            if rng.random() < write_ratio:
+                t0 = time.perf_counter()
+                with engine.begin() as conn:
+                    vid = conn.execute(
+                        text("SELECT id FROM vacation WHERE department = :d AND approved = 0 LIMIT 1"),
+                        {"d": dept},
+                    ).scalar()
+                    if vid:
+                        conn.execute(text("UPDATE vacation SET approved = 1, memo = :m WHERE id = :id"),
+                                     {"m": f"w{seed}", "id": vid})
+                    conn.execute(
+                        text("INSERT INTO month_locks (department, year, month, locked, locked_at) "
+                             "VALUES (:d, 2026, :m, 1, :t) ON CONFLICT(department, year, month) "
+                             "DO UPDATE SET locked = 1 - locked, locked_at = :t"),
+                        {"d": dept, "m": month, "t": time.time()},
+                    )
+                latencies.append((time.perf_counter() - t0) * 1000)
+                writes += 1
+            else:
+                with engine.connect() as conn:
+                    conn.execute(
+                        text("SELECT count(*) FROM vacation WHERE department = :d "
+                             "AND start_date BETWEEN :a AND :b"),
+                        {"d": dept, "a": f"2026-{month:02d}-01", "b": f"2026-{month:02d}-31"},
+                    ).scalar()
+                reads += 1
+        except OperationalError as e:
+            if "locked" in str(e).lower() or "busy" in str(e).lower():
+                locked += 1
+            else:
+                raise
+
+    engine.dispose()
+    out.put({"writes": writes, "reads": reads, "locked": locked, "latencies": latencies})
+
+
+def run(mode: str, workers: int, seconds: float, write_ratio: float):
+    tmpdir = tempfile.mkdtemp(prefix="stress_sqlite_")
+    path = os.path.join(tmpdir, "stress.db")
+    setup_db(path)
+
+    out = mp.Queue()
+    procs = [
+        mp.Process(target=worker, args=(path, mode == "tuned", seconds, write_ratio, i, out))
+        for i in range(workers)
+    ]
+    t0 = time.time()
+    for p in procs:
+        p.start()
+    results = [out.get() for _ in procs]
+    for p in procs:
+        p.join()
+    wall = time.time() - t0
+
+    lat = [x for r in results for x in r["latencies"]]
+    writes = sum(r["writes"] for r in results)
+    return {
+        "mode": mode,
+        "writes_per_s": writes / wall,
+        "reads_per_s": sum(r["reads"] for r in results) / wall,
+        "locked": sum(r["locked"] for r in results),
+        "write_p95_ms": statistics.quantiles(lat, n=20)[-1] if len(lat) >= 20 else float("nan"),
+        "db": path,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="SQLite 동시 쓰기 처리량 / 잠금 오류 측정")
+    ap.add_argument("--workers", type=int, default=6, help="동시 프로세스 수 (gunicorn 워커 수)")
+    ap.add_argument("--seconds", type=float, default=5.0, help="모드별 실행 시간(초)")
+    ap.add_argument("--write-ratio", type=float, default=0.3, help="요청 중 쓰기 비율")
+    args = ap.parse_args()
+
+    print(f"🔎 workers={args.workers} seconds={args.seconds} write_ratio={args.write_ratio}")
+    print(f"{'mode':>9} {'writes/s':>9} {'reads/s':>9} {'locked':>7} {'write p95(ms)':>14}")
+    for mode in ("baseline", "tuned"):
+        r = run(mode, args.workers, args.seconds, args.write_ratio)
+        print(f"{r['mode']:>9} {r['writes_per_s']:>9.1f} {r['reads_per_s']:>9.1f} "
+              f"{r['locked']:>7} {r['write_p95_ms']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()